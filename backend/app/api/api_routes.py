@@ -1,38 +1,57 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
+import json
+from typing import Iterator
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..deps import get_current_session
-from ..models import AppSession
+from ..models import AppSession, DatasetImport
 from ..schemas import (
     DatasetInfo,
     DatasusExportRequest,
     DatasusExportResponse,
+    EvaluationRequest,
+    EvaluationResponse,
     ForecastRequest,
     ForecastResponse,
+    HierarchyForecastRequest,
+    HierarchyForecastResponse,
     SessionInfo,
 )
 from ..services.datasus_export import cleanup_export_output, run_datasus_export
+from ..services.arima_order_cache import build_series_lineage
 from ..services.datasus_availability import get_datasus_availability
-from ..services.prediction_engine import generate_forecast, get_available_model_options
+from ..services.forecast.canonical_series import CanonicalSeries
+from ..services.forecast_cache import build_forecast_cache_key, get_cached_forecast, store_cached_forecast
+from ..services.hierarchical_forecast import generate_hierarchical_forecast
+from ..services.model_evaluation import evaluate_models
+from ..services.prediction_engine import (
+    forecast_baseline,
+    forecast_series,
+    get_available_model_options,
+    normalize_forecast_parameters,
+)
 from ..services.runtime_status import get_runtime_status
 from ..services.session_storage import (
     forecast_to_detail,
+    get_dataset_content,
     get_dataset_record,
     get_forecast_record,
     list_session_datasets,
     list_session_exports,
     list_session_forecasts,
+    load_dataset_series,
     preview_dataset_record,
     resolve_dataset_state_query,
     save_datasus_import,
     save_forecast_record,
     session_counts,
-    temporary_dataset_path,
     touch_session_disease,
 )
 from ..ui_options import (
@@ -52,6 +71,14 @@ from ..ui_options import (
 router = APIRouter(prefix="/api", tags=["api"])
 
 
+@dataclass(frozen=True)
+class _PreparedForecast:
+    dataset_record: DatasetImport
+    request_payload: dict
+    dataset_series: CanonicalSeries
+    cache_key: str
+
+
 @router.get("/health")
 def health_check() -> dict:
     return {"status": "ok"}
@@ -158,7 +185,7 @@ def get_dataset_preview(
 ) -> dict:
     try:
         dataset_record = get_dataset_record(db, session_record.id, dataset_id)
-        return preview_dataset_record(dataset_record, limit=limit)
+        return preview_dataset_record(db, dataset_record, limit=limit)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -170,40 +197,213 @@ def predict(
     session_record: AppSession = Depends(get_current_session),
 ) -> ForecastResponse:
     try:
-        touch_session_disease(db, session_record, payload.disease_slug)
-        dataset_record = get_dataset_record(db, session_record.id, payload.dataset_id)
-        request_payload = payload.model_dump()
-        request_payload["state"] = resolve_dataset_state_query(dataset_record, payload.state)
-        if dataset_record.frequency != "monthly" and request_payload["mode"] == "monthly":
-            request_payload["mode"] = "auto"
-
-        with temporary_dataset_path(dataset_record) as dataset_path:
-            prediction_result = generate_forecast(
-                dataset_path=dataset_path,
-                state=request_payload["state"],
-                mode=request_payload["mode"],
-                model=payload.model,
+        prepared = _prepare_forecast(db, session_record, payload)
+        prediction_result = get_cached_forecast(db, prepared.cache_key)
+        if prediction_result is None:
+            prediction_result = _fit_and_cache_forecast(db, payload, prepared)
+        return _save_forecast(db, session_record, payload, prepared, prediction_result)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post("/predict/stream")
+def predict_stream(
+    payload: ForecastRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    session_record: AppSession = Depends(get_current_session),
+) -> StreamingResponse:
+    try:
+        prepared = _prepare_forecast(db, session_record, payload)
+        prediction_result = get_cached_forecast(db, prepared.cache_key)
+        baseline = None
+        if prediction_result is None:
+            baseline = forecast_baseline(
+                series=prepared.dataset_series.time_series(),
+                annual_series=prepared.dataset_series.annual_time_series(),
+                state_label=prepared.dataset_series.state_label,
+                source_frequency=prepared.dataset_series.source_frequency,
+                mode=prepared.request_payload["mode"],
                 forecast_years=payload.forecast_years,
                 forecast_periods=payload.forecast_periods,
-                confidence=payload.confidence,
-                seasonal=payload.seasonal,
             )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-        saved_forecast = save_forecast_record(
-            db=db,
-            session_record=session_record,
-            dataset_record=dataset_record,
-            disease_slug=payload.disease_slug,
-            request_payload=request_payload,
-            prediction_payload=prediction_result,
+    streaming_response = StreamingResponse(
+        _stream_forecast_events(session_record, payload, prepared, baseline, prediction_result),
+        media_type="application/x-ndjson",
+    )
+    # FastAPI only merges the injected response's headers into responses it builds itself, so the session cookie set
+    # by get_current_session is copied over here.
+    for cookie in response.headers.getlist("set-cookie"):
+        streaming_response.headers.append("set-cookie", cookie)
+    return streaming_response
+
+
+def _stream_forecast_events(
+    session_record: AppSession,
+    payload: ForecastRequest,
+    prepared: _PreparedForecast,
+    baseline: dict | None,
+    prediction_result: dict | None,
+) -> Iterator[str]:
+    # The request session is closed once the response starts streaming, so the fit is persisted on its own session.
+    if baseline is not None:
+        yield _ndjson_event("baseline", baseline)
+    try:
+        with SessionLocal() as db:
+            if prediction_result is None:
+                prediction_result = _fit_and_cache_forecast(db, payload, prepared)
+            response = _save_forecast(db, session_record, payload, prepared, prediction_result)
+        yield _ndjson_event("final", response.model_dump(mode="json"))
+    except Exception as exc:  # noqa: BLE001
+        yield _ndjson_event("error", {"status_code": 404 if isinstance(exc, FileNotFoundError) else 400, "detail": str(exc)})
+
+
+def _prepare_forecast(db: Session, session_record: AppSession, payload: ForecastRequest) -> _PreparedForecast:
+    touch_session_disease(db, session_record, payload.disease_slug)
+    dataset_record = get_dataset_record(db, session_record.id, payload.dataset_id)
+    request_payload = payload.model_dump()
+    request_payload["state"] = resolve_dataset_state_query(dataset_record, payload.state)
+    if dataset_record.frequency != "monthly" and request_payload["mode"] == "monthly":
+        request_payload["mode"] = "auto"
+
+    dataset_series = load_dataset_series(db, dataset_record, request_payload["state"])
+    forecast_parameters = normalize_forecast_parameters(
+        source_frequency=dataset_series.source_frequency,
+        mode=request_payload["mode"],
+        model=payload.model,
+        forecast_years=payload.forecast_years,
+        forecast_periods=payload.forecast_periods,
+        confidence=payload.confidence,
+        seasonal=payload.seasonal,
+    )
+    return _PreparedForecast(
+        dataset_record=dataset_record,
+        request_payload=request_payload,
+        dataset_series=dataset_series,
+        cache_key=build_forecast_cache_key(dataset_series.fingerprint, dataset_series.state_label, forecast_parameters),
+    )
+
+
+def _fit_and_cache_forecast(db: Session, payload: ForecastRequest, prepared: _PreparedForecast) -> dict:
+    dataset_record = prepared.dataset_record
+    dataset_series = prepared.dataset_series
+    prediction_result = forecast_series(
+        series=dataset_series.time_series(),
+        annual_series=dataset_series.annual_time_series(),
+        state_label=dataset_series.state_label,
+        source_frequency=dataset_series.source_frequency,
+        mode=prepared.request_payload["mode"],
+        model=payload.model,
+        forecast_years=payload.forecast_years,
+        forecast_periods=payload.forecast_periods,
+        confidence=payload.confidence,
+        seasonal=payload.seasonal,
+        lineage=build_series_lineage(
+            dataset_record.system,
+            dataset_record.uf,
+            dataset_record.icd_prefix,
+            dataset_record.granularity,
+            dataset_series.state_label,
+        ),
+        features=dataset_series.features,
+    )
+    # A result cut short by the fit budget is served once but not cached, so the next request can fit in full.
+    if not prediction_result.get("budget_exceeded"):
+        store_cached_forecast(db, prepared.cache_key, prediction_result)
+    return prediction_result
+
+
+def _save_forecast(
+    db: Session,
+    session_record: AppSession,
+    payload: ForecastRequest,
+    prepared: _PreparedForecast,
+    prediction_result: dict,
+) -> ForecastResponse:
+    saved_forecast = save_forecast_record(
+        db=db,
+        session_record=session_record,
+        dataset_record=prepared.dataset_record,
+        disease_slug=payload.disease_slug,
+        request_payload=prepared.request_payload,
+        prediction_payload=prediction_result,
+    )
+    return ForecastResponse(
+        forecast_id=saved_forecast["forecast_id"],
+        dataset_id=saved_forecast["dataset_id"],
+        saved_at=saved_forecast["saved_at"],
+        disease_slug=payload.disease_slug,
+        **saved_forecast["result"],
+    )
+
+
+def _ndjson_event(event: str, body: dict) -> str:
+    return json.dumps({"event": event, **body}) + "\n"
+
+
+@router.post("/evaluate", response_model=EvaluationResponse)
+def evaluate(
+    payload: EvaluationRequest,
+    db: Session = Depends(get_db),
+    session_record: AppSession = Depends(get_current_session),
+) -> EvaluationResponse:
+    try:
+        touch_session_disease(db, session_record, payload.disease_slug)
+        dataset_record = get_dataset_record(db, session_record.id, payload.dataset_id)
+        mode = payload.mode
+        if dataset_record.frequency != "monthly" and mode == "monthly":
+            mode = "auto"
+        dataset_series = load_dataset_series(db, dataset_record, resolve_dataset_state_query(dataset_record, payload.state))
+        evaluation = evaluate_models(
+            series=dataset_series.time_series(),
+            annual_series=dataset_series.annual_time_series(),
+            state_label=dataset_series.state_label,
+            source_frequency=dataset_series.source_frequency,
+            models=payload.models,
+            cutoffs=payload.cutoffs,
+            mode=mode,
+            horizon=payload.horizon,
+            confidence=payload.confidence,
+            seasonal=payload.seasonal,
         )
-        return ForecastResponse(
-            forecast_id=saved_forecast["forecast_id"],
-            dataset_id=saved_forecast["dataset_id"],
-            saved_at=saved_forecast["saved_at"],
-            disease_slug=payload.disease_slug,
-            **saved_forecast["result"],
+        return EvaluationResponse(dataset_id=dataset_record.id, disease_slug=payload.disease_slug, **evaluation)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post("/predict/hierarchy", response_model=HierarchyForecastResponse)
+def predict_hierarchy(
+    payload: HierarchyForecastRequest,
+    db: Session = Depends(get_db),
+    session_record: AppSession = Depends(get_current_session),
+) -> HierarchyForecastResponse:
+    try:
+        touch_session_disease(db, session_record, payload.disease_slug)
+        dataset_record = get_dataset_record(db, session_record.id, payload.dataset_id)
+        mode = payload.mode
+        if dataset_record.frequency != "monthly" and mode == "monthly":
+            mode = "auto"
+        # The state matrix only exists in the TABNET layout, so it is preferred over a tidy export.
+        hierarchy = generate_hierarchical_forecast(
+            dataset_record.tabnet_content or get_dataset_content(dataset_record),
+            mode=mode,
+            model=payload.model,
+            forecast_years=payload.forecast_years,
+            forecast_periods=payload.forecast_periods,
+            confidence=payload.confidence,
+            seasonal=payload.seasonal,
+            reconciliation=payload.reconciliation,
         )
+        return HierarchyForecastResponse(dataset_id=dataset_record.id, disease_slug=payload.disease_slug, **hierarchy)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
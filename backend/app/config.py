@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -28,6 +29,41 @@ DATABASE_URL = os.environ.get(
     f"postgresql+psycopg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}",
 )
 
+# Bumped whenever forecasts change for the same input, so cached results and fitted models from older engines are not reused.
+FORECAST_ENGINE_VERSION = "6"
+FORECAST_CACHE_TTL_HOURS = float(os.environ.get("FORECAST_CACHE_TTL_HOURS", "168"))
+FORECAST_CACHE_MAX_ENTRIES = int(os.environ.get("FORECAST_CACHE_MAX_ENTRIES", "5000"))
+FORECAST_MODEL_CACHE_MB = float(os.environ.get("FORECAST_MODEL_CACHE_MB", "64"))
+FORECAST_MODEL_CACHE_DIR = os.environ.get("FORECAST_MODEL_CACHE_DIR", "").strip()
+FORECAST_MODEL_CACHE_DISK_MB = float(os.environ.get("FORECAST_MODEL_CACHE_DISK_MB", "512"))
+ARIMA_ORDER_REUSE = os.environ.get("ARIMA_ORDER_REUSE", "refit").strip().lower()
+ARIMA_ORDER_RESEARCH_EVERY = int(os.environ.get("ARIMA_ORDER_RESEARCH_EVERY", "12"))
+ARIMA_ENGINE = os.environ.get("ARIMA_ENGINE", "pmdarima").strip().lower()
+# Worker processes for model fits; one core is left to the API. 0 or 1 fits everything in the request thread.
+FORECAST_WORKERS = int(os.environ.get("FORECAST_WORKERS", str(max((os.cpu_count() or 1) - 1, 0))))
+FORECAST_FIT_BUDGET_SECONDS = float(os.environ.get("FORECAST_FIT_BUDGET_SECONDS", "30"))
+
+
+def parse_fit_budgets(raw: str) -> dict[str, float]:
+    budgets: dict[str, float] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, _, seconds = item.partition("=")
+        if not name.strip() or not re.fullmatch(r"\s*\d+(\.\d*)?\s*", seconds):
+            raise ValueError(
+                f"FORECAST_FIT_BUDGETS entries must look like model=seconds or model.frequency=seconds, got {item.strip()!r}."
+            )
+        budgets[name.strip().lower()] = float(seconds)
+    return budgets
+
+
+# Per model or model.frequency overrides of the fit budget, e.g. "arima.monthly=20,theta=5"; 0 disables the limit.
+FORECAST_FIT_BUDGETS = parse_fit_budgets(os.environ.get("FORECAST_FIT_BUDGETS", "arima.monthly=20"))
+# Monthly ARIMA and Theta fits skip the m=12 search unless the series is at least this seasonal (0 to 1).
+FORECAST_MIN_SEASONAL_STRENGTH = float(os.environ.get("FORECAST_MIN_SEASONAL_STRENGTH", "0.3"))
+FORECAST_PRELOAD_BACKENDS = os.environ.get("FORECAST_PRELOAD_BACKENDS", "false").strip().lower() in {"1", "true", "yes"}
+
 
 def ensure_runtime_directories() -> None:
     for path in (
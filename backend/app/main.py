@@ -4,8 +4,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api.api_routes import router as api_router
-from .config import ensure_runtime_directories
+from .config import FORECAST_PRELOAD_BACKENDS, ensure_runtime_directories
 from .database import check_database_connection, ensure_database_schema
+from .services.arima_order_cache import DatabaseArimaOrderStore
+from .services.forecast.arima_order_store import set_arima_order_store
+from .services.forecast.process_pool import shutdown_forecast_executor
+from .services.prediction_engine import preload_forecast_backends
 
 
 def create_app() -> FastAPI:
@@ -27,9 +31,16 @@ def create_app() -> FastAPI:
     @application.on_event("startup")
     def prepare_runtime() -> None:
         ensure_runtime_directories()
+        if FORECAST_PRELOAD_BACKENDS:
+            preload_forecast_backends()
         database_ready, _ = check_database_connection()
         if database_ready:
             ensure_database_schema()
+            set_arima_order_store(DatabaseArimaOrderStore())
+
+    @application.on_event("shutdown")
+    def release_runtime() -> None:
+        shutdown_forecast_executor()
 
     @application.get("/", tags=["meta"])
     def api_index() -> dict:
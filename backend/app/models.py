@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -67,6 +67,56 @@ class DatasetImport(Base):
 
     session: Mapped[AppSession] = relationship(back_populates="datasets")
     forecasts: Mapped[list["ForecastRun"]] = relationship(back_populates="dataset", cascade="all, delete-orphan")
+    series: Mapped[list["DatasetSeries"]] = relationship(back_populates="dataset", cascade="all, delete-orphan")
+    preview: Mapped[Optional["DatasetPreview"]] = relationship(back_populates="dataset", cascade="all, delete-orphan")
+
+
+class DatasetSeries(Base):
+    __tablename__ = "dataset_series"
+    __table_args__ = (UniqueConstraint("dataset_id", "state_query", name="uq_dataset_series_state"),)
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True, default=generate_id)
+    dataset_id: Mapped[str] = mapped_column(ForeignKey("dataset_imports.id", ondelete="CASCADE"), index=True)
+    state_query: Mapped[str] = mapped_column(String(255))
+    state_label: Mapped[str] = mapped_column(String(255))
+    source_frequency: Mapped[str] = mapped_column(String(32))
+    start_period: Mapped[str] = mapped_column(String(16))
+    point_count: Mapped[int] = mapped_column(Integer, default=0)
+    values_blob: Mapped[bytes] = mapped_column(LargeBinary)
+    annual_start: Mapped[int] = mapped_column(Integer)
+    annual_values_blob: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    dataset: Mapped[DatasetImport] = relationship(back_populates="series")
+    features: Mapped[Optional["DatasetSeriesFeatures"]] = relationship(back_populates="series", cascade="all, delete-orphan")
+
+
+class DatasetSeriesFeatures(Base):
+    __tablename__ = "dataset_series_features"
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True, default=generate_id)
+    series_id: Mapped[str] = mapped_column(ForeignKey("dataset_series.id", ondelete="CASCADE"), unique=True, index=True)
+    season_length: Mapped[int] = mapped_column(Integer)
+    seasonal_strength: Mapped[float] = mapped_column(Float)
+    trend_strength: Mapped[float] = mapped_column(Float)
+    seasonal_acf: Mapped[float] = mapped_column(Float)
+    dominant_period: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    period_detected: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    series: Mapped[DatasetSeries] = relationship(back_populates="features")
+
+
+class DatasetPreview(Base):
+    __tablename__ = "dataset_previews"
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True, default=generate_id)
+    dataset_id: Mapped[str] = mapped_column(ForeignKey("dataset_imports.id", ondelete="CASCADE"), unique=True, index=True)
+    columns: Mapped[list[str]] = mapped_column(JSONB)
+    rows: Mapped[list[list[str]]] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    dataset: Mapped[DatasetImport] = relationship(back_populates="preview")
 
 
 class ForecastRun(Base):
@@ -87,3 +137,25 @@ class ForecastRun(Base):
 
     session: Mapped[AppSession] = relationship(back_populates="forecasts")
     dataset: Mapped[DatasetImport] = relationship(back_populates="forecasts")
+
+
+class ForecastCacheEntry(Base):
+    __tablename__ = "forecast_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    result_payload: Mapped[dict] = mapped_column(JSONB)
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+class ArimaOrderEntry(Base):
+    __tablename__ = "arima_orders"
+
+    lineage: Mapped[str] = mapped_column(String(512), primary_key=True)
+    order: Mapped[list[int]] = mapped_column(JSONB)
+    seasonal_order: Mapped[list[int]] = mapped_column(JSONB)
+    with_intercept: Mapped[bool] = mapped_column(Boolean, default=True)
+    fits_since_search: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 ForecastMode = Literal["auto", "annual", "monthly"]
-ForecastModel = Literal["arima", "theta"]
+ForecastModel = Literal["arima", "theta", "drift", "seasonal_naive", "ets", "auto"]
 DataGranularity = Literal["year", "month"]
+ReconciliationMethod = Literal["bottom_up", "mint"]
 
 
 class SessionInfo(BaseModel):
@@ -59,6 +60,102 @@ class ForecastResponse(BaseModel):
     forecast_points: Optional[int] = None
     last_observed: Optional[float] = None
     peak_observed: Optional[float] = None
+    budget_exceeded: Optional[bool] = None
+    selected_model: Optional[str] = None
+    tournament: Optional[List[Dict[str, Any]]] = None
+
+
+class EvaluationRequest(BaseModel):
+    dataset_id: str = Field(..., description="Dataset UUID stored in PostgreSQL")
+    disease_slug: str = Field(..., description="Current disease page slug")
+    state: str = Field(default="21", description="UF code, sigla or name")
+    mode: ForecastMode = "auto"
+    models: List[ForecastModel] = Field(default_factory=lambda: ["arima", "theta"], min_length=1)
+    cutoffs: List[Union[int, str]] = Field(default_factory=list, description="Last training period of each fold, e.g. 2019 or 2019-06")
+    horizon: int = 1
+    confidence: float = 0.95
+    seasonal: Optional[bool] = None
+
+    @field_validator("horizon")
+    @classmethod
+    def validate_positive_horizon(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("Evaluation horizon must be >= 1.")
+        return value
+
+    @field_validator("confidence")
+    @classmethod
+    def validate_confidence(cls, value: float) -> float:
+        if not 0.5 <= value <= 0.999:
+            raise ValueError("confidence must be between 0.5 and 0.999.")
+        return value
+
+
+class ModelEvaluation(BaseModel):
+    model: str
+    label: str
+    mae: Optional[float] = None
+    mape: Optional[float] = None
+    mean_fit_seconds: Optional[float] = None
+    total_fit_seconds: float
+    evaluated_points: int
+    failed_fits: int
+
+
+class EvaluationResponse(BaseModel):
+    dataset_id: str
+    disease_slug: str
+    state_label: str
+    output_frequency: str
+    horizon: int
+    cutoffs: List[Union[int, str]]
+    models: List[ModelEvaluation]
+
+
+class HierarchyForecastRequest(BaseModel):
+    dataset_id: str = Field(..., description="Dataset UUID stored in PostgreSQL")
+    disease_slug: str = Field(..., description="Current disease page slug")
+    mode: ForecastMode = "auto"
+    model: ForecastModel = "arima"
+    forecast_years: int = 3
+    forecast_periods: int = 12
+    confidence: float = 0.95
+    seasonal: Optional[bool] = None
+    reconciliation: ReconciliationMethod = "mint"
+
+    @field_validator("forecast_years", "forecast_periods")
+    @classmethod
+    def validate_positive_horizon(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("Forecast horizon must be >= 1.")
+        return value
+
+    @field_validator("confidence")
+    @classmethod
+    def validate_confidence(cls, value: float) -> float:
+        if not 0.5 <= value <= 0.999:
+            raise ValueError("confidence must be between 0.5 and 0.999.")
+        return value
+
+
+class HierarchyNode(BaseModel):
+    state_label: str
+    level: Literal["national", "state"]
+    model: str
+    error: Optional[str] = None
+    historical_data: List[Dict[str, Any]]
+    forecast: List[Dict[str, Any]]
+
+
+class HierarchyForecastResponse(BaseModel):
+    dataset_id: str
+    disease_slug: str
+    source_frequency: str
+    output_frequency: str
+    model: str
+    reconciliation: str
+    periods: List[Union[int, str]]
+    nodes: List[HierarchyNode]
 
 
 class DatasetInfo(BaseModel):
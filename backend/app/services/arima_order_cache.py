@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..models import ArimaOrderEntry, utcnow
+from .forecast.arima_order_store import ArimaOrder
+
+
+class DatabaseArimaOrderStore:
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        self._session_factory = session_factory
+
+    def get(self, lineage: str) -> Optional[ArimaOrder]:
+        try:
+            with self._session_factory() as db:
+                entry = db.get(ArimaOrderEntry, lineage)
+        except SQLAlchemyError:
+            return None
+        if entry is None:
+            return None
+        return ArimaOrder(
+            order=tuple(entry.order),  # type: ignore[arg-type]
+            seasonal_order=tuple(entry.seasonal_order),  # type: ignore[arg-type]
+            with_intercept=bool(entry.with_intercept),
+            fits_since_search=int(entry.fits_since_search),
+        )
+
+    def put(self, lineage: str, order: ArimaOrder) -> None:
+        values = {
+            "order": list(order.order),
+            "seasonal_order": list(order.seasonal_order),
+            "with_intercept": order.with_intercept,
+            "fits_since_search": order.fits_since_search,
+            "updated_at": utcnow(),
+        }
+        statement = insert(ArimaOrderEntry).values(lineage=lineage, **values)
+        statement = statement.on_conflict_do_update(index_elements=[ArimaOrderEntry.lineage], set_=values)
+        try:
+            with self._session_factory() as db:
+                db.execute(statement)
+                db.commit()
+        except SQLAlchemyError:
+            return
+
+
+def build_series_lineage(system: str, uf: str, icd_prefix: str, granularity: str, state_label: str) -> str:
+    return "|".join(part.strip() for part in (system, uf, icd_prefix, granularity, state_label))
@@ -8,7 +8,7 @@ from typing import Any, Dict, List
 from fastapi import UploadFile
 
 from ..config import DATA_DIR, EXPORTS_DIR, SAMPLES_DIR
-from .forecast.csv_loader import detect_csv_metadata, detect_source_frequency, preview_dataframe
+from .forecast.csv_loader import preview_dataframe, sniff_csv_metadata
 from .storage_names import build_manual_upload_name
 
 
@@ -83,9 +83,9 @@ def _build_dataset_entry(csv_file: Path, source_group: str) -> Dict[str, Any]:
     layout = "unknown"
     frequency = "unknown"
     try:
-        metadata = detect_csv_metadata(csv_file)
+        metadata = sniff_csv_metadata(csv_file)
         layout = metadata.layout
-        frequency = detect_source_frequency(csv_file)
+        frequency = metadata.source_frequency
     except Exception:
         pass
 
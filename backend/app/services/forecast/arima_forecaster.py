@@ -1,38 +1,195 @@
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import replace
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Optional, Tuple
 
 import numpy as np
-from pmdarima import auto_arima
+
+from ...config import ARIMA_ENGINE, ARIMA_ORDER_RESEARCH_EVERY, ARIMA_ORDER_REUSE
+from .arima_order_store import ArimaOrder, get_arima_order_store
+from .fit_budget import budget_fit_args, check_fit_budget, fit_budget_expired
+from .model_cache import cached_fit
+from .native_arima import MAX_NATIVE_ORDER, fit_native_arima, search_native_arima
+from .time_series import TimeSeries
 
 
 def forecast_arima_log(
-    series_log: np.ndarray,
+    series_log: TimeSeries,
     periods: int,
     confidence: float,
     seasonal: bool,
     season_length: int,
+    lineage: Optional[str] = None,
+    order: Optional[ArimaOrder] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
+    model = _cached_arima_model(series_log, seasonal, season_length, lineage, order)
+    forecast_log, confidence_log = model.predict(
+        n_periods=int(periods),
+        return_conf_int=True,
+        alpha=1 - confidence,
+    )
+    return np.asarray(forecast_log), np.asarray(confidence_log)
+
+
+def select_arima_order(
+    series_log: TimeSeries,
+    seasonal: bool,
+    season_length: int,
+    lineage: Optional[str] = None,
+) -> ArimaOrder:
+    return ArimaOrder.from_model(_cached_arima_model(series_log, seasonal, season_length, lineage, None))
+
+
+def reused_arima_order(
+    series_log: TimeSeries,
+    seasonal: bool,
+    season_length: int,
+    lineage: Optional[str] = None,
+) -> Optional[ArimaOrder]:
+    # The stored order a lineage fit will refit as is, known before that fit runs; None when the fit searches.
+    if not lineage or ARIMA_ORDER_REUSE == "warm":
+        return None
+    seasonal_period = season_length if seasonal else 1
+    stored = get_arima_order_store().get(_order_store_key(lineage, series_log.frequency, seasonal_period, seasonal))
+    if stored is None or stored.fits_since_search >= ARIMA_ORDER_RESEARCH_EVERY:
+        return None
+    return replace(stored, fits_since_search=0)
+
+
+def _cached_arima_model(
+    series_log: TimeSeries,
+    seasonal: bool,
+    season_length: int,
+    lineage: Optional[str],
+    order: Optional[ArimaOrder],
+) -> Any:
     series_length = int(len(series_log))
     max_order = max(1, min(3, series_length // 2))
-    model = auto_arima(
-        series_log,
+    seasonal_period = season_length if seasonal else 1
+    settings: dict[str, Any] = {"seasonal": bool(seasonal), "m": int(seasonal_period), "max_order": max_order}
+    if _uses_native_engine(bool(seasonal)):
+        settings["engine"] = "native"
+    if order is None:
+        return cached_fit(
+            "arima",
+            series_log.values,
+            settings,
+            lambda: _fit_arima(series_log, bool(seasonal), int(seasonal_period), max_order, lineage),
+        )
+
+    settings.update(order=list(order.order), seasonal_order=list(order.seasonal_order), with_intercept=order.with_intercept)
+    return cached_fit(
+        "arima-fixed-order",
+        series_log.values,
+        settings,
+        lambda: _fit_fixed_order(series_log.values, order, bool(seasonal), int(seasonal_period), max_order),
+    )
+
+
+def _fit_fixed_order(
+    values: np.ndarray,
+    order: ArimaOrder,
+    seasonal: bool,
+    seasonal_period: int,
+    max_order: int,
+) -> Any:
+    try:
+        return _refit_order(values, order)
+    except Exception:
+        # A refit cut short by the budget does not restart as a full search; other failures search within it.
+        check_fit_budget()
+        return _search_arima(values, seasonal, seasonal_period, max_order)
+
+
+def _refit_order(values: np.ndarray, order: ArimaOrder) -> Any:
+    if _uses_native_engine(any(order.seasonal_order[:3])) and max(order.order[0], order.order[2]) <= MAX_NATIVE_ORDER:
+        return fit_native_arima(values, order.order, order.with_intercept)
+    return load_pmdarima().ARIMA(
+        order=order.order,
+        seasonal_order=order.seasonal_order,
+        with_intercept=order.with_intercept,
+        suppress_warnings=True,
+    ).fit(values, **budget_fit_args())
+
+
+def _fit_arima(
+    series_log: TimeSeries,
+    seasonal: bool,
+    seasonal_period: int,
+    max_order: int,
+    lineage: Optional[str],
+) -> Any:
+    if not lineage:
+        return _search_arima(series_log.values, seasonal, seasonal_period, max_order)
+
+    store = get_arima_order_store()
+    store_key = _order_store_key(lineage, series_log.frequency, seasonal_period, seasonal)
+    stored = store.get(store_key)
+    if stored is not None and stored.fits_since_search < ARIMA_ORDER_RESEARCH_EVERY:
+        try:
+            if ARIMA_ORDER_REUSE == "warm":
+                model = _search_arima(series_log.values, seasonal, seasonal_period, max_order, start=stored)
+            else:
+                model = _refit_order(series_log.values, stored)
+        except Exception:
+            model = None
+        if model is not None:
+            if not fit_budget_expired():
+                store.put(store_key, replace(ArimaOrder.from_model(model), fits_since_search=stored.fits_since_search + 1))
+            return model
+        # As in _fit_fixed_order, a refit cut short by the budget does not restart as a full search.
+        check_fit_budget()
+
+    model = _search_arima(series_log.values, seasonal, seasonal_period, max_order)
+    if not fit_budget_expired():
+        store.put(store_key, ArimaOrder.from_model(model))
+    return model
+
+
+def _order_store_key(lineage: str, frequency: str, seasonal_period: int, seasonal: bool) -> str:
+    return f"{lineage}|{frequency}|m={seasonal_period}|seasonal={int(seasonal)}"
+
+
+def _search_arima(
+    values: np.ndarray,
+    seasonal: bool,
+    seasonal_period: int,
+    max_order: int,
+    start: Optional[ArimaOrder] = None,
+) -> Any:
+    if _uses_native_engine(seasonal):
+        # The native search is exhaustive over the small order space, so it has no use for a warm start.
+        return search_native_arima(values, max_order)
+    start_p, _, start_q = start.order if start is not None else (0, 0, 0)
+    start_seasonal_p, _, start_seasonal_q, _ = start.seasonal_order if start is not None else (1, 0, 1, 0)
+    return auto_arima(
+        values,
         seasonal=seasonal,
-        m=season_length if seasonal else 1,
+        m=seasonal_period,
         D=0,
-        start_p=0,
-        start_q=0,
+        start_p=min(start_p, max_order),
+        start_q=min(start_q, max_order),
+        start_P=start_seasonal_p,
+        start_Q=start_seasonal_q,
         max_p=max_order,
         max_q=max_order,
         stepwise=True,
         suppress_warnings=True,
         trace=False,
+        **budget_fit_args(),
     )
 
-    forecast_log, confidence_log = model.predict(
-        n_periods=int(periods),
-        return_conf_int=True,
-        alpha=1 - confidence,
-    )
-    return np.asarray(forecast_log), np.asarray(confidence_log)
 
+def auto_arima(values: np.ndarray, **kwargs: Any) -> Any:
+    return load_pmdarima().auto_arima(values, **kwargs)
+
+
+def load_pmdarima() -> ModuleType:
+    # pmdarima pulls in statsmodels, scikit-learn and scipy, so it is imported on the first fit rather than with the app.
+    return import_module("pmdarima")
+
+
+def _uses_native_engine(seasonal: bool) -> bool:
+    return ARIMA_ENGINE == "native" and not seasonal
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+
+@dataclass(frozen=True)
+class ArimaOrder:
+    order: Tuple[int, int, int]
+    seasonal_order: Tuple[int, int, int, int]
+    with_intercept: bool
+    fits_since_search: int = 0
+
+    @classmethod
+    def from_model(cls, model: Any, fits_since_search: int = 0) -> "ArimaOrder":
+        return cls(
+            order=tuple(int(value) for value in model.order),  # type: ignore[arg-type]
+            seasonal_order=tuple(int(value) for value in model.seasonal_order),  # type: ignore[arg-type]
+            with_intercept=bool(model.with_intercept),
+            fits_since_search=int(fits_since_search),
+        )
+
+
+class ArimaOrderStore(Protocol):
+    def get(self, lineage: str) -> Optional[ArimaOrder]:
+        ...
+
+    def put(self, lineage: str, order: ArimaOrder) -> None:
+        ...
+
+
+class InMemoryArimaOrderStore:
+    def __init__(self) -> None:
+        self._orders: Dict[str, ArimaOrder] = {}
+        self._lock = Lock()
+
+    def get(self, lineage: str) -> Optional[ArimaOrder]:
+        with self._lock:
+            return self._orders.get(lineage)
+
+    def put(self, lineage: str, order: ArimaOrder) -> None:
+        with self._lock:
+            self._orders[lineage] = order
+
+
+_order_store: ArimaOrderStore = InMemoryArimaOrderStore()
+_order_store_lock = Lock()
+
+
+def get_arima_order_store() -> ArimaOrderStore:
+    return _order_store
+
+
+def set_arima_order_store(store: ArimaOrderStore) -> None:
+    global _order_store
+    with _order_store_lock:
+        _order_store = store
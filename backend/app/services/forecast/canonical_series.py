@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+import hashlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .csv_loader import aggregate_to_annual
+from .series_features import SeriesFeatures
+from .time_series import TimeSeries
+
+VALUE_DTYPE = np.dtype("<f8")
+
+
+@dataclass(frozen=True, eq=False)
+class CanonicalSeries:
+    state_label: str
+    source_frequency: str
+    start_period: str
+    values: np.ndarray
+    annual_start: int
+    annual_values: np.ndarray
+    features: Optional[SeriesFeatures] = None
+
+    @cached_property
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{self.source_frequency}|{self.start_period}|{self.annual_start}|".encode("utf-8"))
+        digest.update(encode_values(self.values))
+        digest.update(b"|")
+        digest.update(encode_values(self.annual_values))
+        return digest.hexdigest()
+
+    def time_series(self) -> TimeSeries:
+        return TimeSeries.from_period(self.start_period, self.source_frequency, self.values)
+
+    def annual_time_series(self) -> TimeSeries:
+        return TimeSeries(self.annual_start, "annual", self.annual_values)
+
+
+def build_canonical_series(series: pd.Series, state_label: str, source_frequency: str) -> CanonicalSeries:
+    if series.empty:
+        raise ValueError("Cannot store an empty series.")
+
+    values = np.asarray(series.to_numpy(dtype=float), dtype=VALUE_DTYPE)
+    if source_frequency == "monthly":
+        if not isinstance(series.index, pd.DatetimeIndex):
+            raise ValueError("Monthly series must be indexed by month.")
+        start = pd.Timestamp(series.index[0])
+        expected = pd.date_range(start, periods=len(series), freq="MS")
+        start_period = start.strftime("%Y-%m")
+    else:
+        years = pd.Index(series.index).astype(int)
+        start = int(years[0])
+        expected = pd.RangeIndex(start, start + len(series))
+        start_period = str(start)
+        series = pd.Series(series.to_numpy(), index=years)
+    if not pd.Index(series.index).equals(pd.Index(expected)):
+        raise ValueError("Series must be sorted and contiguous to be stored in canonical form.")
+
+    annual = aggregate_to_annual(series) if source_frequency == "monthly" else series
+    annual_years = pd.Index(annual.index).astype(int)
+    return CanonicalSeries(
+        state_label=state_label,
+        source_frequency=source_frequency,
+        start_period=start_period,
+        values=values,
+        annual_start=int(annual_years[0]),
+        annual_values=np.asarray(annual.to_numpy(dtype=float), dtype=VALUE_DTYPE),
+    )
+
+
+def encode_values(values: np.ndarray) -> bytes:
+    return np.ascontiguousarray(values, dtype=VALUE_DTYPE).tobytes()
+
+
+def decode_values(payload: bytes) -> np.ndarray:
+    return np.frombuffer(payload, dtype=VALUE_DTYPE)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+import io
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from .time_series import TimeSeries
+
 MONTH_ALIAS_MAP = {
     "JAN": "Jan",
     "FEV": "Feb",
@@ -35,6 +40,24 @@ MONTH_ALIAS_MAP = {
 }
 
 
+ENGLISH_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTH_NUMBER_MAP = {
+    **{name.upper(): number for number, name in enumerate(ENGLISH_MONTHS, start=1)},
+    **{alias: ENGLISH_MONTHS.index(name) + 1 for alias, name in MONTH_ALIAS_MAP.items() if len(alias) == 3},
+}
+NUMERIC_MONTH_PATTERN = re.compile(r"\d{4}[-/]\d{2}")
+NAMED_MONTH_PATTERN = re.compile(r"(\d{4})/([A-Za-z]{3,})")
+LINE_BREAK_PATTERN = re.compile(r"\r\n|\n|\r")
+MONTH_LABEL_CACHE_SIZE = 16384
+
+NUMERIC_GRID_WIDTH = 24
+NUMERIC_GRID_ROWS = 65536
+NUMERIC_EXACT_DIGITS = 15
+
+TABNET_HEADER_SCAN_LINES = 100
+SNIFF_PREFIX_BYTES = 64 * 1024
+
+
 @dataclass(frozen=True)
 class CsvMetadata:
     layout: str
@@ -43,15 +66,104 @@ class CsvMetadata:
     header_index: Optional[int] = None
 
 
-def _read_lines(path: Path) -> Tuple[List[str], str]:
+@dataclass(frozen=True, eq=False)
+class ParsedDataset:
+    layout: str
+    source_frequency: str
+    encoding: str
+    frame: pd.DataFrame
+    header_index: Optional[int] = None
+
+    @property
+    def metadata(self) -> CsvMetadata:
+        return CsvMetadata(
+            layout=self.layout,
+            source_frequency=self.source_frequency,
+            encoding=self.encoding,
+            header_index=self.header_index,
+        )
+
+    @cached_property
+    def period_bounds(self) -> Dict[str, int]:
+        return _period_bounds(self)
+
+
+@dataclass(frozen=True, eq=False)
+class StateMatrix:
+    labels: Tuple[str, ...]
+    periods: pd.Index
+    values: np.ndarray
+    source_frequency: str
+
+    def row(self, position: int) -> pd.Series:
+        return pd.Series(self.values[position], index=self.periods, name="value")
+
+    def state_series(self, state_query: str) -> Tuple[pd.Series, str, str]:
+        state_label, row = _pick_tabnet_state(pd.DataFrame({"state": self.labels}), state_query)
+        return self.row(int(row.name)), state_label, self.source_frequency  # type: ignore[arg-type]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=pd.Index(self.labels, name="state"), columns=self.periods)
+
+
+CsvSource = Union[Path, bytes, BinaryIO]
+DatasetSource = Union[CsvSource, ParsedDataset]
+
+
+def _read_content(source: CsvSource) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, Path)):
+        return Path(source).read_bytes()
+    content = source.read()
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    return bytes(content)
+
+
+def _read_prefix(source: CsvSource, size: int) -> Tuple[bytes, bool]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:size]), len(source) <= size
+    if isinstance(source, (str, Path)):
+        with Path(source).open("rb") as handle:
+            content = handle.read(size + 1)
+        return content[:size], len(content) <= size
+    if not source.seekable():
+        return _read_content(source), True
+    position = source.tell()
+    try:
+        content = source.read(size + 1)
+    finally:
+        source.seek(position)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return bytes(content[:size]), len(content) <= size
+
+
+def _read_lines(source: CsvSource) -> Tuple[List[str], str]:
+    return _decode_lines(_read_content(source))
+
+
+def _decode_lines(content: bytes) -> Tuple[List[str], str]:
     for encoding in ("utf-8-sig", "utf-8", "ISO-8859-1", "cp1252"):
         try:
-            with path.open("r", encoding=encoding) as handle:
-                return handle.read().splitlines(), encoding
+            return _split_lines(content.decode(encoding)), encoding
         except UnicodeDecodeError:
             continue
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        return handle.read().splitlines(), "utf-8"
+    return _split_lines(content.decode("utf-8", errors="replace")), "utf-8"
+
+
+def _split_lines(text: str) -> List[str]:
+    # Only the terminators pandas itself breaks rows on: str.splitlines() also splits on U+0085 (a cp1252 ellipsis
+    # read as ISO-8859-1), form feeds and other separators that can sit inside a field.
+    lines = LINE_BREAK_PATTERN.split(text)
+    return lines[:-1] if lines and not lines[-1] else lines
+
+
+def _source_label(source: CsvSource) -> str:
+    if isinstance(source, (str, Path)):
+        return str(source)
+    return "<in-memory CSV>"
 
 
 def _normalize_month_headers(cells: List[str]) -> List[str]:
@@ -68,7 +180,7 @@ def _normalize_month_headers(cells: List[str]) -> List[str]:
     return normalized
 
 
-def _detect_tabnet_header_index(lines: List[str], max_scan: int = 100) -> Optional[int]:
+def _detect_tabnet_header_index(lines: List[str], max_scan: int = TABNET_HEADER_SCAN_LINES) -> Optional[int]:
     for index, line in enumerate(lines[:max_scan]):
         if "Unidade da Federa" in line and re.search(r"\b\d{4}\b", line):
             return index
@@ -116,55 +228,122 @@ def _detect_tidy_frequency(df: pd.DataFrame) -> str:
     raise ValueError("Could not infer annual/monthly frequency from periodo column.")
 
 
-def detect_csv_metadata(csv_path: Path) -> CsvMetadata:
-    lines, encoding = _read_lines(csv_path)
-    header_index = _detect_tabnet_header_index(lines)
-    if header_index is not None:
-        headers = _normalize_month_headers(lines[header_index].split(";"))
-        frequency = _detect_frequency_from_headers(headers)
-        return CsvMetadata(
-            layout="tabnet",
-            source_frequency=frequency,
-            encoding=encoding,
-            header_index=header_index,
-        )
+def detect_csv_metadata(source: DatasetSource) -> CsvMetadata:
+    return sniff_csv_metadata(source)
 
-    if not lines:
-        raise ValueError(f"CSV file is empty: {csv_path}")
-    header_cells = [item.strip().strip('"').lower() for item in lines[0].split(";")]
-    if "periodo" in header_cells and "valor" in header_cells:
-        return CsvMetadata(layout="tidy", source_frequency="auto", encoding=encoding)
 
-    raise ValueError(
-        "CSV layout not supported. Expected TABNET wide format or tidy CSV with periodo/valor columns."
-    )
+def sniff_csv_metadata(source: DatasetSource, prefix_bytes: int = SNIFF_PREFIX_BYTES) -> CsvMetadata:
+    if isinstance(source, ParsedDataset):
+        return source.metadata
 
+    lines, encoding = _sniff_lines(source, prefix_bytes)
+    metadata = _metadata_from_lines(lines, encoding, _source_label(source))
+    if metadata.layout == "tidy":
+        metadata = replace(metadata, source_frequency=_detect_tidy_frequency(_load_tidy_dataframe(lines)))
+    return metadata
+
+
+def _sniff_lines(source: CsvSource, prefix_bytes: int) -> Tuple[List[str], str]:
+    size = max(int(prefix_bytes), 1)
+    while True:
+        prefix, complete = _read_prefix(source, size)
+        if not complete:
+            prefix = prefix[: prefix.rfind(b"\n") + 1]
+        lines, encoding = _decode_lines(prefix)
+        if complete or len(lines) >= TABNET_HEADER_SCAN_LINES or _detect_tabnet_header_index(lines) is not None:
+            return lines, encoding
+        size *= 4
 
-def detect_source_frequency(csv_path: Path) -> str:
-    metadata = detect_csv_metadata(csv_path)
-    if metadata.layout == "tabnet":
-        return metadata.source_frequency
-    df = pd.read_csv(csv_path, sep=";", encoding=metadata.encoding, dtype=str)
-    df.columns = [item.strip().strip('"') for item in df.columns]
-    return _detect_tidy_frequency(df)
 
+def parse_dataset(source: DatasetSource) -> ParsedDataset:
+    if isinstance(source, ParsedDataset):
+        return source
 
-def load_state_series(csv_path: Path, state_query: str) -> Tuple[pd.Series, str, str]:
-    metadata = detect_csv_metadata(csv_path)
+    lines, encoding = _read_lines(source)
+    metadata = _metadata_from_lines(lines, encoding, _source_label(source))
 
     if metadata.layout == "tabnet":
         if metadata.header_index is None:
             raise ValueError("TABNET CSV header index was not detected.")
-        frame = _load_tabnet_dataframe(csv_path, metadata.encoding, metadata.header_index)
-        state_label, row = _pick_tabnet_state(frame, state_query)
-        series = _tabnet_row_to_series(row, metadata.source_frequency, frame.columns[0])
-        return series, state_label, metadata.source_frequency
+        frame = _load_tabnet_dataframe(lines, metadata.header_index)
+        return ParsedDataset(
+            layout=metadata.layout,
+            source_frequency=metadata.source_frequency,
+            encoding=metadata.encoding,
+            frame=frame,
+            header_index=metadata.header_index,
+        )
+
+    frame = _load_tidy_dataframe(lines)
+    return ParsedDataset(
+        layout=metadata.layout,
+        source_frequency=_detect_tidy_frequency(frame),
+        encoding=metadata.encoding,
+        frame=frame,
+    )
+
+
+def detect_source_frequency(source: DatasetSource) -> str:
+    return sniff_csv_metadata(source).source_frequency
+
+
+def load_state_series(source: DatasetSource, state_query: str) -> Tuple[pd.Series, str, str]:
+    dataset = parse_dataset(source)
+
+    if dataset.layout == "tabnet":
+        state_label, row = _pick_tabnet_state(dataset.frame, state_query)
+        series = _tabnet_row_to_series(row, dataset.source_frequency, dataset.frame.columns[0])
+        return series, state_label, dataset.source_frequency
+
+    state_label, selected_frame = _pick_tidy_state(dataset.frame, state_query)
+    series = _tidy_frame_to_series(selected_frame, dataset.source_frequency)
+    return series, state_label, dataset.source_frequency
+
+
+def load_state_codes(source: DatasetSource) -> List[str]:
+    # UF codes present in the dataset, in file order; tidy files without a code column have none.
+    dataset = parse_dataset(source)
+    if dataset.layout == "tabnet":
+        return [str(label)[:2] for label in dataset.frame[dataset.frame.columns[0]]]
+    code_column = _column_name(dataset.frame, ["uf_codigo", "state_code"])
+    if code_column is None:
+        return []
+    return dataset.frame[code_column].astype(str).str.strip().unique().tolist()
+
+
+def load_state_time_series(source: DatasetSource, state_query: str) -> Tuple[TimeSeries, str, str]:
+    series, state_label, source_frequency = load_state_series(source, state_query)
+    return TimeSeries.from_pandas(series), state_label, source_frequency
+
 
-    frame = _load_tidy_dataframe(csv_path, metadata.encoding)
-    source_frequency = _detect_tidy_frequency(frame)
-    state_label, selected_frame = _pick_tidy_state(frame, state_query)
-    series = _tidy_frame_to_series(selected_frame, source_frequency)
-    return series, state_label, source_frequency
+def load_state_matrix(source: DatasetSource) -> StateMatrix:
+    dataset = parse_dataset(source)
+    if dataset.layout != "tabnet":
+        raise ValueError("State matrices require a TABNET wide CSV.")
+
+    frame = dataset.frame
+    period_labels = [str(column) for column in frame.columns[1:]]
+    if not period_labels:
+        raise ValueError("TABNET CSV has no period columns.")
+    cells = frame.iloc[:, 1:].to_numpy(dtype=object).ravel()
+    parsed = _to_numeric(pd.Series(cells, dtype=object)).to_numpy().reshape(len(frame), len(period_labels))
+
+    if dataset.source_frequency == "annual":
+        ordinals = np.array([int(re.search(r"(\d{4})", label).group(1)) for label in period_labels])  # type: ignore[union-attr]
+        periods: pd.Index = pd.RangeIndex(int(ordinals.min()), int(ordinals.max()) + 1)
+    else:
+        months = _parse_month_index(pd.Series(period_labels, dtype=str))
+        ordinals = months.year.to_numpy() * 12 + months.month.to_numpy() - 1
+        periods = pd.date_range(months.min(), months.max(), freq="MS")
+
+    values = np.zeros((len(frame), len(periods)))
+    values[:, ordinals - ordinals.min()] = parsed
+    return StateMatrix(
+        labels=tuple(str(label) for label in frame.iloc[:, 0]),
+        periods=periods,
+        values=values,
+        source_frequency=dataset.source_frequency,
+    )
 
 
 def aggregate_to_annual(series: pd.Series) -> pd.Series:
@@ -179,25 +358,41 @@ def aggregate_to_annual(series: pd.Series) -> pd.Series:
     return aggregated.reindex(full_years).fillna(0.0)
 
 
-def preview_dataframe(csv_path: Path, limit: int = 20) -> pd.DataFrame:
-    metadata = detect_csv_metadata(csv_path)
-    if metadata.layout == "tabnet":
-        if metadata.header_index is None:
-            raise ValueError("Unable to preview TABNET file without header index.")
-        frame = _load_tabnet_dataframe(csv_path, metadata.encoding, metadata.header_index)
-        return frame.head(limit)
+def preview_dataframe(source: DatasetSource, limit: int = 20) -> pd.DataFrame:
+    return parse_dataset(source).frame.head(limit)
 
-    frame = _load_tidy_dataframe(csv_path, metadata.encoding)
-    return frame.head(limit)
 
+def detect_period_bounds(source: DatasetSource) -> Dict[str, int]:
+    return parse_dataset(source).period_bounds
 
-def detect_period_bounds(csv_path: Path) -> Dict[str, int]:
-    metadata = detect_csv_metadata(csv_path)
-    if metadata.layout == "tabnet":
-        if metadata.header_index is None:
-            raise ValueError("TABNET CSV header index was not detected.")
-        frame = _load_tabnet_dataframe(csv_path, metadata.encoding, metadata.header_index)
-        if metadata.source_frequency == "annual":
+
+def _metadata_from_lines(lines: List[str], encoding: str, source_label: str) -> CsvMetadata:
+    header_index = _detect_tabnet_header_index(lines)
+    if header_index is not None:
+        headers = _normalize_month_headers(lines[header_index].split(";"))
+        frequency = _detect_frequency_from_headers(headers)
+        return CsvMetadata(
+            layout="tabnet",
+            source_frequency=frequency,
+            encoding=encoding,
+            header_index=header_index,
+        )
+
+    if not lines:
+        raise ValueError(f"CSV file is empty: {source_label}")
+    header_cells = [item.strip().strip('"').lower() for item in lines[0].split(";")]
+    if "periodo" in header_cells and "valor" in header_cells:
+        return CsvMetadata(layout="tidy", source_frequency="auto", encoding=encoding)
+
+    raise ValueError(
+        "CSV layout not supported. Expected TABNET wide format or tidy CSV with periodo/valor columns."
+    )
+
+
+def _period_bounds(dataset: ParsedDataset) -> Dict[str, int]:
+    frame = dataset.frame
+    if dataset.layout == "tabnet":
+        if dataset.source_frequency == "annual":
             years = [int(re.search(r"(\d{4})", str(column)).group(1)) for column in frame.columns[1:]]  # type: ignore[union-attr]
             return {
                 "year_start": min(years),
@@ -213,13 +408,11 @@ def detect_period_bounds(csv_path: Path) -> Dict[str, int]:
             "month_end": int(months.max().month),
         }
 
-    frame = _load_tidy_dataframe(csv_path, metadata.encoding)
-    source_frequency = _detect_tidy_frequency(frame)
     period_column = _column_name(frame, ["periodo", "period"])
     if period_column is None:
         raise ValueError("Tidy CSV must include a periodo column.")
 
-    if source_frequency == "annual":
+    if dataset.source_frequency == "annual":
         years = pd.to_numeric(frame[period_column].astype(str).str.extract(r"(\d{4})")[0], errors="coerce").dropna().astype(int)
         return {
             "year_start": int(years.min()),
@@ -237,15 +430,12 @@ def detect_period_bounds(csv_path: Path) -> Dict[str, int]:
     }
 
 
-def _load_tabnet_dataframe(csv_path: Path, encoding: str, header_index: int) -> pd.DataFrame:
-    lines, _ = _read_lines(csv_path)
+def _load_tabnet_dataframe(lines: List[str], header_index: int) -> pd.DataFrame:
     headers = _normalize_month_headers(lines[header_index].split(";"))
     frame = pd.read_csv(
-        csv_path,
-        encoding=encoding,
+        io.StringIO("\n".join(lines[header_index + 1:])),
         sep=";",
         header=None,
-        skiprows=header_index + 1,
         dtype=str,
     )
     frame.columns = [item.strip().strip('"') for item in headers]
@@ -254,8 +444,8 @@ def _load_tabnet_dataframe(csv_path: Path, encoding: str, header_index: int) ->
     return frame
 
 
-def _load_tidy_dataframe(csv_path: Path, encoding: str) -> pd.DataFrame:
-    frame = pd.read_csv(csv_path, sep=";", encoding=encoding, dtype=str)
+def _load_tidy_dataframe(lines: List[str]) -> pd.DataFrame:
+    frame = pd.read_csv(io.StringIO("\n".join(lines)), sep=";", dtype=str)
     frame.columns = [item.strip().strip('"') for item in frame.columns]
     return frame
 
@@ -357,42 +547,153 @@ def _tidy_frame_to_series(frame: pd.DataFrame, source_frequency: str) -> pd.Seri
         raise ValueError("Tidy CSV must include periodo and valor columns.")
 
     numeric_values = _to_numeric(frame[value_column].astype(str))
+    return _tidy_values_to_series(frame[period_column], numeric_values.to_numpy(), source_frequency)
+
 
+def _tidy_values_to_series(periods: pd.Series, values: np.ndarray, source_frequency: str) -> pd.Series:
     if source_frequency == "annual":
-        years = pd.to_numeric(frame[period_column].astype(str).str.extract(r"(\d{4})")[0], errors="coerce")
-        series = pd.Series(numeric_values.values, index=years.astype(int), name="value")
+        years = pd.to_numeric(periods.astype(str).str.extract(r"(\d{4})")[0], errors="coerce")
+        series = pd.Series(values, index=years.astype(int), name="value")
         series = series.groupby(level=0).sum().sort_index()
         full_years = pd.RangeIndex(int(series.index.min()), int(series.index.max()) + 1)
         return series.reindex(full_years).fillna(0.0)
 
-    monthly_index = _parse_month_index(frame[period_column].astype(str))
-    series = pd.Series(numeric_values.values, index=monthly_index, name="value")
+    monthly_index = _parse_month_index(periods.astype(str))
+    series = pd.Series(values, index=monthly_index, name="value")
     series = series.groupby(level=0).sum().sort_index()
     full_months = pd.date_range(series.index.min(), series.index.max(), freq="MS")
     return series.reindex(full_months).fillna(0.0)
 
 
 def _parse_month_index(values: pd.Series) -> pd.DatetimeIndex:
-    raw = values.astype(str).str.replace('"', "", regex=False).str.strip()
-    numeric_pattern = raw.str.fullmatch(r"\d{4}[-/]\d{2}")
-    if numeric_pattern.all():
-        normalized = raw.str.replace("/", "-", regex=False) + "-01"
-        parsed = pd.to_datetime(normalized, format="%Y-%m-%d", errors="raise")
-        return pd.DatetimeIndex(parsed).to_period("M").to_timestamp(how="start")
-
-    normalized = raw.str.replace(
-        r"^(\d{4})/([A-Za-z]{3,})$",
-        lambda match: f"{match.group(1)}/{MONTH_ALIAS_MAP.get(match.group(2)[:3].upper(), match.group(2)[:3].title())}",
-        regex=True,
-    )
-    parsed = pd.to_datetime(normalized, format="%Y/%b", errors="raise")
-    return pd.DatetimeIndex(parsed).to_period("M").to_timestamp(how="start")
+    codes, labels = pd.factorize(values.to_numpy(dtype=object))
+    raw = [str(label).replace('"', "").strip() for label in labels]
+    numeric = bool((codes >= 0).all()) and all(NUMERIC_MONTH_PATTERN.fullmatch(label) for label in raw)
+    parse_label = _numeric_month_ordinal if numeric else _named_month_ordinal
+    ordinals = np.fromiter((parse_label(label) for label in raw), dtype=np.int64, count=len(raw))
+
+    months = np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[M]")
+    present = codes >= 0
+    months[present] = (ordinals[codes[present]] - 1970 * 12).astype("datetime64[M]")
+    return pd.DatetimeIndex(months.astype("datetime64[us]"), name=values.name)
+
+
+@lru_cache(maxsize=MONTH_LABEL_CACHE_SIZE)
+def _numeric_month_ordinal(label: str) -> int:
+    year, month = int(label[:4]), int(label[5:])
+    if not 1 <= month <= 12:
+        raise ValueError(f'Month label "{label}" has an invalid month number.')
+    return year * 12 + month - 1
+
+
+@lru_cache(maxsize=MONTH_LABEL_CACHE_SIZE)
+def _named_month_ordinal(label: str) -> int:
+    month_match = NAMED_MONTH_PATTERN.fullmatch(label)
+    month = MONTH_NUMBER_MAP.get(month_match.group(2)[:3].upper()) if month_match else None
+    if month is None:
+        raise ValueError(f'Month label "{label}" is not recognized as YYYY/Mon or YYYY-MM.')
+    return int(month_match.group(1)) * 12 + month - 1  # type: ignore[union-attr]
 
 
 def _to_numeric(values: pd.Series) -> pd.Series:
-    cleaned = values.astype(str).str.replace('"', "", regex=False).str.strip()
-    normalized = cleaned.map(_normalize_numeric_text)
-    return pd.to_numeric(normalized, errors="coerce").fillna(0.0).astype(float)
+    codes, uniques = pd.factorize(values.astype(str))
+    parsed, integral = _parse_numeric_text(np.asarray(uniques, dtype=object))
+
+    numeric = np.full(len(codes), np.nan)
+    present = codes >= 0
+    numeric[present] = parsed[codes[present]]
+    if integral and present.all():
+        # pd.to_numeric yields int64 for all-integer columns, which turns "-0" into 0.0.
+        numeric += 0.0
+    return pd.Series(numeric, index=values.index, name=values.name, dtype=float).fillna(0.0)
+
+
+def _parse_numeric_text(texts: np.ndarray) -> Tuple[np.ndarray, bool]:
+    # Vectorized equivalent of pd.to_numeric(cleaned.map(_normalize_numeric_text), errors="coerce").
+    parsed = np.full(len(texts), np.nan)
+    integral = True
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    fallback = [np.flatnonzero((lengths == 0) | (lengths > NUMERIC_GRID_WIDTH))]
+    gridded = np.flatnonzero((lengths > 0) & (lengths <= NUMERIC_GRID_WIDTH))
+
+    for offset in range(0, len(gridded), NUMERIC_GRID_ROWS):
+        rows = gridded[offset:offset + NUMERIC_GRID_ROWS]
+        values, unresolved, chunk_integral = _parse_numeric_grid(texts[rows])
+        parsed[rows] = values
+        fallback.append(rows[unresolved])
+        integral = integral and chunk_integral
+
+    remaining = np.concatenate(fallback)
+    if len(remaining):
+        cleaned = pd.Series(texts[remaining], dtype=object).str.replace('"', "", regex=False).str.strip()
+        converted = pd.to_numeric(cleaned.map(_normalize_numeric_text), errors="coerce")
+        parsed[remaining] = converted.to_numpy(dtype=float)
+        integral = integral and converted.dtype.kind in "iu"
+    return parsed, integral
+
+
+def _parse_numeric_grid(texts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    # Cells are laid out column-major (character position x row) so every reduction is a vector op.
+    chars = np.asarray(texts, dtype=str)
+    width = chars.dtype.itemsize // 4
+    codepoints = np.ascontiguousarray(chars.view(np.uint32).reshape(len(texts), width).T)
+    ascii_rows = (codepoints < 128).all(axis=0)
+    grid = np.where(ascii_rows, codepoints, 0).astype(np.uint8)
+    positions = np.arange(width)[:, None]
+
+    is_digit = (grid >= 48) & (grid <= 57)
+    is_comma = grid == 44
+    is_dot = grid == 46
+    is_sign_char = (grid == 43) | (grid == 45)
+    content = ~((grid == 32) | (grid == 34) | (grid == 0))
+    simple = ascii_rows & ~(content & ~(is_digit | is_comma | is_dot | is_sign_char)).any(axis=0)
+    simple &= content.any(axis=0)
+
+    first = np.argmax(content, axis=0)
+    last = width - 1 - np.argmax(content[::-1], axis=0)
+    simple &= ~((grid == 32) & (positions > first) & (positions < last)).any(axis=0)
+    is_sign = is_sign_char & (positions == first)
+    simple &= ~(is_sign_char & ~is_sign).any(axis=0)
+
+    last_comma = np.where(is_comma, positions, -1).max(axis=0)
+    last_dot = np.where(is_dot, positions, -1).max(axis=0)
+    has_comma = last_comma >= 0
+    has_dot = last_dot >= 0
+    tail_length = (content & (positions > np.maximum(last_comma, last_dot))).sum(axis=0)
+    decimal_tail = (tail_length >= 1) & (tail_length <= 2)
+
+    comma_only = has_comma & ~has_dot
+    dot_only = has_dot & ~has_comma
+    drop = is_dot & (has_comma & (last_comma > last_dot))
+    drop |= is_comma & (has_dot & (last_comma < last_dot))
+    drop |= is_comma & comma_only
+    drop |= is_dot & (dot_only & ~decimal_tail)
+    comma_decimal = np.flatnonzero(comma_only & decimal_tail)
+    drop[last_comma[comma_decimal], comma_decimal] = False
+
+    kept = content & ~drop
+    decimal = (kept & (is_comma | is_dot)).any(axis=0)
+    digit_count = is_digit.sum(axis=0)
+    integer = simple & ~decimal & (digit_count > 0) & (digit_count <= NUMERIC_EXACT_DIGITS)
+
+    magnitude = np.zeros(len(texts))
+    for position in range(width):
+        magnitude = np.where(is_digit[position], magnitude * 10 + (grid[position] - 48.0), magnitude)
+    negative = (is_sign & (grid == 45)).any(axis=0)
+    values = np.full(len(texts), np.nan)
+    values[integer] = np.where(negative, -magnitude, magnitude)[integer]
+
+    decimal_rows = np.flatnonzero(simple & decimal)
+    if len(decimal_rows):
+        normalized = np.where(is_comma, 46, codepoints)[:, decimal_rows].T
+        row_kept = kept[:, decimal_rows].T
+        order = np.argsort(~row_kept, axis=1, kind="stable")
+        compact = np.take_along_axis(np.where(row_kept, normalized, 0), order, axis=1)
+        strings = np.ascontiguousarray(compact, dtype=np.uint32).view(f"<U{width}").ravel()
+        values[decimal_rows] = pd.to_numeric(pd.Series(strings, dtype=object), errors="coerce").to_numpy(dtype=float)
+
+    unresolved = ~simple | (~decimal & (digit_count > NUMERIC_EXACT_DIGITS))
+    return values, unresolved, bool(integer[~unresolved].all())
 
 
 def _normalize_numeric_text(value: str) -> str:
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from statistics import NormalDist
+from typing import Tuple
+
+import numpy as np
+
+from .time_series import TimeSeries
+
+ETS_ALPHAS = np.linspace(0.05, 0.95, 19)
+ETS_BETA_RATIOS = np.linspace(0.0, 1.0, 11)
+ETS_DAMPING = np.asarray([0.8, 0.85, 0.9, 0.95, 0.98])
+
+
+def forecast_drift_log(
+    series_log: TimeSeries,
+    periods: int,
+    confidence: float,
+    season_length: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    values = series_log.values
+    n_obs = len(values)
+    horizon = np.arange(1, int(periods) + 1, dtype=float)
+    if n_obs < 2:
+        return _with_interval(np.full(len(horizon), values[-1]), np.zeros(len(horizon)), confidence)
+
+    slope = (values[-1] - values[0]) / (n_obs - 1)
+    residuals = np.diff(values) - slope
+    sigma2 = float(residuals @ residuals / max(n_obs - 2, 1))
+    # Random walk with drift: the estimated slope adds h^2 / (n - 1) to the h-step variance.
+    variance = sigma2 * horizon * (1 + horizon / (n_obs - 1))
+    return _with_interval(values[-1] + slope * horizon, variance, confidence)
+
+
+def forecast_seasonal_naive_log(
+    series_log: TimeSeries,
+    periods: int,
+    confidence: float,
+    season_length: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    values = series_log.values
+    season = int(season_length) if 1 < int(season_length) <= len(values) else 1
+    steps = np.arange(int(periods))
+    cycles = steps // season + 1
+    forecast = values[len(values) - season + steps % season]
+
+    residuals = values[season:] - values[:-season]
+    sigma2 = float(residuals @ residuals / len(residuals)) if len(residuals) else 0.0
+    return _with_interval(forecast, sigma2 * cycles, confidence)
+
+
+def forecast_damped_ets_log(
+    series_log: TimeSeries,
+    periods: int,
+    confidence: float,
+    season_length: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    values = series_log.values
+    if len(values) < 3:
+        return forecast_drift_log(series_log, periods, confidence, season_length)
+
+    # ETS(A,Ad,N) in error-correction form, with every (alpha, beta, phi) on the grid filtered in one pass.
+    alpha, beta_ratio, phi = (grid.ravel() for grid in np.meshgrid(ETS_ALPHAS, ETS_BETA_RATIOS, ETS_DAMPING))
+    beta = alpha * beta_ratio
+    level = np.full(len(alpha), values[0])
+    trend = np.full(len(alpha), values[1] - values[0])
+    sse = np.zeros(len(alpha))
+    for value in values[1:]:
+        error = value - (level + phi * trend)
+        sse += error * error
+        level = level + phi * trend + alpha * error
+        trend = phi * trend + beta * error
+
+    best = int(np.argmin(sse))
+    horizon = np.arange(1, int(periods) + 1)
+    damping_sums = np.cumsum(phi[best] ** horizon)
+    forecast = level[best] + damping_sums * trend[best]
+
+    sigma2 = float(sse[best] / max(len(values) - 4, 1))
+    weights = alpha[best] + beta[best] * damping_sums[:-1]
+    variance = sigma2 * (1 + np.concatenate([[0.0], np.cumsum(weights**2)]))
+    return _with_interval(forecast, variance, confidence)
+
+
+def _with_interval(forecast: np.ndarray, variance: np.ndarray, confidence: float) -> Tuple[np.ndarray, np.ndarray]:
+    spread = NormalDist().inv_cdf(0.5 + confidence / 2) * np.sqrt(np.maximum(variance, 0.0))
+    forecast = np.asarray(forecast, dtype=float)
+    return forecast, np.column_stack([forecast - spread, forecast + spread])
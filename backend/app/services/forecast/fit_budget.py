@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from ...config import FORECAST_FIT_BUDGET_SECONDS, FORECAST_FIT_BUDGETS
+
+
+class FitBudgetExceeded(ValueError):
+    # A ValueError so pmdarima's stepwise search drops the interrupted candidate and keeps the best one fitted so far.
+    pass
+
+
+@dataclass(frozen=True)
+class FitBudget:
+    deadline: float
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() > self.deadline
+
+
+_active_budget: ContextVar[Optional[FitBudget]] = ContextVar("fit_budget", default=None)
+
+
+def fit_budget_seconds(model_name: str, frequency: str) -> float:
+    return FORECAST_FIT_BUDGETS.get(
+        f"{model_name}.{frequency}",
+        FORECAST_FIT_BUDGETS.get(model_name, FORECAST_FIT_BUDGET_SECONDS),
+    )
+
+
+def fit_deadline(seconds: float) -> float:
+    return time.monotonic() + seconds if seconds > 0 else math.inf
+
+
+@contextmanager
+def fit_budget(seconds: float) -> Iterator[FitBudget]:
+    with fit_budget_until(fit_deadline(seconds)) as budget:
+        yield budget
+
+
+@contextmanager
+def fit_budget_until(deadline: float) -> Iterator[FitBudget]:
+    # Context variables do not reach pool workers, so fits shipped there carry their deadline explicitly. The
+    # monotonic clock is system-wide on Linux, so the same deadline holds in every worker process.
+    budget = FitBudget(deadline=deadline)
+    token = _active_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
+
+
+def fit_budget_expired() -> bool:
+    budget = _active_budget.get()
+    return budget is not None and budget.expired
+
+
+def check_fit_budget(*_: Any) -> None:
+    if fit_budget_expired():
+        raise FitBudgetExceeded("The model fit exceeded its time budget.")
+
+
+def budget_fit_args() -> Dict[str, Any]:
+    # Optimizer callbacks run once per iteration, so an expired budget interrupts even a single slow candidate.
+    budget = _active_budget.get()
+    if budget is None or math.isinf(budget.deadline):
+        return {}
+    return {"callback": check_fit_budget}
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import suppress
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from ...config import (
+    FORECAST_ENGINE_VERSION,
+    FORECAST_MODEL_CACHE_DIR,
+    FORECAST_MODEL_CACHE_DISK_MB,
+    FORECAST_MODEL_CACHE_MB,
+)
+from .fit_budget import fit_budget_expired
+
+DIGEST_BYTES = hashlib.sha256().digest_size
+
+logger = logging.getLogger(__name__)
+
+
+class FittedModelCache:
+    def __init__(
+        self,
+        max_bytes: int,
+        directory: Optional[Path] = None,
+        max_disk_bytes: int = 0,
+        version: str = FORECAST_ENGINE_VERSION,
+    ) -> None:
+        self.max_bytes = int(max_bytes)
+        self.directory = directory
+        # The disk tier is capped separately; 0 leaves it unbounded.
+        self.max_disk_bytes = int(max_disk_bytes)
+        self.version = version
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            stored = path.read_bytes()
+        except OSError:
+            return None
+        # The digest drops truncated or corrupted files; it is not a signature. Anyone who can write the directory can
+        # write a file that is unpickled here, so FORECAST_MODEL_CACHE_DIR must be writable only by this service.
+        digest, payload = stored[:DIGEST_BYTES], stored[DIGEST_BYTES:]
+        try:
+            if hashlib.sha256(payload).digest() != digest:
+                raise ValueError("digest mismatch")
+            model = pickle.loads(payload)
+        except Exception:
+            with suppress(OSError):
+                path.unlink(missing_ok=True)
+            return None
+        # The modification time orders the disk tier for eviction, so a hit refreshes it.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, model, len(payload))
+        return model
+
+    def put(self, key: str, model: Any) -> None:
+        try:
+            payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        self._remember(key, model, len(payload))
+
+        if self.directory is not None:
+            # The disk tier is best effort: a full or read-only directory must not fail the forecast that was fitted.
+            try:
+                self._write(key, payload)
+            except OSError as exc:
+                logger.warning("Could not store fitted model %s in %s: %s", key, self.directory, exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _write(self, key: str, payload: bytes) -> None:
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # A unique temporary file per write, so threads storing the same key never write into each other's file.
+        with tempfile.NamedTemporaryFile(dir=self.directory, prefix=f".{key}.", suffix=".tmp", delete=False) as temporary:
+            temporary_path = Path(temporary.name)
+            temporary.write(hashlib.sha256(payload).digest() + payload)
+        try:
+            temporary_path.replace(self._path(key))
+        except OSError:
+            with suppress(OSError):
+                temporary_path.unlink()
+            raise
+        self._trim_directory()
+
+    def _path(self, key: str) -> Path:
+        # Files from other engine versions never match and age out of the disk tier first.
+        return self.directory / f"{self.version}-{key}.pkl"
+
+    def _trim_directory(self) -> None:
+        if self.max_disk_bytes <= 0:
+            return
+        files = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def _remember(self, key: str, model: Any, size_bytes: int) -> None:
+        if size_bytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            self._entries[key] = (model, size_bytes)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+
+_model_cache: Optional[FittedModelCache] = None
+_model_cache_lock = Lock()
+
+
+def get_model_cache() -> FittedModelCache:
+    global _model_cache
+    if _model_cache is not None:
+        return _model_cache
+
+    with _model_cache_lock:
+        if _model_cache is None:
+            directory = Path(FORECAST_MODEL_CACHE_DIR) if FORECAST_MODEL_CACHE_DIR else None
+            _model_cache = FittedModelCache(
+                int(FORECAST_MODEL_CACHE_MB * 1024 * 1024),
+                directory,
+                max_disk_bytes=int(FORECAST_MODEL_CACHE_DISK_MB * 1024 * 1024),
+            )
+        return _model_cache
+
+
+def fitted_model_key(kind: str, values: np.ndarray, settings: Dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"kind": kind, **settings}, sort_keys=True).encode("utf-8"))
+    digest.update(np.ascontiguousarray(values, dtype="<f8").tobytes())
+    return digest.hexdigest()
+
+
+def cached_fit(kind: str, values: np.ndarray, settings: Dict[str, Any], fit: Callable[[], Any]) -> Any:
+    cache = get_model_cache()
+    key = fitted_model_key(kind, values, settings)
+    model = cache.get(key)
+    if model is None:
+        model = fit()
+        # A fit that ran past its budget may be a truncated search, so it is not reused by later requests.
+        if not fit_budget_expired():
+            cache.put(key, model)
+    return model
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from statistics import NormalDist
+from typing import List, Tuple
+
+import numpy as np
+
+from .fit_budget import check_fit_budget
+
+MAX_NATIVE_ORDER = 3
+MAX_DIFFERENCES = 2
+KPSS_CRITICAL_VALUE = 0.463
+LM_ITERATIONS = 25
+LM_TOLERANCE = 1e-6
+ROOT_MARGIN = 0.99
+
+STATE_SIZE = MAX_NATIVE_ORDER + 1
+PARAMETER_WIDTH = 1 + 2 * MAX_NATIVE_ORDER
+
+
+@dataclass(frozen=True, eq=False)
+class NativeArima:
+    order: Tuple[int, int, int]
+    with_intercept: bool
+    ar: np.ndarray
+    ma: np.ndarray
+    intercept: float
+    sigma2: float
+    aicc: float
+    history: np.ndarray
+    next_state: np.ndarray
+
+    @property
+    def seasonal_order(self) -> Tuple[int, int, int, int]:
+        return (0, 0, 0, 0)
+
+    def predict(
+        self,
+        n_periods: int,
+        return_conf_int: bool = True,
+        alpha: float = 0.05,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        periods = int(n_periods)
+        _, differences, _ = self.order
+        transition = _transition_matrices(_pad(self.ar)[None, :])[0]
+        mean = _process_mean(self.intercept, self.ar)
+
+        forecast = np.empty(periods)
+        state = self.next_state
+        for step in range(periods):
+            forecast[step] = mean + state[0]
+            state = transition @ state
+
+        for level in reversed(_difference_levels(self.history, differences)[:-1]):
+            forecast = level[-1] + np.cumsum(forecast)
+
+        psi = _psi_weights(_integrated_ar(self.ar, differences), self.ma, periods)
+        spread = NormalDist().inv_cdf(1 - alpha / 2) * np.sqrt(self.sigma2 * np.cumsum(psi**2))
+        return forecast, np.column_stack([forecast - spread, forecast + spread])
+
+
+def search_native_arima(values: np.ndarray, max_order: int) -> NativeArima:
+    history = np.asarray(values, dtype=float)
+    differences = select_differences(history)
+    limit = max(0, min(int(max_order), MAX_NATIVE_ORDER))
+    candidates = list(product(range(limit + 1), range(limit + 1)))
+    fits = [fit for fit in _fit_candidates(history, differences, candidates, differences < 2) if np.isfinite(fit.aicc)]
+    if not fits:
+        raise ValueError("No ARIMA candidate could be fitted to the series.")
+    return min(fits, key=lambda fit: (fit.aicc, sum(fit.order)))
+
+
+def fit_native_arima(values: np.ndarray, order: Tuple[int, int, int], with_intercept: bool) -> NativeArima:
+    p, differences, q = (int(value) for value in order)
+    if max(p, q) > MAX_NATIVE_ORDER:
+        raise ValueError(f"Native ARIMA supports orders up to {MAX_NATIVE_ORDER}.")
+    fits = _fit_candidates(np.asarray(values, dtype=float), differences, [(p, q)], with_intercept)
+    if not fits:
+        raise ValueError(f"ARIMA{(p, differences, q)} could not be fitted to the series.")
+    return fits[0]
+
+
+def select_differences(values: np.ndarray) -> int:
+    # Mirrors pmdarima's ndiffs with a 5% KPSS level-stationarity test.
+    series = np.asarray(values, dtype=float)
+    differences = 0
+    while differences < MAX_DIFFERENCES and not _is_constant(series) and _kpss_statistic(series) > KPSS_CRITICAL_VALUE:
+        differences += 1
+        series = np.diff(series)
+    return differences
+
+
+def _fit_candidates(
+    history: np.ndarray,
+    differences: int,
+    candidates: List[Tuple[int, int]],
+    with_intercept: bool,
+) -> List[NativeArima]:
+    differenced = np.diff(history, n=differences)
+    observations = len(differenced)
+    if observations < 2:
+        return []
+
+    # Every candidate shares one padded parameter layout [intercept, ar_1..ar_3, ma_1..ma_3]; the mask zeroes unused lags.
+    ar_orders = np.asarray([p for p, _ in candidates])
+    ma_orders = np.asarray([q for _, q in candidates])
+    lags = np.arange(1, MAX_NATIVE_ORDER + 1)
+    mask = np.zeros((len(candidates), PARAMETER_WIDTH))
+    mask[:, 0] = float(with_intercept)
+    mask[:, 1 : 1 + MAX_NATIVE_ORDER] = lags <= ar_orders[:, None]
+    mask[:, 1 + MAX_NATIVE_ORDER :] = lags <= ma_orders[:, None]
+
+    params = _initial_parameters(differenced, ar_orders, with_intercept) * mask
+    explosive = ~_is_admissible(params)
+    params[explosive] = 0.0
+    params[explosive, 0] = differenced.mean() if with_intercept else 0.0
+    params = _maximize_likelihood(differenced, params, mask)
+
+    innovations, variances, next_states = _kalman_filter(differenced, params)
+    sigma2 = (innovations**2 / variances).mean(axis=1)
+    loglike = -0.5 * (observations * (np.log(2 * np.pi * sigma2) + 1) + np.log(variances).sum(axis=1))
+    parameter_count = mask.sum(axis=1) + 1
+    slack = observations - parameter_count - 1
+    with np.errstate(divide="ignore"):
+        aicc = np.where(
+            slack > 0,
+            -2 * loglike + 2 * parameter_count + 2 * parameter_count * (parameter_count + 1) / np.maximum(slack, 1),
+            np.inf,
+        )
+    valid = _is_admissible(params) & (sigma2 > 0) & np.isfinite(loglike)
+
+    return [
+        NativeArima(
+            order=(candidates[index][0], differences, candidates[index][1]),
+            with_intercept=bool(with_intercept),
+            ar=params[index, 1 : 1 + candidates[index][0]].copy(),
+            ma=params[index, 1 + MAX_NATIVE_ORDER : 1 + MAX_NATIVE_ORDER + candidates[index][1]].copy(),
+            intercept=float(params[index, 0]),
+            sigma2=float(sigma2[index]),
+            aicc=float(aicc[index]),
+            history=history,
+            next_state=next_states[index].copy(),
+        )
+        for index in np.flatnonzero(valid)
+    ]
+
+
+def _initial_parameters(differenced: np.ndarray, ar_orders: np.ndarray, with_intercept: bool) -> np.ndarray:
+    # Conditional least squares for the AR part; MA terms start at zero and are refined jointly.
+    params = np.zeros((len(ar_orders), PARAMETER_WIDTH))
+    offset = 0 if with_intercept else 1
+    for p in np.unique(ar_orders):
+        target = differenced[p:]
+        columns = [differenced[p - lag : len(differenced) - lag] for lag in range(1, p + 1)]
+        if with_intercept:
+            columns.insert(0, np.ones(len(target)))
+        if not columns or len(target) <= len(columns):
+            continue
+        coefficients, *_ = np.linalg.lstsq(np.column_stack(columns), target, rcond=None)
+        params[ar_orders == p, offset : offset + len(coefficients)] = coefficients
+    return params
+
+
+def _maximize_likelihood(differenced: np.ndarray, params: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    # Batched Levenberg-Marquardt on the concentrated Gaussian likelihood written as a sum of squares.
+    params = params.copy()
+    identity = np.eye(PARAMETER_WIDTH)
+    damping = np.full(len(params), 1e-3)
+    residuals = _likelihood_residuals(differenced, params)
+    sums = np.einsum("ij,ij->i", residuals, residuals)
+    active = np.arange(len(params))
+    for _ in range(LM_ITERATIONS):
+        # Checked once per iteration, like the optimizer callback pmdarima fits receive.
+        check_fit_budget()
+        current, current_mask = params[active], mask[active]
+        count = len(active)
+        step_size = 1e-6 * np.maximum(np.abs(current), 1.0) * current_mask
+        shifted = current[:, None, :] + identity[None, :, :] * step_size[:, None, :]
+        shifted_residuals = _likelihood_residuals(differenced, shifted.reshape(-1, PARAMETER_WIDTH))
+        shifted_residuals = shifted_residuals.reshape(count, PARAMETER_WIDTH, -1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            jacobian = (shifted_residuals - residuals[active][:, None, :]) / step_size[:, :, None]
+        jacobian = np.nan_to_num(np.swapaxes(jacobian, 1, 2) * current_mask[:, None, :])
+
+        normal = np.swapaxes(jacobian, 1, 2) @ jacobian
+        gradient = np.einsum("tnk,tn->tk", jacobian, residuals[active])
+        diagonal = np.einsum("tkk->tk", normal)
+        system = normal + (damping[active, None] * diagonal + 1e-12 + (1 - current_mask))[:, :, None] * identity
+        step = -np.linalg.solve(system, gradient[:, :, None])[:, :, 0] * current_mask
+
+        candidate = current + step
+        candidate_residuals = _likelihood_residuals(differenced, candidate)
+        candidate_sums = np.einsum("ij,ij->i", candidate_residuals, candidate_residuals)
+        improved = (candidate_sums < sums[active]) & _is_admissible(candidate)
+        converged = improved & (sums[active] - candidate_sums <= LM_TOLERANCE * sums[active])
+
+        accepted = active[improved]
+        params[accepted] = candidate[improved]
+        residuals[accepted] = candidate_residuals[improved]
+        sums[accepted] = candidate_sums[improved]
+        damping[active] = np.where(improved, damping[active] / 10, damping[active] * 10)
+        active = active[~converged & (damping[active] <= 1e8)]
+        if not len(active):
+            break
+    return params
+
+
+def _likelihood_residuals(differenced: np.ndarray, params: np.ndarray) -> np.ndarray:
+    # Minimizing sum(v_t^2 / F_t) * prod(F_t)^(1/n) is the same as maximizing the concentrated likelihood.
+    innovations, variances, _ = _kalman_filter(differenced, params)
+    scale = np.exp(np.log(variances).mean(axis=1) / 2)
+    return innovations / np.sqrt(variances) * scale[:, None]
+
+
+def _kalman_filter(differenced: np.ndarray, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The transition matrix is a companion matrix, so T x is the AR column times x_0 plus x shifted up by one.
+    count, observations = len(params), len(differenced)
+    ar = _pad(params[:, 1 : 1 + MAX_NATIVE_ORDER])
+    loading = np.concatenate([np.ones((count, 1)), params[:, 1 + MAX_NATIVE_ORDER :]], axis=1)
+    noise = loading[:, :, None] * loading[:, None, :]
+    centered = differenced[None, :] - _process_mean(params[:, 0], ar)[:, None]
+
+    # Stationary initial covariance from the batched discrete Lyapunov equation P = T P T' + R R'.
+    transition = _transition_matrices(ar)
+    kron = np.einsum("bij,bkl->bikjl", transition, transition).reshape(count, STATE_SIZE**2, STATE_SIZE**2)
+    with np.errstate(all="ignore"):
+        covariance = np.linalg.solve(np.eye(STATE_SIZE**2) - kron, noise.reshape(count, -1, 1)).reshape(noise.shape)
+    state = np.zeros((count, STATE_SIZE))
+
+    innovations = np.empty((count, observations))
+    variances = np.empty((count, observations))
+    with np.errstate(all="ignore"):
+        for step in range(observations):
+            variance = np.maximum(covariance[:, 0, 0], 1e-12)
+            innovation = centered[:, step] - state[:, 0]
+            gain = _shift(covariance[:, :, 0], ar, covariance[:, 0, 0], axis=1) / variance[:, None]
+            state = _shift(state, ar, state[:, 0], axis=1) + gain * innovation[:, None]
+            propagated = _shift(covariance, ar[:, :, None], covariance[:, 0, :], axis=1)
+            propagated = _shift(propagated, ar[:, None, :], propagated[:, :, 0], axis=2)
+            covariance = propagated - variance[:, None, None] * gain[:, :, None] * gain[:, None, :] + noise
+            innovations[:, step] = innovation
+            variances[:, step] = variance
+    return innovations, variances, state
+
+
+def _shift(values: np.ndarray, ar: np.ndarray, head: np.ndarray, axis: int) -> np.ndarray:
+    shifted = np.zeros_like(values)
+    if axis == 1:
+        shifted[:, :-1] = values[:, 1:]
+        return shifted + ar * head[:, None] if values.ndim == 2 else shifted + ar * head[:, None, :]
+    shifted[:, :, :-1] = values[:, :, 1:]
+    return shifted + ar * head[:, :, None]
+
+
+def _transition_matrices(ar: np.ndarray) -> np.ndarray:
+    transition = np.zeros((len(ar), STATE_SIZE, STATE_SIZE))
+    transition[:, :, 0] = ar
+    transition[:, np.arange(STATE_SIZE - 1), np.arange(1, STATE_SIZE)] = 1.0
+    return transition
+
+
+def _pad(ar: np.ndarray) -> np.ndarray:
+    return np.concatenate([ar, np.zeros(ar.shape[:-1] + (STATE_SIZE - ar.shape[-1],))], axis=-1)
+
+
+def _process_mean(intercept, ar: np.ndarray):
+    return intercept / (1.0 - np.sum(ar, axis=-1))
+
+
+def _is_admissible(params: np.ndarray) -> np.ndarray:
+    ar, ma = params[:, 1 : 1 + MAX_NATIVE_ORDER], params[:, 1 + MAX_NATIVE_ORDER :]
+    return (_largest_root(ar) < ROOT_MARGIN) & (_largest_root(-ma) < ROOT_MARGIN)
+
+
+def _largest_root(coefficients: np.ndarray) -> np.ndarray:
+    count, width = coefficients.shape
+    companion = np.zeros((count, width, width))
+    companion[:, 0, :] = coefficients
+    companion[:, np.arange(1, width), np.arange(width - 1)] = 1.0
+    return np.abs(np.linalg.eigvals(companion)).max(axis=1)
+
+
+def _difference_levels(values: np.ndarray, differences: int) -> List[np.ndarray]:
+    levels = [np.asarray(values, dtype=float)]
+    for _ in range(differences):
+        levels.append(np.diff(levels[-1]))
+    return levels
+
+
+def _integrated_ar(ar: np.ndarray, differences: int) -> np.ndarray:
+    polynomial = np.concatenate([[1.0], -np.asarray(ar, dtype=float)])
+    for _ in range(differences):
+        polynomial = np.convolve(polynomial, [1.0, -1.0])
+    return -polynomial[1:]
+
+
+def _psi_weights(ar: np.ndarray, ma: np.ndarray, count: int) -> np.ndarray:
+    psi = np.zeros(count)
+    psi[0] = 1.0
+    for step in range(1, count):
+        value = ma[step - 1] if step <= len(ma) else 0.0
+        for lag in range(1, min(step, len(ar)) + 1):
+            value += ar[lag - 1] * psi[step - lag]
+        psi[step] = value
+    return psi
+
+
+def _kpss_statistic(values: np.ndarray) -> float:
+    observations = len(values)
+    residuals = values - values.mean()
+    partial_sums = np.cumsum(residuals)
+    lags = int(np.trunc(4 * (observations / 100) ** 0.25))
+    variance = residuals @ residuals / observations
+    for lag in range(1, lags + 1):
+        variance += 2 * (1 - lag / (lags + 1)) * (residuals[lag:] @ residuals[:-lag]) / observations
+    if variance <= 0:
+        return 0.0
+    return float(partial_sums @ partial_sums / (observations**2 * variance))
+
+
+def _is_constant(values: np.ndarray) -> bool:
+    return bool(len(values) == 0 or np.all(values == values[0]))
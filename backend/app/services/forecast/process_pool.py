@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from ...config import FORECAST_WORKERS
+from .arima_forecaster import load_pmdarima
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = Lock()
+# Set in pool workers, whose own fits run inline instead of starting a nested pool.
+_in_worker = False
+
+
+def get_forecast_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if FORECAST_WORKERS <= 1 or _in_worker:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # Spawned workers never inherit the parent's DB connections, locks or BLAS thread state.
+            _executor = ProcessPoolExecutor(
+                max_workers=FORECAST_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+            )
+        return _executor
+
+
+def _initialize_worker() -> None:
+    global _in_worker
+    _in_worker = True
+    load_pmdarima()
+
+
+def shutdown_forecast_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def submit_fit(function: Callable[..., Any], *args: Any) -> Future:
+    executor = get_forecast_executor()
+    if executor is not None:
+        return executor.submit(function, *args)
+    return run_inline(function, *args)
+
+
+def run_inline(function: Callable[..., Any], *args: Any) -> Future:
+    future: Future = Future()
+    try:
+        future.set_result(function(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def completed_future(value: Any) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from ...config import FORECAST_MIN_SEASONAL_STRENGTH
+from .time_series import TimeSeries
+
+SEASON_LENGTHS = {"annual": 1, "monthly": 12}
+# The 95% white-noise bound of a sample autocorrelation is 1.96 / sqrt(n).
+ACF_CRITICAL_VALUE = 1.96
+
+
+@dataclass(frozen=True)
+class SeriesFeatures:
+    season_length: int
+    seasonal_strength: float
+    trend_strength: float
+    seasonal_acf: float
+    dominant_period: Optional[float]
+    period_detected: bool
+
+    @property
+    def seasonal(self) -> bool:
+        return self.period_detected and self.seasonal_strength >= FORECAST_MIN_SEASONAL_STRENGTH
+
+
+def compute_series_features(series: TimeSeries) -> SeriesFeatures:
+    # Classical decomposition of the log1p series the models are fitted on, with the Wang, Smith & Hyndman (2006)
+    # strengths: F = max(0, 1 - Var(remainder) / Var(component + remainder)).
+    season_length = SEASON_LENGTHS[series.frequency]
+    values = np.log1p(np.clip(series.values, 0, None))
+    weights = _trend_weights(season_length)
+    half = len(weights) // 2
+    if len(values) <= len(weights):
+        return SeriesFeatures(season_length, 0.0, 0.0, 0.0, None, False)
+
+    trend = np.convolve(values, weights, mode="valid")
+    detrended = values[half : len(values) - half] - trend
+    seasonal = np.zeros_like(detrended)
+    seasonal_ready = season_length > 1 and len(values) >= 2 * season_length
+    if seasonal_ready:
+        positions = (series.start + half + np.arange(len(detrended))) % season_length
+        means = np.bincount(positions, weights=detrended, minlength=season_length) / np.bincount(
+            positions, minlength=season_length
+        )
+        seasonal = (means - means.mean())[positions]
+    remainder = detrended - seasonal
+
+    if not seasonal_ready:
+        return SeriesFeatures(season_length, 0.0, _strength(remainder, trend + remainder), 0.0, None, False)
+    seasonal_acf, dominant_period, period_detected = _period_test(detrended, season_length)
+    return SeriesFeatures(
+        season_length=season_length,
+        seasonal_strength=_strength(remainder, detrended),
+        trend_strength=_strength(remainder, trend + remainder),
+        seasonal_acf=seasonal_acf,
+        dominant_period=dominant_period,
+        period_detected=period_detected,
+    )
+
+
+def _trend_weights(season_length: int) -> np.ndarray:
+    # A centred 2 x m moving average for even periods, a plain m (at least 3) average otherwise.
+    if season_length % 2:
+        width = max(season_length, 3)
+        return np.full(width, 1.0 / width)
+    weights = np.ones(season_length + 1)
+    weights[[0, -1]] = 0.5
+    return weights / season_length
+
+
+def _strength(remainder: np.ndarray, component: np.ndarray) -> float:
+    variance = float(np.var(component))
+    if variance <= 0:
+        return 0.0
+    return max(0.0, 1.0 - float(np.var(remainder)) / variance)
+
+
+def _period_test(detrended: np.ndarray, season_length: int) -> tuple[float, Optional[float], bool]:
+    # The period is accepted when the lag-m autocorrelation is significant and the periodogram peaks on the
+    # seasonal frequency or one of its harmonics.
+    centred = detrended - detrended.mean()
+    count = len(centred)
+    energy = float(centred @ centred)
+    if energy <= 0:
+        return 0.0, None, False
+    seasonal_acf = float(centred[season_length:] @ centred[:-season_length]) / energy
+
+    power = np.abs(np.fft.rfft(centred)[1:]) ** 2
+    peak = int(np.argmax(power)) + 1
+    harmonic = round(peak * season_length / count)
+    on_harmonic = harmonic >= 1 and abs(peak / count - harmonic / season_length) <= 0.5 / count
+    detected = seasonal_acf > ACF_CRITICAL_VALUE / np.sqrt(count) and on_harmonic
+    return seasonal_acf, count / peak, bool(detected)
@@ -1,159 +1,153 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from statistics import NormalDist
 from typing import Tuple
 
 import numpy as np
-import pandas as pd
 
-Z_TABLE = {
-    0.80: 1.2816,
-    0.85: 1.4395,
-    0.90: 1.6449,
-    0.95: 1.96,
-    0.97: 2.1701,
-    0.98: 2.3263,
-    0.99: 2.5758,
-}
+from .model_cache import cached_fit
+from .time_series import TimeSeries
+
+# 10% critical value of a chi2(1), the seasonality test used by the standard Theta method.
+SEASONALITY_CRITICAL_VALUE = 2.705543454095404
+ALPHA_GRID_POINTS = 101
+ALPHA_REFINEMENTS = 3
+
+
+@dataclass(frozen=True)
+class ThetaFit:
+    alpha: float
+    level: float
+    drift: float
+    n_obs: int
+    sigma2: float
+    seasonal: np.ndarray
+    multiplicative: bool
 
 
 def forecast_theta_log(
-    series_log: pd.Series,
-    periods: int,
-    confidence: float,
-    season_length: int,
-) -> Tuple[np.ndarray, np.ndarray]:
-    try:
-        from sktime.forecasting.base import ForecastingHorizon
-        from sktime.forecasting.theta import ThetaForecaster
-    except Exception:
-        return _forecast_theta_fallback(series_log, periods, confidence, season_length)
-
-    forecasting_horizon = ForecastingHorizon(np.arange(1, int(periods) + 1), is_relative=True)
-    forecaster = ThetaForecaster(sp=int(season_length))
-    forecaster.fit(series_log)
-    forecast_log = forecaster.predict(forecasting_horizon)
-
-    try:
-        interval_df = forecaster.predict_interval(forecasting_horizon, coverage=[confidence])
-        lower_column = None
-        upper_column = None
-        for column in interval_df.columns:
-            if isinstance(column, tuple):
-                if "lower" in column and lower_column is None:
-                    lower_column = column
-                if "upper" in column and upper_column is None:
-                    upper_column = column
-            else:
-                column_str = str(column).lower()
-                if "lower" in column_str and lower_column is None:
-                    lower_column = column
-                if "upper" in column_str and upper_column is None:
-                    upper_column = column
-        if lower_column is None or upper_column is None:
-            raise RuntimeError("Could not detect lower/upper interval columns from sktime output.")
-        interval_log = np.column_stack(
-            [np.asarray(interval_df[lower_column]), np.asarray(interval_df[upper_column])]
-        )
-        return np.asarray(forecast_log), interval_log
-    except Exception:
-        return _forecast_theta_fallback(series_log, periods, confidence, season_length)
-
-
-def _z_for_confidence(confidence: float) -> float:
-    options = sorted(Z_TABLE.keys())
-    nearest = min(options, key=lambda item: abs(item - confidence))
-    return Z_TABLE[nearest]
-
-
-def _forecast_theta_fallback(
-    series_log: pd.Series,
+    series_log: TimeSeries,
     periods: int,
     confidence: float,
     season_length: int,
 ) -> Tuple[np.ndarray, np.ndarray]:
-    values = pd.Series(series_log, dtype=float).dropna()
-    if values.empty:
-        raise RuntimeError("Theta fallback requires at least one observation.")
-
-    deseasonalized, seasonal_pattern = _deseasonalize(values, season_length)
-    ses_level, alpha = _fit_simple_exp_smoothing(deseasonalized.to_numpy(dtype=float))
-
-    n_obs = len(deseasonalized)
-    time_index = np.arange(1, n_obs + 1, dtype=float)
-    slope, intercept = np.polyfit(time_index, deseasonalized.to_numpy(dtype=float), 1) if n_obs > 1 else (0.0, float(deseasonalized.iloc[-1]))
-
-    forecasts = []
-    for step in range(1, int(periods) + 1):
-        theta_line = intercept + slope * (n_obs + step)
-        ses_component = ses_level
-        point = max((theta_line + ses_component) / 2, deseasonalized.iloc[-1] * 0.35)
-        point *= seasonal_pattern[(step - 1) % len(seasonal_pattern)]
-        forecasts.append(point)
-
-    point_values = np.asarray(forecasts, dtype=float)
-
-    fitted = _ses_fitted_values(deseasonalized.to_numpy(dtype=float), alpha)
-    residuals = deseasonalized.to_numpy(dtype=float) - fitted
-    sigma = max(float(np.nanstd(residuals)) if np.isfinite(residuals).any() else 0.0, 1e-6)
-    z_value = _z_for_confidence(confidence)
-    lower = []
-    upper = []
-    for step, value in enumerate(point_values, start=1):
-        band = z_value * sigma * np.sqrt(step)
-        seasonal = seasonal_pattern[(step - 1) % len(seasonal_pattern)]
-        lower.append(max(value - band * seasonal, 1e-9))
-        upper.append(value + band * seasonal)
-
-    return point_values, np.column_stack([np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)])
-
-
-def _fit_simple_exp_smoothing(values: np.ndarray) -> tuple[float, float]:
+    fit = cached_fit(
+        "theta",
+        series_log.values,
+        {"season_length": int(season_length)},
+        lambda: fit_theta(series_log.values, season_length),
+    )
+    return predict_theta(fit, periods, confidence)
+
+
+def fit_theta(series_log: np.ndarray, season_length: int) -> ThetaFit:
+    values = np.asarray(series_log, dtype=float)
+    values = values[~np.isnan(values)]
+    if not len(values):
+        raise RuntimeError("Theta requires at least one observation.")
+
+    adjusted, seasonal, multiplicative = _deseasonalize(values, int(season_length))
+    alpha, level, sse = _fit_simple_exp_smoothing(adjusted)
+    n_obs = len(adjusted)
+    drift = float(np.polyfit(np.arange(n_obs, dtype=float), adjusted, 1)[0]) if n_obs > 1 else 0.0
+    return ThetaFit(
+        alpha=alpha,
+        level=level,
+        drift=drift,
+        n_obs=n_obs,
+        sigma2=sse / (n_obs - 1) if n_obs > 1 else 0.0,
+        seasonal=seasonal,
+        multiplicative=multiplicative,
+    )
+
+
+def predict_theta(fit: ThetaFit, periods: int, confidence: float) -> Tuple[np.ndarray, np.ndarray]:
+    # Hyndman & Billah (2003): SES forecast plus half the linear-trend drift, corrected for the SES lag.
+    steps = np.arange(int(periods), dtype=float)
+    if fit.alpha > 0:
+        steps += 1 / fit.alpha - (1 - fit.alpha) ** fit.n_obs / fit.alpha
+    forecast = fit.level + 0.5 * fit.drift * steps
+
+    # SES is the local-level state-space model, so the h-step variance is sigma^2 * (1 + (h - 1) * alpha^2).
+    spread = NormalDist().inv_cdf(0.5 + confidence / 2) * np.sqrt(
+        fit.sigma2 * (1 + np.arange(int(periods)) * fit.alpha**2)
+    )
+    lower, upper = forecast - spread, forecast + spread
+
+    if len(fit.seasonal):
+        season = fit.seasonal[(fit.n_obs + np.arange(int(periods))) % len(fit.seasonal)]
+        if fit.multiplicative:
+            forecast, lower, upper = forecast * season, lower * season, upper * season
+        else:
+            forecast, lower, upper = forecast + season, lower + season, upper + season
+    return forecast, np.column_stack([lower, upper])
+
+
+def _fit_simple_exp_smoothing(values: np.ndarray) -> Tuple[float, float, float]:
+    # The level starts at the first observation; alpha is found by zooming a vectorized grid over [0, 1].
     if len(values) == 1:
-        return float(values[0]), 0.5
-
-    best_alpha = 0.5
-    best_level = float(values[0])
-    best_error = float("inf")
-    for alpha in np.linspace(0.1, 0.9, 17):
-        level = float(values[0])
-        error = 0.0
-        for value in values[1:]:
-            error += (float(value) - level) ** 2
-            level = alpha * float(value) + (1 - alpha) * level
-        if error < best_error:
-            best_error = error
-            best_alpha = float(alpha)
-            best_level = float(level)
-
-    return best_level, best_alpha
-
-
-def _ses_fitted_values(values: np.ndarray, alpha: float) -> np.ndarray:
-    fitted = np.empty_like(values, dtype=float)
-    level = float(values[0])
-    fitted[0] = level
-    for index in range(1, len(values)):
-        fitted[index] = level
-        level = alpha * float(values[index]) + (1 - alpha) * level
-    return fitted
-
-
-def _deseasonalize(series_log: pd.Series, season_length: int) -> tuple[pd.Series, np.ndarray]:
-    if season_length <= 1 or len(series_log) < season_length * 2:
-        return series_log.astype(float), np.ones(1, dtype=float)
-
-    pattern_values = np.ones(season_length, dtype=float)
-    usable = series_log.to_numpy(dtype=float)
-    groups = [[] for _ in range(season_length)]
-    for index, value in enumerate(usable):
-        groups[index % season_length].append(float(value))
-
-    overall_mean = float(np.mean(usable)) if len(usable) else 1.0
-    for index, group in enumerate(groups):
-        if group:
-            pattern_values[index] = max(float(np.mean(group)) / max(overall_mean, 1e-9), 1e-6)
-
-    pattern_values = pattern_values / np.mean(pattern_values)
-    adjusted = [float(value) / pattern_values[index % season_length] for index, value in enumerate(usable)]
-    return pd.Series(adjusted, index=series_log.index, dtype=float), pattern_values
-
+        return 0.5, float(values[0]), 0.0
+
+    low, high = 0.0, 1.0
+    for _ in range(ALPHA_REFINEMENTS + 1):
+        alphas = np.linspace(low, high, ALPHA_GRID_POINTS)
+        sse, levels = _ses_paths(values, alphas)
+        best = int(np.argmin(sse))
+        spacing = (high - low) / (ALPHA_GRID_POINTS - 1)
+        low, high = max(alphas[best] - spacing, 0.0), min(alphas[best] + spacing, 1.0)
+    return float(alphas[best]), float(levels[best]), float(sse[best])
+
+
+def _ses_paths(values: np.ndarray, alphas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    levels = np.full(len(alphas), values[0])
+    sse = np.zeros(len(alphas))
+    for value in values[1:]:
+        error = value - levels
+        sse += error * error
+        levels = levels + alphas * error
+    return sse, levels
+
+
+def _deseasonalize(values: np.ndarray, season_length: int) -> Tuple[np.ndarray, np.ndarray, bool]:
+    if season_length <= 1 or len(values) < season_length * 2 or not _has_seasonality(values, season_length):
+        return values, np.empty(0), False
+
+    multiplicative = bool(values.min() > 0)
+    seasonal = _classical_seasonal_indices(values, season_length, multiplicative)
+    if multiplicative and seasonal.min() <= 0:
+        multiplicative = False
+        seasonal = _classical_seasonal_indices(values, season_length, multiplicative)
+
+    pattern = seasonal[np.arange(len(values)) % season_length]
+    adjusted = values / pattern if multiplicative else values - pattern
+    return adjusted, seasonal, multiplicative
+
+
+def _has_seasonality(values: np.ndarray, season_length: int) -> bool:
+    centered = values - values.mean()
+    denominator = float(centered @ centered)
+    if denominator <= 0:
+        return False
+    autocorrelation = np.asarray(
+        [centered[lag:] @ centered[: len(centered) - lag] for lag in range(season_length + 1)]
+    ) / denominator
+    statistic = len(values) * autocorrelation[-1] ** 2 / np.sum(autocorrelation[:-1] ** 2)
+    return bool(statistic > SEASONALITY_CRITICAL_VALUE)
+
+
+def _classical_seasonal_indices(values: np.ndarray, season_length: int, multiplicative: bool) -> np.ndarray:
+    # Centred moving average (2 x m for even periods), then the mean detrended value per season position.
+    if season_length % 2 == 0:
+        weights = np.r_[0.5, np.ones(season_length - 1), 0.5] / season_length
+    else:
+        weights = np.ones(season_length) / season_length
+    half = len(weights) // 2
+    trend = np.full(len(values), np.nan)
+    trend[half : len(values) - half] = np.convolve(values, weights, mode="valid")
+
+    detrended = values / trend if multiplicative else values - trend
+    padded = np.full(-(-len(values) // season_length) * season_length, np.nan)
+    padded[: len(values)] = detrended
+    indices = np.nanmean(padded.reshape(-1, season_length), axis=0)
+    return indices / indices.mean() if multiplicative else indices - indices.mean()
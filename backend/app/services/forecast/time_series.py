@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Callable, List, Union
+
+import numpy as np
+import pandas as pd
+
+FREQUENCIES = ("annual", "monthly")
+
+
+class TimeSeries:
+    __slots__ = ("start", "frequency", "values")
+
+    def __init__(self, start: int, frequency: str, values: np.ndarray) -> None:
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unsupported series frequency: {frequency}")
+        self.start = int(start)
+        self.frequency = frequency
+        self.values = np.asarray(values, dtype=float)
+
+    @classmethod
+    def from_pandas(cls, series: pd.Series) -> "TimeSeries":
+        if series.empty:
+            raise ValueError("Series is empty.")
+
+        ordered = series.sort_index()
+        if isinstance(ordered.index, pd.DatetimeIndex):
+            frequency = "monthly"
+            ordinals = ordered.index.year.to_numpy() * 12 + ordered.index.month.to_numpy() - 1
+        else:
+            frequency = "annual"
+            ordinals = pd.Index(ordered.index).astype(int).to_numpy()
+
+        if not np.array_equal(ordinals, np.arange(ordinals[0], ordinals[0] + len(ordinals))):
+            raise ValueError("Series must have one observation per period with no gaps.")
+        return cls(int(ordinals[0]), frequency, ordered.to_numpy(dtype=float))
+
+    @classmethod
+    def from_period(cls, period: str, frequency: str, values: np.ndarray) -> "TimeSeries":
+        if frequency == "monthly":
+            year, month = period.split("-")
+            return cls(int(year) * 12 + int(month) - 1, frequency, values)
+        return cls(int(period), frequency, values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, window: slice) -> "TimeSeries":
+        if not isinstance(window, slice) or window.step not in (None, 1):
+            raise TypeError("TimeSeries only supports contiguous slices.")
+        offset, _, _ = window.indices(len(self.values))
+        return TimeSeries(self.start + offset, self.frequency, self.values[window])
+
+    def __repr__(self) -> str:
+        return f"TimeSeries(start={self.period_label(self.start)!r}, frequency={self.frequency!r}, points={len(self)})"
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.values) - 1
+
+    def map(self, function: Callable[[np.ndarray], np.ndarray]) -> "TimeSeries":
+        return TimeSeries(self.start, self.frequency, function(self.values))
+
+    def tail(self, count: int) -> np.ndarray:
+        return self.values[max(len(self.values) - int(count), 0):]
+
+    def trim_trailing_zeros(self, minimum_length: int = 4) -> "TimeSeries":
+        # Closed form of repeatedly dropping a trailing zero while an earlier value is positive.
+        values = self.values
+        if len(values) <= minimum_length:
+            return self
+        nonzero = np.flatnonzero(values != 0.0)
+        if not len(nonzero):
+            return self
+        keep = int(nonzero[-1]) + 1
+        if keep == len(values) or not (values[:keep] > 0.0).any():
+            return self
+        return self[: max(keep, minimum_length)]
+
+    def to_annual(self) -> "TimeSeries":
+        if self.frequency == "annual":
+            return self
+        first_year, first_month = divmod(self.start, 12)
+        padded = np.concatenate(
+            [np.zeros(first_month), self.values, np.zeros(11 - self.end % 12)]
+        )
+        return TimeSeries(first_year, "annual", padded.reshape(-1, 12).sum(axis=1))
+
+    def period_label(self, ordinal: int) -> Union[int, str]:
+        if self.frequency == "monthly":
+            year, month = divmod(int(ordinal), 12)
+            return f"{year:04d}-{month + 1:02d}"
+        return int(ordinal)
+
+    def period_labels(self, start: int | None = None, count: int | None = None) -> List[Union[int, str]]:
+        first = self.start if start is None else int(start)
+        total = len(self.values) if count is None else int(count)
+        return [self.period_label(ordinal) for ordinal in range(first, first + total)]
+
+    def future_labels(self, count: int) -> List[Union[int, str]]:
+        return self.period_labels(self.end + 1, count)
+
+    def to_pandas(self, period_index: bool = False) -> pd.Series:
+        if self.frequency == "monthly":
+            year, month = divmod(self.start, 12)
+            if period_index:
+                index: pd.Index = pd.period_range(f"{year:04d}-{month + 1:02d}", periods=len(self.values), freq="M")
+            else:
+                index = pd.date_range(f"{year:04d}-{month + 1:02d}-01", periods=len(self.values), freq="MS")
+        else:
+            index = pd.RangeIndex(self.start, self.start + len(self.values))
+        return pd.Series(self.values, index=index, name="value")
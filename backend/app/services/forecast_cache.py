@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..config import ARIMA_ENGINE, FORECAST_CACHE_MAX_ENTRIES, FORECAST_CACHE_TTL_HOURS, FORECAST_ENGINE_VERSION
+from ..models import ForecastCacheEntry, utcnow
+
+
+def build_forecast_cache_key(series_fingerprint: str, state_label: str, parameters: Dict[str, Any]) -> str:
+    payload = {
+        "engine_version": FORECAST_ENGINE_VERSION,
+        "arima_engine": ARIMA_ENGINE,
+        "series": series_fingerprint,
+        "state_label": state_label,
+        "parameters": parameters,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_cached_forecast(db: Session, cache_key: str) -> Optional[Dict[str, Any]]:
+    now = utcnow()
+    entry = db.get(ForecastCacheEntry, cache_key)
+    if entry is None or entry.expires_at <= now:
+        return None
+
+    entry.hit_count += 1
+    entry.last_used_at = now
+    db.commit()
+    return dict(entry.result_payload)
+
+
+def store_cached_forecast(db: Session, cache_key: str, result_payload: Dict[str, Any]) -> None:
+    now = utcnow()
+    expires_at = now + timedelta(hours=FORECAST_CACHE_TTL_HOURS)
+    statement = insert(ForecastCacheEntry).values(
+        cache_key=cache_key,
+        result_payload=result_payload,
+        hit_count=0,
+        created_at=now,
+        last_used_at=now,
+        expires_at=expires_at,
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[ForecastCacheEntry.cache_key],
+        set_={"result_payload": result_payload, "last_used_at": now, "expires_at": expires_at},
+    )
+    db.execute(statement)
+    _evict_forecast_cache(db, now)
+    db.commit()
+
+
+def _evict_forecast_cache(db: Session, now: datetime) -> None:
+    db.execute(delete(ForecastCacheEntry).where(ForecastCacheEntry.expires_at <= now))
+    overflow = (
+        select(ForecastCacheEntry.cache_key)
+        .order_by(ForecastCacheEntry.last_used_at.desc())
+        .offset(max(FORECAST_CACHE_MAX_ENTRIES, 1))
+        .scalar_subquery()
+    )
+    db.execute(delete(ForecastCacheEntry).where(ForecastCacheEntry.cache_key.in_(overflow)))
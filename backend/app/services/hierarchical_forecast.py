@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .forecast.csv_loader import DatasetSource, StateMatrix, load_state_matrix
+from .forecast.process_pool import submit_fit
+from .forecast.time_series import TimeSeries
+from .prediction_engine import MODEL_LABELS, forecast_baseline, forecast_series, normalize_forecast_parameters
+
+NATIONAL_LABEL = "Brasil"
+RECONCILIATION_METHODS = ("bottom_up", "mint")
+MINIMUM_VARIANCE = 1e-9
+# Nodes forecast by the baseline after a failed fit carry this multiple of the largest fitted variance.
+FALLBACK_VARIANCE_SCALE = 1e6
+
+NodeForecast = Tuple[str, np.ndarray, np.ndarray]
+
+
+def generate_hierarchical_forecast(
+    dataset: Union[DatasetSource, StateMatrix],
+    mode: str = "auto",
+    model: str = "arima",
+    forecast_years: int = 3,
+    forecast_periods: int = 12,
+    confidence: float = 0.95,
+    seasonal: Optional[bool] = None,
+    reconciliation: str = "mint",
+) -> Dict[str, Any]:
+    matrix = dataset if isinstance(dataset, StateMatrix) else load_state_matrix(dataset)
+    method = (reconciliation or "mint").strip().lower()
+    if method not in RECONCILIATION_METHODS:
+        raise ValueError(f"reconciliation must be one of: {', '.join(RECONCILIATION_METHODS)}.")
+    if len(matrix.labels) < 2:
+        raise ValueError("Previsao hierarquica requer ao menos duas UFs no dataset.")
+
+    parameters = normalize_forecast_parameters(
+        source_frequency=matrix.source_frequency,
+        mode=mode,
+        model=model,
+        forecast_years=forecast_years,
+        forecast_periods=forecast_periods,
+        confidence=confidence,
+        seasonal=seasonal,
+    )
+    output_mode = parameters["output_mode"]
+    if output_mode == "monthly" and matrix.source_frequency != "monthly":
+        raise ValueError("Monthly forecast requires a monthly source dataset.")
+    horizon = parameters["horizon"]
+
+    states = [_state_time_series(matrix, position, output_mode) for position in range(len(matrix.labels))]
+    national = TimeSeries(states[0].start, states[0].frequency, np.sum([state.values for state in states], axis=0))
+    # Every node is fitted up to the national series' last observed period, so all forecasts share their periods.
+    history_end = national.trim_trailing_zeros().end
+    nodes = [node[: history_end - node.start + 1] for node in (national, *states)]
+    labels = [NATIONAL_LABEL, *matrix.labels]
+    periods = nodes[0].future_labels(horizon)
+
+    # Every node fit is dispatched before any is joined, so the process pool runs them side by side. The nodes are the
+    # only pool tasks: the backtest folds of a node fit run inline in the worker that fits it.
+    fits = [submit_fit(_fit_node, node, output_mode, parameters["model"], horizon, confidence, seasonal) for node in nodes]
+    models: List[str] = []
+    errors: List[Optional[str]] = []
+    base = np.zeros((len(nodes), horizon))
+    intervals = np.zeros((len(nodes), horizon, 2))
+    fallback = np.zeros(len(nodes), dtype=bool)
+    for position, fit in enumerate(fits):
+        try:
+            model_label, forecast, interval = fit.result()
+            errors.append(None)
+        except Exception as exc:
+            errors.append(str(exc))
+            try:
+                model_label, forecast, interval = _fallback_node(nodes[position], output_mode, horizon)
+            except ValueError:
+                # Nodes that never reported (e.g. only zeros) have a known zero forecast.
+                models.append("")
+                continue
+            fallback[position] = True
+        models.append(model_label)
+        base[position], intervals[position] = forecast, interval
+
+    spread = (intervals[..., 1] - intervals[..., 0]) / (2 * NormalDist().inv_cdf(0.5 + confidence / 2))
+    variance = np.maximum(spread**2, MINIMUM_VARIANCE)
+    # A baseline standing in for a failed fit should barely weigh on MinT; the fitted nodes decide the totals.
+    variance[fallback] = FALLBACK_VARIANCE_SCALE * variance[~fallback].max(axis=0, initial=MINIMUM_VARIANCE)
+    reconciled = reconcile_forecasts(base, variance, method)
+    adjustment = reconciled - base
+    lower = np.minimum(np.clip(intervals[..., 0] + adjustment, 0, None), reconciled)
+    upper = np.maximum(intervals[..., 1] + adjustment, reconciled)
+
+    period_key = "month" if output_mode == "monthly" else "year"
+    return {
+        "source_frequency": matrix.source_frequency,
+        "output_frequency": output_mode,
+        "model": MODEL_LABELS[parameters["model"]],
+        "reconciliation": method,
+        "periods": periods,
+        "nodes": [
+            {
+                "state_label": label,
+                "level": "national" if position == 0 else "state",
+                "model": models[position],
+                "error": errors[position],
+                "historical_data": [
+                    {period_key: period, "value": value}
+                    for period, value in zip(nodes[position].period_labels(), nodes[position].values.tolist())
+                ],
+                "forecast": [
+                    {period_key: period, "value": value, "lower": low, "upper": high, "base_value": base_value}
+                    for period, value, low, high, base_value in zip(
+                        periods,
+                        reconciled[position].tolist(),
+                        lower[position].tolist(),
+                        upper[position].tolist(),
+                        base[position].tolist(),
+                    )
+                ],
+            }
+            for position, label in enumerate(labels)
+        ],
+    }
+
+
+def reconcile_forecasts(base: np.ndarray, variance: np.ndarray, method: str) -> np.ndarray:
+    # Rows are the national total followed by the states; columns are horizons. Returns coherent forecasts.
+    states = base.shape[0] - 1
+    summing = np.vstack([np.ones((1, states)), np.eye(states)])
+    if method == "bottom_up":
+        bottom = base[1:]
+    else:
+        # MinT with a diagonal (WLS) covariance, one system per horizon:
+        # b_h = (S' W_h^-1 S)^-1 S' W_h^-1 y_h, with W_h taken from each node's forecast variance.
+        weighted = summing.T[None, :, :] / variance.T[:, None, :]
+        bottom = np.linalg.solve(weighted @ summing, weighted @ base.T[:, :, None])[..., 0].T
+    return summing @ np.clip(bottom, 0, None)
+
+
+def _state_time_series(matrix: StateMatrix, position: int, output_mode: str) -> TimeSeries:
+    series = TimeSeries.from_pandas(matrix.row(position))
+    return series.to_annual() if output_mode == "annual" else series
+
+
+def _fit_node(
+    series: TimeSeries,
+    output_mode: str,
+    model_name: str,
+    horizon: int,
+    confidence: float,
+    seasonal: Optional[bool],
+) -> NodeForecast:
+    # The engine drops trailing zeros as unreported periods, so such nodes forecast further ahead to reach the
+    # shared horizon.
+    extra = series.end - series.trim_trailing_zeros().end
+    result = forecast_series(
+        series=series,
+        state_label="",
+        source_frequency=output_mode,
+        mode=output_mode,
+        model=model_name,
+        forecast_years=horizon + extra,
+        forecast_periods=horizon + extra,
+        confidence=confidence,
+        seasonal=seasonal,
+    )
+    return _node_forecast(result, extra)
+
+
+def _fallback_node(series: TimeSeries, output_mode: str, horizon: int) -> NodeForecast:
+    extra = series.end - series.trim_trailing_zeros().end
+    result = forecast_baseline(
+        series=series,
+        state_label="",
+        source_frequency=output_mode,
+        mode=output_mode,
+        forecast_years=horizon + extra,
+        forecast_periods=horizon + extra,
+    )
+    return _node_forecast(result, extra)
+
+
+def _node_forecast(result: Dict[str, Any], extra: int) -> NodeForecast:
+    points = result["forecast"][extra:]
+    forecast = np.asarray([point["value"] for point in points], dtype=float)
+    interval = np.asarray([[point["lower"], point["upper"]] for point in points], dtype=float)
+    return result["model"], forecast, interval
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .forecast.process_pool import submit_fit
+from .forecast.time_series import TimeSeries
+from .prediction_engine import MODEL_LABELS, forecast_series, normalize_forecast_parameters
+
+DEFAULT_EVALUATION_CUTOFFS = 3
+MINIMUM_TRAINING_POINTS = {"annual": 4, "monthly": 6}
+
+Cutoff = Union[int, str]
+
+
+def evaluate_models(
+    series: Union[pd.Series, TimeSeries],
+    state_label: str,
+    source_frequency: str,
+    models: Sequence[str],
+    cutoffs: Optional[Sequence[Cutoff]] = None,
+    mode: str = "auto",
+    horizon: int = 1,
+    confidence: float = 0.95,
+    seasonal: Optional[bool] = None,
+    annual_series: Optional[Union[pd.Series, TimeSeries]] = None,
+) -> Dict[str, Any]:
+    series = series if isinstance(series, TimeSeries) else TimeSeries.from_pandas(series)
+    parameters = [
+        normalize_forecast_parameters(source_frequency, mode=mode, model=model, confidence=confidence, seasonal=seasonal)
+        for model in models
+    ]
+    model_names = list(dict.fromkeys(item["model"] for item in parameters))
+    if not model_names:
+        raise ValueError("Informe ao menos um modelo para avaliar.")
+
+    output_mode = parameters[0]["output_mode"]
+    if output_mode == "monthly":
+        target = series
+    else:
+        target = series.to_annual() if annual_series is None else annual_series
+        target = target if isinstance(target, TimeSeries) else TimeSeries.from_pandas(target)
+    horizon = int(horizon)
+    if horizon < 1:
+        raise ValueError("O horizonte de avaliacao deve ser >= 1.")
+    origins = _resolve_cutoffs(target, cutoffs, horizon)
+
+    # Every (model, cutoff) fit is dispatched before any is joined, so the process pool runs them side by side. The
+    # cutoffs are the only pool tasks: the backtest folds of a fit run inline in the worker that fits it.
+    fits: Dict[str, List[Tuple[int, Future]]] = {
+        name: [
+            (origin, submit_fit(_fit_at_cutoff, target[:origin], output_mode, name, horizon, confidence, seasonal))
+            for origin in origins
+        ]
+        for name in model_names
+    }
+    return {
+        "state_label": state_label,
+        "output_frequency": output_mode,
+        "horizon": horizon,
+        "cutoffs": [target.period_label(target.start + origin - 1) for origin in origins],
+        "models": [_score_model(name, target, horizon, fits[name]) for name in model_names],
+    }
+
+
+def _resolve_cutoffs(target: TimeSeries, cutoffs: Optional[Sequence[Cutoff]], horizon: int) -> List[int]:
+    minimum = MINIMUM_TRAINING_POINTS[target.frequency]
+    latest = len(target) - 1
+    if not cutoffs:
+        first = max(minimum, len(target) - horizon - DEFAULT_EVALUATION_CUTOFFS + 1)
+        origins = list(range(first, len(target) - horizon + 1))
+    else:
+        labels = [str(label) for label in target.period_labels()]
+        origins = []
+        for cutoff in cutoffs:
+            if str(cutoff) not in labels:
+                raise ValueError(f"Corte {cutoff} fora do periodo da serie ({labels[0]} a {labels[-1]}).")
+            origins.append(labels.index(str(cutoff)) + 1)
+        origins = sorted(set(origins))
+
+    if not origins or origins[0] < minimum or origins[-1] > latest:
+        raise ValueError(
+            f"Os cortes precisam deixar ao menos {minimum} observacoes de treino e uma observacao para comparar."
+        )
+    return origins
+
+
+def _fit_at_cutoff(
+    train: TimeSeries,
+    output_mode: str,
+    model_name: str,
+    horizon: int,
+    confidence: float,
+    seasonal: Optional[bool],
+) -> Tuple[np.ndarray, float]:
+    started = time.perf_counter()
+    result = forecast_series(
+        series=train,
+        state_label="",
+        source_frequency=output_mode,
+        mode=output_mode,
+        model=model_name,
+        forecast_years=horizon,
+        forecast_periods=horizon,
+        confidence=confidence,
+        seasonal=seasonal,
+    )
+    elapsed = time.perf_counter() - started
+    return np.asarray([point["value"] for point in result["forecast"]], dtype=float), elapsed
+
+
+def _score_model(model_name: str, target: TimeSeries, horizon: int, fits: List[Tuple[int, Future]]) -> Dict[str, Any]:
+    errors: List[float] = []
+    percentage_errors: List[float] = []
+    fit_seconds: List[float] = []
+    failures = 0
+    for origin, fit in fits:
+        try:
+            forecast, elapsed = fit.result()
+        except Exception:
+            failures += 1
+            continue
+        actual = target.values[origin : origin + horizon]
+        error = np.abs(forecast[: len(actual)] - actual)
+        errors.extend(error.tolist())
+        percentage_errors.extend((error[actual != 0] / np.abs(actual[actual != 0]) * 100).tolist())
+        fit_seconds.append(elapsed)
+
+    return {
+        "model": model_name,
+        "label": MODEL_LABELS[model_name],
+        "mae": float(np.mean(errors)) if errors else None,
+        "mape": float(np.mean(percentage_errors)) if percentage_errors else None,
+        "mean_fit_seconds": float(np.mean(fit_seconds)) if fit_seconds else None,
+        "total_fit_seconds": float(np.sum(fit_seconds)),
+        "evaluated_points": len(errors),
+        "failed_fits": failures,
+    }
@@ -1,34 +1,112 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import partial
+import hashlib
+import math
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
 
-from .forecast.arima_forecaster import forecast_arima_log
-from .forecast.csv_loader import (
-    aggregate_to_annual,
-    detect_source_frequency,
-    load_state_series,
+from .forecast.arima_forecaster import forecast_arima_log, load_pmdarima, reused_arima_order, select_arima_order
+from .forecast.arima_order_store import ArimaOrder
+from .forecast.csv_loader import DatasetSource, load_state_time_series, parse_dataset
+from .forecast.fast_models import forecast_damped_ets_log, forecast_drift_log, forecast_seasonal_naive_log
+from .forecast.fit_budget import (
+    FitBudgetExceeded,
+    check_fit_budget,
+    fit_budget,
+    fit_budget_seconds,
+    fit_budget_until,
+    fit_deadline,
 )
+from .forecast.process_pool import completed_future, run_inline, submit_fit
+from .forecast.series_features import SeriesFeatures, compute_series_features
 from .forecast.theta_forecaster import forecast_theta_log
+from .forecast.time_series import TimeSeries
 
-MODEL_LABELS = {
-    "arima": "ARIMA (auto_arima)",
-    "theta": "ThetaForecaster",
+BACKTEST_CACHE_SIZE = 4096
+BASELINE_LABEL = "Baseline (tendencia recente)"
+# Reported as the tournament winner when no candidate completed a single fold.
+BASELINE_MODEL = "baseline"
+AUTO_MODEL = "auto"
+MONTHLY_TOURNAMENT_FOLDS = 6
+
+FitResult = TypeVar("FitResult")
+LogForecaster = Callable[[TimeSeries, int, float, int, Optional[str], Optional[ArimaOrder]], Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class ForecastModelSpec:
+    option_label: str
+    label: str
+    forecast_log: LogForecaster
+    seasonal: bool = True
+    fast: bool = False
+    # Models whose m=12 search is skipped, unless asked for, when the series shows no seasonal evidence.
+    seasonal_search: bool = False
+
+
+def _arima_log(
+    series_log: TimeSeries,
+    periods: int,
+    confidence: float,
+    season_length: int,
+    lineage: Optional[str],
+    order: Optional[ArimaOrder],
+) -> Tuple[np.ndarray, np.ndarray]:
+    return forecast_arima_log(
+        series_log=series_log,
+        periods=periods,
+        confidence=confidence,
+        seasonal=season_length > 1,
+        season_length=season_length,
+        lineage=lineage,
+        order=order,
+    )
+
+
+def _stateless_log(forecaster: Callable[[TimeSeries, int, float, int], Tuple[np.ndarray, np.ndarray]]) -> LogForecaster:
+    return lambda series_log, periods, confidence, season_length, lineage, order: forecaster(
+        series_log, periods, confidence, season_length
+    )
+
+
+MODEL_REGISTRY: Dict[str, ForecastModelSpec] = {
+    "arima": ForecastModelSpec("ARIMA", "ARIMA (auto_arima)", _arima_log, seasonal_search=True),
+    "theta": ForecastModelSpec("Theta", "ThetaForecaster", _stateless_log(forecast_theta_log), seasonal_search=True),
+    "drift": ForecastModelSpec(
+        "Drift (rapido)", "Passeio aleatorio com drift", _stateless_log(forecast_drift_log), seasonal=False, fast=True
+    ),
+    "seasonal_naive": ForecastModelSpec(
+        "Sazonal ingenuo (rapido)", "Naive sazonal", _stateless_log(forecast_seasonal_naive_log), fast=True
+    ),
+    "ets": ForecastModelSpec(
+        "ETS amortecido (rapido)", "ETS (tendencia amortecida)", _stateless_log(forecast_damped_ets_log), seasonal=False, fast=True
+    ),
 }
+MODEL_LABELS = {**{name: spec.label for name, spec in MODEL_REGISTRY.items()}, AUTO_MODEL: "Automatico (torneio)"}
+
+
+_fold_forecasts: "OrderedDict[str, float]" = OrderedDict()
+_fold_forecasts_lock = Lock()
+
+
+def preload_forecast_backends() -> None:
+    load_pmdarima()
 
 
 def get_available_model_options() -> list[dict[str, str]]:
-    return [
-        {"value": "arima", "label": "ARIMA"},
-        {"value": "theta", "label": "Theta"},
-    ]
+    options = [{"value": name, "label": spec.option_label} for name, spec in MODEL_REGISTRY.items()]
+    return [*options, {"value": AUTO_MODEL, "label": "Automatico (melhor no backtest)"}]
 
 
 def generate_forecast(
-    dataset_path: Path,
+    dataset_path: DatasetSource,
     state: str,
     mode: str = "auto",
     model: str = "arima",
@@ -37,17 +115,39 @@ def generate_forecast(
     confidence: float = 0.95,
     seasonal: Optional[bool] = None,
 ) -> Dict[str, Any]:
-    normalized_model = (model or "arima").strip().lower()
-    available_models = {item["value"] for item in get_available_model_options()}
-    if normalized_model not in MODEL_LABELS or normalized_model not in available_models:
-        raise ValueError("model must be 'arima' or 'theta'.")
+    _normalize_model_name(model)
+    dataset = parse_dataset(dataset_path)
+    series, state_label, source_frequency = load_state_time_series(dataset, state)
+    return forecast_series(
+        series=series,
+        state_label=state_label,
+        source_frequency=source_frequency,
+        mode=mode,
+        model=model,
+        forecast_years=forecast_years,
+        forecast_periods=forecast_periods,
+        confidence=confidence,
+        seasonal=seasonal,
+    )
 
-    source_frequency = detect_source_frequency(dataset_path)
-    output_mode = _resolve_output_mode(mode, source_frequency)
 
-    series, state_label, loaded_frequency = load_state_series(dataset_path, state)
-    if loaded_frequency != source_frequency:
-        source_frequency = loaded_frequency
+def forecast_series(
+    series: Union[pd.Series, TimeSeries],
+    state_label: str,
+    source_frequency: str,
+    mode: str = "auto",
+    model: str = "arima",
+    forecast_years: int = 3,
+    forecast_periods: int = 12,
+    confidence: float = 0.95,
+    seasonal: Optional[bool] = None,
+    annual_series: Optional[Union[pd.Series, TimeSeries]] = None,
+    lineage: Optional[str] = None,
+    features: Optional[SeriesFeatures] = None,
+) -> Dict[str, Any]:
+    normalized_model = _normalize_model_name(model)
+    output_mode = _resolve_output_mode(mode, source_frequency)
+    series = _as_time_series(series)
 
     if output_mode == "monthly":
         if source_frequency != "monthly":
@@ -59,19 +159,108 @@ def generate_forecast(
             periods=forecast_periods,
             confidence=confidence,
             seasonal=seasonal,
+            lineage=lineage,
+            features=features,
         )
 
-    annual_series = aggregate_to_annual(series) if source_frequency == "monthly" else series
+    annual = series.to_annual() if annual_series is None else _as_time_series(annual_series)
     return _forecast_annual(
-        series=annual_series,
+        series=annual,
         state_label=state_label,
         source_frequency=source_frequency,
         model_name=normalized_model,
         years=forecast_years,
         confidence=confidence,
+        lineage=lineage,
     )
 
 
+def forecast_baseline(
+    series: Union[pd.Series, TimeSeries],
+    state_label: str,
+    source_frequency: str,
+    mode: str = "auto",
+    forecast_years: int = 3,
+    forecast_periods: int = 12,
+    annual_series: Optional[Union[pd.Series, TimeSeries]] = None,
+) -> Dict[str, Any]:
+    # Recent-trend extrapolation with no model fit, cheap enough to answer before the requested model is ready.
+    output_mode = _resolve_output_mode(mode, source_frequency)
+    series = _as_time_series(series)
+
+    if output_mode == "monthly":
+        if source_frequency != "monthly":
+            raise ValueError("Monthly forecast requires a monthly source dataset.")
+        display_series = _prepare_series(series)
+        _validate_series(display_series, minimum_points=6, label="Serie mensal")
+        forecast_values, interval_values = _build_fallback_forecast(display_series, int(forecast_periods))
+        return _forecast_payload(
+            display_series=display_series,
+            period_key="month",
+            source_frequency="monthly",
+            output_frequency="monthly",
+            state_label=state_label,
+            forecast_values=forecast_values,
+            interval_values=interval_values,
+            model_label=BASELINE_LABEL,
+            seasonal=False,
+            season_length=1,
+        )
+
+    annual = series.to_annual() if annual_series is None else _as_time_series(annual_series)
+    display_series = _prepare_series(annual)
+    _validate_series(display_series, minimum_points=4, label="Serie anual")
+    forecast_values, interval_values = _build_fallback_forecast(display_series, int(forecast_years))
+    return _forecast_payload(
+        display_series=display_series,
+        period_key="year",
+        source_frequency=source_frequency,
+        output_frequency="annual",
+        state_label=state_label,
+        forecast_values=forecast_values,
+        interval_values=interval_values,
+        model_label=BASELINE_LABEL,
+    )
+
+
+def normalize_forecast_parameters(
+    source_frequency: str,
+    mode: str = "auto",
+    model: str = "arima",
+    forecast_years: int = 3,
+    forecast_periods: int = 12,
+    confidence: float = 0.95,
+    seasonal: Optional[bool] = None,
+) -> Dict[str, Any]:
+    output_mode = _resolve_output_mode(mode, source_frequency)
+    parameters: Dict[str, Any] = {
+        "model": _normalize_model_name(model),
+        "output_mode": output_mode,
+        "confidence": float(confidence),
+    }
+    if output_mode == "monthly":
+        parameters["horizon"] = int(forecast_periods)
+        # Unset seasonality is decided by the series features, so it can differ from an explicit True.
+        parameters["seasonal"] = "auto" if seasonal is None else bool(seasonal)
+    else:
+        parameters["horizon"] = int(forecast_years)
+    return parameters
+
+
+def _as_time_series(series: Union[pd.Series, TimeSeries]) -> TimeSeries:
+    if isinstance(series, TimeSeries):
+        return series
+    return TimeSeries.from_pandas(series)
+
+
+def _normalize_model_name(model: str) -> str:
+    normalized_model = (model or "arima").strip().lower()
+    available_models = {item["value"] for item in get_available_model_options()}
+    if normalized_model not in MODEL_LABELS or normalized_model not in available_models:
+        raise ValueError(f"model must be one of: {', '.join(repr(name) for name in MODEL_LABELS)}.")
+    return normalized_model
+
+
 def _resolve_output_mode(mode: str, source_frequency: str) -> str:
     normalized_mode = (mode or "auto").strip().lower()
     if normalized_mode not in ("auto", "annual", "monthly"):
@@ -82,159 +271,245 @@ def _resolve_output_mode(mode: str, source_frequency: str) -> str:
 
 
 def _forecast_annual(
-    series: pd.Series,
+    series: TimeSeries,
     state_label: str,
     source_frequency: str,
     model_name: str,
     years: int,
     confidence: float,
+    lineage: Optional[str] = None,
 ) -> Dict[str, Any]:
-    display_series = _prepare_display_series(series)
-    training_series = _prepare_series(display_series)
+    display_series = _prepare_series(series)
+    training_series = display_series
     _validate_series(training_series, minimum_points=4, label="Serie anual")
     use_robust_mode = len(training_series) < 7
 
+    budget_exceeded = False
+    tournament: Dict[str, Any] = {}
     if use_robust_mode:
         forecast_values, interval_values = _build_fallback_forecast(training_series, int(years))
         model_label = f"{MODEL_LABELS[model_name]} (modo robusto)"
     else:
+        if model_name == AUTO_MODEL:
+            model_name, tournament = _run_tournament(
+                training_series, confidence, _backtest_holdout(training_series), dict.fromkeys(MODEL_REGISTRY, 1), lineage
+            )
+            if model_name == BASELINE_MODEL:
+                return {
+                    **forecast_baseline(series, state_label, source_frequency, "annual", forecast_years=years, annual_series=series),
+                    **tournament,
+                }
+        # Folds run in the pool while the full series is fitted here. ARIMA folds refit the order of that fit, so
+        # they start early only when a lineage reuses its stored order; otherwise they wait for the search.
+        fold_order = None
+        if model_name == "arima":
+            fold_order = reused_arima_order(training_series.map(np.log1p), False, 1, lineage)
+        fold_forecasts = None
+        if model_name != "arima" or fold_order is not None:
+            fold_forecasts = _start_fold_forecasts(
+                training_series, model_name, confidence, fold_order, fit_deadline(fit_budget_seconds(model_name, "annual"))
+            )
         try:
-            forecast_values, interval_values = _annual_model_forecast(
-                series=training_series,
-                model_name=model_name,
-                years=years,
-                confidence=confidence,
+            fitted, budget_exceeded = _budgeted_fit(
+                model_name,
+                "annual",
+                partial(
+                    _annual_model_forecast,
+                    series=training_series,
+                    model_name=model_name,
+                    years=years,
+                    confidence=confidence,
+                    lineage=lineage,
+                ),
             )
         except Exception as exc:
             raise RuntimeError(f"Falha ao ajustar o modelo {MODEL_LABELS[model_name]} para a serie anual: {exc}") from exc
 
-        forecast_values, interval_values = _normalize_forecast_output(training_series, forecast_values, interval_values)
-        if _annual_backtest_prefers_baseline(training_series, model_name, confidence):
+        model_label = MODEL_LABELS[model_name]
+        if fitted is None:
             forecast_values, interval_values = _build_fallback_forecast(training_series, int(years))
             model_label = f"{MODEL_LABELS[model_name]} (modo robusto)"
         else:
-            model_label = MODEL_LABELS[model_name]
-
-    last_displayed_year = int(pd.Index(display_series.index).astype(int).max())
-    future_years = [last_displayed_year + offset for offset in range(1, int(years) + 1)]
-
-    historical_data = [
-        {"year": int(year), "value": float(value)}
-        for year, value in zip(pd.Index(display_series.index).astype(int), display_series.values)
-    ]
-    forecast_data = []
-    for index in range(int(years)):
-        forecast_data.append(
-            {
-                "year": int(future_years[index]),
-                "value": float(forecast_values[index]),
-                "lower": float(interval_values[index, 0]),
-                "upper": float(interval_values[index, 1]),
-            }
-        )
-
-    return {
-        "source_frequency": source_frequency,
-        "output_frequency": "annual",
-        "state_label": state_label,
-        "historical_data": historical_data,
-        "forecast": forecast_data,
-        "model": model_label,
-        "historical_points": int(len(historical_data)),
-        "forecast_points": int(len(forecast_data)),
-        "last_observed": float(display_series.iloc[-1]),
-        "peak_observed": float(display_series.max()),
-    }
+            forecast_values, interval_values = _normalize_forecast_output(training_series, *fitted)
+        # A fit already past its budget skips the backtest, which would refit the model on every fold.
+        if not budget_exceeded:
+            if model_name == "arima":
+                # A stored order that failed to refit was replaced by a search, so early folds may need the new order.
+                fitted_order = select_arima_order(training_series.map(np.log1p), False, 1, lineage=lineage)
+                if fitted_order != fold_order:
+                    fold_forecasts = _start_fold_forecasts(
+                        training_series,
+                        model_name,
+                        confidence,
+                        fitted_order,
+                        fit_deadline(fit_budget_seconds(model_name, "annual")),
+                    )
+            if _annual_backtest_prefers_baseline(training_series, model_name, confidence, fold_forecasts=fold_forecasts):
+                forecast_values, interval_values = _build_fallback_forecast(training_series, int(years))
+                model_label = f"{MODEL_LABELS[model_name]} (modo robusto)"
+
+    return _forecast_payload(
+        display_series=display_series,
+        period_key="year",
+        source_frequency=source_frequency,
+        output_frequency="annual",
+        state_label=state_label,
+        forecast_values=forecast_values,
+        interval_values=interval_values,
+        model_label=model_label,
+        budget_exceeded=budget_exceeded,
+        **tournament,
+    )
 
 
 def _forecast_monthly(
-    series: pd.Series,
+    series: TimeSeries,
     state_label: str,
     model_name: str,
     periods: int,
     confidence: float,
     seasonal: Optional[bool],
+    lineage: Optional[str] = None,
+    features: Optional[SeriesFeatures] = None,
 ) -> Dict[str, Any]:
-    if not isinstance(series.index, pd.DatetimeIndex):
+    if series.frequency != "monthly":
         raise ValueError("Monthly source series is invalid.")
 
-    display_series = _prepare_display_series(series)
-    ordered_series = _prepare_series(display_series)
+    display_series = _prepare_series(series)
+    ordered_series = display_series
     _validate_series(ordered_series, minimum_points=6, label="Serie mensal")
-    seasonal_requested = True if seasonal is None else bool(seasonal)
-    seasonal_enabled = seasonal_requested and len(ordered_series) >= 24
-    season_length = 12 if seasonal_enabled else 1
-    series_log = np.log1p(ordered_series.to_numpy())
+    season_lengths = _monthly_season_lengths(ordered_series, seasonal, features)
+    tournament: Dict[str, Any] = {}
+    if model_name == AUTO_MODEL:
+        holdout = min(MONTHLY_TOURNAMENT_FOLDS, len(ordered_series) - 6)
+        model_name, tournament = _run_tournament(ordered_series, confidence, holdout, season_lengths, lineage)
+        if model_name == BASELINE_MODEL:
+            return {**forecast_baseline(series, state_label, "monthly", "monthly", forecast_periods=periods), **tournament}
+    spec = MODEL_REGISTRY[model_name]
+    season_length = season_lengths[model_name]
+    seasonal_enabled = season_length > 1
+    series_log = ordered_series.map(np.log1p)
 
     try:
-        if model_name == "arima":
-            forecast_log, interval_log = forecast_arima_log(
-                series_log=series_log,
-                periods=periods,
-                confidence=confidence,
-                seasonal=seasonal_enabled,
-                season_length=season_length,
-            )
-        else:
-            period_index = pd.PeriodIndex(ordered_series.index, freq="M")
-            log_series = pd.Series(series_log, index=period_index)
-            forecast_log, interval_log = forecast_theta_log(
-                series_log=log_series,
-                periods=periods,
-                confidence=confidence,
-                season_length=season_length,
-            )
+        fitted, budget_exceeded = _budgeted_fit(
+            model_name,
+            "monthly",
+            partial(spec.forecast_log, series_log, periods, confidence, season_length, lineage, None),
+        )
     except Exception as exc:
         raise RuntimeError(f"Falha ao ajustar o modelo {MODEL_LABELS[model_name]} para a serie mensal: {exc}") from exc
 
-    forecast_values = np.clip(np.expm1(np.asarray(forecast_log)), 0, None)
-    interval_values = np.clip(np.expm1(np.asarray(interval_log)), 0, None)
-    forecast_values, interval_values = _normalize_forecast_output(ordered_series, forecast_values, interval_values)
-
-    last_period = pd.Timestamp(display_series.index.max())
-    future_periods = pd.date_range(
-        last_period + pd.offsets.MonthBegin(1),
-        periods=int(periods),
-        freq="MS",
+    model_label = MODEL_LABELS[model_name]
+    if fitted is None:
+        forecast_values, interval_values = _build_fallback_forecast(ordered_series, int(periods))
+        model_label = f"{MODEL_LABELS[model_name]} (modo robusto)"
+    else:
+        forecast_log, interval_log = fitted
+        forecast_values = np.clip(np.expm1(np.asarray(forecast_log)), 0, None)
+        interval_values = np.clip(np.expm1(np.asarray(interval_log)), 0, None)
+        forecast_values, interval_values = _normalize_forecast_output(ordered_series, forecast_values, interval_values)
+
+    return _forecast_payload(
+        display_series=display_series,
+        period_key="month",
+        source_frequency="monthly",
+        output_frequency="monthly",
+        state_label=state_label,
+        forecast_values=forecast_values,
+        interval_values=interval_values,
+        model_label=model_label,
+        budget_exceeded=budget_exceeded,
+        seasonal=bool(seasonal_enabled),
+        season_length=int(season_length),
+        **tournament,
     )
 
+
+def _monthly_season_lengths(
+    series: TimeSeries, seasonal: Optional[bool], features: Optional[SeriesFeatures]
+) -> Dict[str, int]:
+    if (seasonal is not None and not seasonal) or len(series) < 24:
+        return dict.fromkeys(MODEL_REGISTRY, 1)
+    # An explicit seasonal=True keeps every search. Without stored features they are computed here, in well under 1 ms.
+    seasonal_evidence = seasonal is not None or (features or compute_series_features(series)).seasonal
+    return {
+        name: 12 if spec.seasonal and (seasonal_evidence or not spec.seasonal_search) else 1
+        for name, spec in MODEL_REGISTRY.items()
+    }
+
+
+def _forecast_payload(
+    display_series: TimeSeries,
+    period_key: str,
+    source_frequency: str,
+    output_frequency: str,
+    state_label: str,
+    forecast_values: np.ndarray,
+    interval_values: np.ndarray,
+    model_label: str,
+    budget_exceeded: bool = False,
+    **model_details: Any,
+) -> Dict[str, Any]:
     historical_data = [
-        {"month": month.strftime("%Y-%m"), "value": float(value)}
-        for month, value in zip(display_series.index, display_series.values)
+        {period_key: label, "value": value}
+        for label, value in zip(display_series.period_labels(), display_series.values.tolist())
     ]
-    forecast_data = []
-    for index in range(int(periods)):
-        forecast_data.append(
-            {
-                "month": future_periods[index].strftime("%Y-%m"),
-                "value": float(forecast_values[index]),
-                "lower": float(interval_values[index, 0]),
-                "upper": float(interval_values[index, 1]),
-            }
-        )
+    forecast_data = _forecast_points(
+        period_key,
+        display_series.future_labels(len(forecast_values)),
+        forecast_values,
+        interval_values,
+    )
 
     return {
-        "source_frequency": "monthly",
-        "output_frequency": "monthly",
+        "source_frequency": source_frequency,
+        "output_frequency": output_frequency,
         "state_label": state_label,
         "historical_data": historical_data,
         "forecast": forecast_data,
-        "model": MODEL_LABELS[model_name],
-        "seasonal": bool(seasonal_enabled),
-        "season_length": int(season_length),
+        "model": model_label,
+        **model_details,
         "historical_points": int(len(historical_data)),
         "forecast_points": int(len(forecast_data)),
-        "last_observed": float(display_series.iloc[-1]),
-        "peak_observed": float(display_series.max()),
+        "last_observed": float(display_series.values[-1]),
+        "peak_observed": float(display_series.values.max()),
+        "budget_exceeded": bool(budget_exceeded),
     }
 
 
-def _validate_series(series: pd.Series, minimum_points: int, label: str) -> None:
-    cleaned = series.dropna().astype(float)
-    if len(cleaned) < minimum_points:
+def _budgeted_fit(model_name: str, frequency: str, fit: Callable[[], FitResult]) -> Tuple[Optional[FitResult], bool]:
+    # No fit is returned when the budget expired before any candidate was fitted; the caller then uses the baseline.
+    with fit_budget(fit_budget_seconds(model_name, frequency)) as budget:
+        try:
+            fitted = fit()
+        except Exception:
+            if not budget.expired:
+                raise
+            return None, True
+        return fitted, budget.expired
+
+
+def _forecast_points(
+    period_key: str,
+    labels: list,
+    forecast_values: np.ndarray,
+    interval_values: np.ndarray,
+) -> list[dict[str, Any]]:
+    return [
+        {period_key: label, "value": value, "lower": lower, "upper": upper}
+        for label, value, (lower, upper) in zip(
+            labels,
+            np.asarray(forecast_values, dtype=float).tolist(),
+            np.asarray(interval_values, dtype=float).tolist(),
+        )
+    ]
+
+
+def _validate_series(series: TimeSeries, minimum_points: int, label: str) -> None:
+    values = series.values[~np.isnan(series.values)]
+    if len(values) < minimum_points:
         raise ValueError(f"{label} precisa ter pelo menos {minimum_points} observacoes validas.")
 
-    values = cleaned.to_numpy(dtype=float)
     if not np.isfinite(values).all():
         raise ValueError(f"{label} contem valores nao numericos ou infinitos.")
 
@@ -242,29 +517,12 @@ def _validate_series(series: pd.Series, minimum_points: int, label: str) -> None
         raise ValueError(f"{label} contem apenas zeros; nao ha base estatistica para previsao.")
 
 
-def _prepare_series(series: pd.Series) -> pd.Series:
-    cleaned = series.astype(float).sort_index()
-    trimmed = _trim_trailing_zeros(cleaned)
-    return trimmed if len(trimmed) else cleaned
-
-
-def _prepare_display_series(series: pd.Series) -> pd.Series:
-    return _prepare_series(series)
-
-
-def _trim_trailing_zeros(series: pd.Series) -> pd.Series:
-    if series.empty:
-        return series
-
-    trimmed = series.copy()
-    while len(trimmed) > 4 and float(trimmed.iloc[-1]) == 0.0 and float(trimmed.iloc[:-1].max()) > 0.0:
-        trimmed = trimmed.iloc[:-1]
-
-    return trimmed
+def _prepare_series(series: TimeSeries) -> TimeSeries:
+    return series.trim_trailing_zeros()
 
 
 def _normalize_forecast_output(
-    series: pd.Series,
+    series: TimeSeries,
     forecast_values: np.ndarray,
     interval_values: np.ndarray,
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -280,42 +538,28 @@ def _normalize_forecast_output(
 
 
 def _annual_model_forecast(
-    series: pd.Series,
+    series: TimeSeries,
     model_name: str,
     years: int,
     confidence: float,
+    lineage: Optional[str] = None,
+    order: Optional[ArimaOrder] = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    series_log = np.log1p(series.to_numpy())
-
-    if model_name == "arima":
-        forecast_log, interval_log = forecast_arima_log(
-            series_log=series_log,
-            periods=years,
-            confidence=confidence,
-            seasonal=False,
-            season_length=1,
-        )
-    else:
-        log_series = pd.Series(series_log, index=pd.Index(series.index).astype(int))
-        forecast_log, interval_log = forecast_theta_log(
-            series_log=log_series,
-            periods=years,
-            confidence=confidence,
-            season_length=1,
-        )
+    series_log = series.map(np.log1p)
+    forecast_log, interval_log = MODEL_REGISTRY[model_name].forecast_log(series_log, years, confidence, 1, lineage, order)
 
     forecast_values = np.clip(np.expm1(np.asarray(forecast_log)), 0, None)
     interval_values = np.clip(np.expm1(np.asarray(interval_log)), 0, None)
     return forecast_values, interval_values
 
 
-def _forecast_is_suspicious(series: pd.Series, forecast_values: np.ndarray) -> bool:
+def _forecast_is_suspicious(series: TimeSeries, forecast_values: np.ndarray) -> bool:
     values = np.asarray(forecast_values, dtype=float)
     if values.size == 0 or not np.isfinite(values).all():
         return True
 
-    recent = series.astype(float).tail(min(5, len(series)))
-    reference = max(float(recent.median()), float(recent.iloc[-1]), 1.0)
+    recent = series.tail(5)
+    reference = max(float(np.median(recent)), float(recent[-1]), 1.0)
     max_value = float(np.nanmax(values))
     min_value = float(np.nanmin(values))
     forecast_spread = max_value - min_value
@@ -333,23 +577,31 @@ def _forecast_is_suspicious(series: pd.Series, forecast_values: np.ndarray) -> b
 
 
 def _annual_backtest_prefers_baseline(
-    series: pd.Series,
+    series: TimeSeries,
     model_name: str,
     confidence: float,
+    order: Optional[ArimaOrder] = None,
+    fold_forecasts: Optional[List[Future]] = None,
 ) -> bool:
-    holdout = min(2, len(series) - 4)
+    holdout = _backtest_holdout(series)
     if holdout < 1:
         return False
+    if fold_forecasts is None:
+        fold_forecasts = _start_fold_forecasts(
+            series, model_name, confidence, order, fit_deadline(fit_budget_seconds(model_name, series.frequency))
+        )
 
     model_errors = []
     baseline_errors = []
-    for step in range(holdout, 0, -1):
-        train = series.iloc[:-step]
-        actual = float(series.iloc[-step])
+    for step, fold_forecast in zip(range(holdout, 0, -1), fold_forecasts):
+        train = series[:-step]
+        actual = float(series.values[-step])
 
         try:
-            model_forecast, _ = _annual_model_forecast(train, model_name, years=1, confidence=confidence)
-            model_errors.append(abs(actual - float(model_forecast[0])))
+            model_errors.append(abs(actual - fold_forecast.result()))
+        except FitBudgetExceeded:
+            # Like a late fit, a backtest that runs past the model's budget is skipped rather than held against it.
+            return False
         except Exception:
             return True
 
@@ -361,15 +613,180 @@ def _annual_backtest_prefers_baseline(
     return not np.isfinite(model_mae) or baseline_mae + max(5.0, baseline_mae * 0.15) < model_mae
 
 
-def _build_fallback_forecast(series: pd.Series, periods: int) -> tuple[np.ndarray, np.ndarray]:
-    recent = series.astype(float).tail(min(5, len(series)))
-    last_value = float(recent.iloc[-1])
-    diffs = np.diff(recent.to_numpy(dtype=float)) if len(recent) > 1 else np.asarray([0.0])
+def _backtest_holdout(series: TimeSeries) -> int:
+    return min(2, len(series) - 4)
+
+
+def _start_fold_forecasts(
+    series: TimeSeries,
+    model_name: str,
+    confidence: float,
+    order: Optional[ArimaOrder],
+    deadline: float = math.inf,
+) -> List[Future]:
+    # Futures are joined in fold order, so the verdict does not depend on which worker finishes first.
+    return [
+        _start_fold_forecast(series[:-step], model_name, confidence, order, deadline=deadline)
+        for step in range(_backtest_holdout(series), 0, -1)
+    ]
+
+
+def _start_fold_forecast(
+    train: TimeSeries,
+    model_name: str,
+    confidence: float,
+    order: Optional[ArimaOrder],
+    season_length: int = 1,
+    deadline: float = math.inf,
+) -> Future:
+    key = _fold_forecast_key(train, model_name, order, season_length)
+    with _fold_forecasts_lock:
+        if key in _fold_forecasts:
+            _fold_forecasts.move_to_end(key)
+            return completed_future(_fold_forecasts[key])
+
+    # Fast-tier fits cost less than shipping the fold to a worker.
+    submit = run_inline if MODEL_REGISTRY[model_name].fast else submit_fit
+    fold_forecast = submit(_compute_fold_forecast, train, model_name, confidence, order, season_length, deadline)
+    fold_forecast.add_done_callback(partial(_remember_fold_forecast, key))
+    return fold_forecast
+
+
+def _fold_forecast_key(train: TimeSeries, model_name: str, order: Optional[ArimaOrder], season_length: int = 1) -> str:
+    # Point forecasts do not depend on the interval level, so folds are keyed by data, model and order only.
+    order_key = "" if order is None else f"{order.order}|{order.seasonal_order}|{order.with_intercept}"
+    season_key = "" if season_length == 1 else f"m={season_length}|"
+    digest = hashlib.sha256(f"{model_name}|{order_key}|{season_key}".encode("utf-8"))
+    digest.update(np.ascontiguousarray(train.values, dtype="<f8").tobytes())
+    return digest.hexdigest()
+
+
+def _compute_fold_forecast(
+    train: TimeSeries,
+    model_name: str,
+    confidence: float,
+    order: Optional[ArimaOrder],
+    season_length: int = 1,
+    deadline: float = math.inf,
+) -> float:
+    with fit_budget_until(deadline):
+        # Folds still queued when the deadline passes are dropped instead of fitted.
+        check_fit_budget()
+        forecast_log, _ = MODEL_REGISTRY[model_name].forecast_log(
+            train.map(np.log1p), 1, confidence, season_length, None, order
+        )
+    return float(np.clip(np.expm1(np.asarray(forecast_log)[0]), 0, None))
+
+
+def _remember_fold_forecast(key: str, fold_forecast: Future) -> None:
+    if not fold_forecast.cancelled() and fold_forecast.exception() is None:
+        _store_fold_forecast(key, fold_forecast.result())
+
+
+def _store_fold_forecast(key: str, value: float) -> None:
+    with _fold_forecasts_lock:
+        _fold_forecasts[key] = value
+        while len(_fold_forecasts) > BACKTEST_CACHE_SIZE:
+            _fold_forecasts.popitem(last=False)
+
+
+def _run_tournament(
+    series: TimeSeries,
+    confidence: float,
+    holdout: int,
+    season_lengths: Dict[str, int],
+    lineage: Optional[str],
+) -> Tuple[str, Dict[str, Any]]:
+    # One-step backtests over the last `holdout` origins. Fast models are scored first; the best of them bounds the
+    # slower ones, which run side by side fold by fold and drop out once their summed error can no longer win.
+    errors: Dict[str, List[float]] = {name: [] for name in MODEL_REGISTRY}
+    status: Dict[str, str] = {}
+    orders: Dict[str, Optional[ArimaOrder]] = {name: None for name in MODEL_REGISTRY}
+    best_total = float("inf")
+    for fast_tier in (True, False):
+        alive = [name for name, spec in MODEL_REGISTRY.items() if spec.fast == fast_tier]
+        if "arima" in alive:
+            try:
+                fitted, budget_exceeded = _budgeted_fit(
+                    "arima",
+                    series.frequency,
+                    partial(
+                        select_arima_order,
+                        series.map(np.log1p),
+                        season_lengths["arima"] > 1,
+                        season_lengths["arima"],
+                        lineage=lineage,
+                    ),
+                )
+            except Exception:
+                alive.remove("arima")
+                status["arima"] = "failed"
+            else:
+                if fitted is None or budget_exceeded:
+                    alive.remove("arima")
+                    status["arima"] = "over_budget"
+                else:
+                    orders["arima"] = fitted
+
+        # Each candidate's budget covers all of its folds.
+        deadlines = {name: fit_deadline(fit_budget_seconds(name, series.frequency)) for name in alive}
+        for step in range(holdout, 0, -1):
+            train = series[:-step]
+            actual = float(series.values[-step])
+            fold_forecasts = {
+                name: _start_fold_forecast(
+                    train, name, confidence, orders[name], season_lengths[name], deadline=deadlines[name]
+                )
+                for name in alive
+            }
+            for name, fold_forecast in fold_forecasts.items():
+                try:
+                    errors[name].append(abs(actual - fold_forecast.result()))
+                except FitBudgetExceeded:
+                    status[name] = "over_budget"
+                    alive.remove(name)
+                    continue
+                except Exception:
+                    status[name] = "failed"
+                    alive.remove(name)
+                    continue
+                if sum(errors[name]) > best_total:
+                    status[name] = "eliminated"
+                    alive.remove(name)
+
+        for name in alive:
+            status[name] = "scored"
+            best_total = min(best_total, sum(errors[name]))
+
+    # Without a fully scored candidate the lowest partial error wins; without a single fold, the baseline does.
+    ranked = [name for name in MODEL_REGISTRY if status.get(name) == "scored"] or [
+        name for name in MODEL_REGISTRY if errors[name]
+    ]
+    winner = min(ranked, key=lambda name: float(np.mean(errors[name]))) if ranked else BASELINE_MODEL
+    if ranked:
+        status[winner] = "winner"
+    candidates = [
+        {
+            "model": name,
+            "label": MODEL_LABELS[name],
+            "mae": float(np.mean(errors[name])) if errors[name] else None,
+            "folds": len(errors[name]),
+            "status": status.get(name, "failed"),
+        }
+        for name in MODEL_REGISTRY
+    ]
+    return winner, {"selected_model": winner, "tournament": candidates}
+
+
+def _build_fallback_forecast(series: TimeSeries, periods: int) -> tuple[np.ndarray, np.ndarray]:
+    recent = series.tail(5)
+    last_value = float(recent[-1])
+    diffs = np.diff(recent) if len(recent) > 1 else np.asarray([0.0])
     median_diff = float(np.median(diffs)) if diffs.size else 0.0
-    linear_slope = float(np.polyfit(np.arange(len(recent)), recent.to_numpy(dtype=float), 1)[0]) if len(recent) > 1 else 0.0
+    linear_slope = float(np.polyfit(np.arange(len(recent)), recent, 1)[0]) if len(recent) > 1 else 0.0
     slope = (median_diff + linear_slope) / 2
     if abs(slope) < max(last_value * 0.005, 5.0) and len(recent) > 1:
-        slope = ((float(recent.iloc[-1]) - float(recent.iloc[0])) / max(len(recent) - 1, 1)) * 0.6
+        slope = ((float(recent[-1]) - float(recent[0])) / max(len(recent) - 1, 1)) * 0.6
     slope = float(np.clip(slope, -max(last_value * 0.18, 60.0), max(last_value * 0.18, 60.0)))
     uncertainty = max(float(np.std(diffs)) if diffs.size else 0.0, max(last_value * 0.08, 1.0))
 
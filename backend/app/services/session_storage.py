@@ -1,15 +1,48 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from dataclasses import asdict, replace
 from pathlib import Path
-import tempfile
-from typing import Any, Dict, Iterator
+import re
+from typing import Any, Dict, List
+import unicodedata
 
+import pandas as pd
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from ..models import AppSession, DatasetImport, ForecastRun, generate_id, utcnow
-from .forecast.csv_loader import detect_csv_metadata, detect_period_bounds, detect_source_frequency, preview_dataframe
+from ..models import (
+    AppSession,
+    DatasetImport,
+    DatasetPreview,
+    DatasetSeries,
+    DatasetSeriesFeatures,
+    ForecastRun,
+    generate_id,
+    utcnow,
+)
+from ..ui_options import UF_OPTIONS
+from .forecast.canonical_series import CanonicalSeries, build_canonical_series, decode_values, encode_values
+from .forecast.csv_loader import (
+    ParsedDataset,
+    load_state_codes,
+    load_state_matrix,
+    load_state_series,
+    parse_dataset,
+    preview_dataframe,
+)
+from .forecast.series_features import SeriesFeatures, compute_series_features
+
+PREVIEW_SNAPSHOT_ROWS = 200
+SERIES_COLUMNS = (
+    "state_label",
+    "source_frequency",
+    "start_period",
+    "point_count",
+    "values_blob",
+    "annual_start",
+    "annual_values_blob",
+)
 
 
 def ensure_session(db: Session, session_id: str | None) -> tuple[AppSession, bool]:
@@ -92,10 +125,8 @@ def save_datasus_import(
     preferred_content = tidy_content if preferred_kind == "tidy" else tabnet_content
     preferred_name = tidy_path.name if preferred_kind == "tidy" else tabnet_path.name
 
-    with temporary_csv_file(preferred_content, preferred_name) as csv_path:
-        metadata = detect_csv_metadata(csv_path)
-        frequency = detect_source_frequency(csv_path)
-        period_bounds = detect_period_bounds(csv_path)
+    dataset = parse_dataset(preferred_content)
+    period_bounds = dataset.period_bounds
 
     record = DatasetImport(
         session_id=session_record.id,
@@ -125,8 +156,8 @@ def save_datasus_import(
         preferred_file_name=preferred_name,
         tabnet_content=tabnet_content,
         tidy_content=tidy_content,
-        layout=metadata.layout,
-        frequency=frequency,
+        layout=dataset.layout,
+        frequency=dataset.source_frequency,
         size_kb=round(len(preferred_content) / 1024, 2),
         command_payload=export_payload.get("command"),
         resolved_rscript=export_payload.get("resolved_rscript"),
@@ -134,6 +165,9 @@ def save_datasus_import(
         stderr_text=export_payload.get("stderr", ""),
     )
 
+    record.preview = _build_preview_record(dataset.frame)
+    record.series.extend(_build_series_records(dataset, resolve_dataset_state_query(record)))
+
     db.add(record)
     db.commit()
     db.refresh(record)
@@ -147,15 +181,60 @@ def get_dataset_record(db: Session, session_id: str, dataset_id: str) -> Dataset
     return record
 
 
-def preview_dataset_record(record: DatasetImport, limit: int = 20) -> dict:
-    content = _preferred_content(record)
-    with temporary_csv_file(content, record.preferred_file_name) as csv_path:
-        preview_df = preview_dataframe(csv_path, limit=limit).fillna("")
+def load_dataset_series(db: Session, record: DatasetImport, state_query: str) -> CanonicalSeries:
+    state_key = _state_series_key(state_query)
+    statement = select(DatasetSeries).where(
+        DatasetSeries.dataset_id == record.id,
+        DatasetSeries.state_query == state_key,
+    )
+    series_record = db.scalars(statement).first()
+    if series_record is None:
+        built = _build_series_record(parse_dataset(get_dataset_content(record)), state_query)
+        # Concurrent first requests for a state both get here; the unique (dataset_id, state_query) index keeps one.
+        insert_statement = insert(DatasetSeries).values(
+            dataset_id=record.id,
+            state_query=state_key,
+            **{column: getattr(built, column) for column in SERIES_COLUMNS},
+        )
+        db.execute(insert_statement.on_conflict_do_nothing(index_elements=[DatasetSeries.dataset_id, DatasetSeries.state_query]))
+        db.commit()
+        series_record = db.scalars(statement).first() or built
+
+    canonical = CanonicalSeries(
+        state_label=series_record.state_label,
+        source_frequency=series_record.source_frequency,
+        start_period=series_record.start_period,
+        values=decode_values(series_record.values_blob),
+        annual_start=series_record.annual_start,
+        annual_values=decode_values(series_record.annual_values_blob),
+    )
+    if series_record.features is not None:
+        return replace(canonical, features=_features_from_record(series_record.features))
+
+    # Series stored without feature statistics get them on first use; concurrent requests compute the same values.
+    features = compute_series_features(canonical.time_series().trim_trailing_zeros())
+    if series_record.id is not None:
+        insert_statement = insert(DatasetSeriesFeatures).values(series_id=series_record.id, **asdict(features))
+        db.execute(insert_statement.on_conflict_do_nothing(index_elements=[DatasetSeriesFeatures.series_id]))
+        db.commit()
+    return replace(canonical, features=features)
+
+
+def preview_dataset_record(db: Session, record: DatasetImport, limit: int = 20) -> dict:
+    statement = select(DatasetPreview).where(DatasetPreview.dataset_id == record.id)
+    preview_record = db.scalars(statement).first()
+    if preview_record is None:
+        built = _build_preview_record(preview_dataframe(get_dataset_content(record), limit=PREVIEW_SNAPSHOT_ROWS))
+        # Concurrent first previews both get here; the unique dataset_id index keeps one snapshot.
+        insert_statement = insert(DatasetPreview).values(dataset_id=record.id, columns=built.columns, rows=built.rows)
+        db.execute(insert_statement.on_conflict_do_nothing(index_elements=[DatasetPreview.dataset_id]))
+        db.commit()
+        preview_record = db.scalars(statement).first() or built
 
     return {
         "dataset_id": record.id,
-        "columns": [str(column) for column in preview_df.columns.tolist()],
-        "rows": preview_df.astype(str).values.tolist(),
+        "columns": list(preview_record.columns),
+        "rows": preview_record.rows[:limit],
     }
 
 
@@ -244,30 +323,7 @@ def resolve_dataset_state_query(record: DatasetImport, fallback: str | None = No
     return (fallback or "").strip() or "21"
 
 
-@contextmanager
-def temporary_dataset_path(record: DatasetImport) -> Iterator[Path]:
-    content = _preferred_content(record)
-    with temporary_csv_file(content, record.preferred_file_name) as csv_path:
-        yield csv_path
-
-
-@contextmanager
-def temporary_csv_file(content: bytes, file_name: str) -> Iterator[Path]:
-    suffix = Path(file_name).suffix or ".csv"
-    handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    try:
-        handle.write(content)
-        handle.flush()
-        handle.close()
-        yield Path(handle.name)
-    finally:
-        try:
-            Path(handle.name).unlink(missing_ok=True)
-        except FileNotFoundError:
-            pass
-
-
-def _preferred_content(record: DatasetImport) -> bytes:
+def get_dataset_content(record: DatasetImport) -> bytes:
     if record.preferred_kind == "tidy" and record.tidy_content:
         return record.tidy_content
     if record.tabnet_content:
@@ -277,6 +333,80 @@ def _preferred_content(record: DatasetImport) -> bytes:
     raise FileNotFoundError("Dataset nao possui conteudo CSV disponivel.")
 
 
+def _build_preview_record(frame: pd.DataFrame) -> DatasetPreview:
+    preview_df = frame.head(PREVIEW_SNAPSHOT_ROWS).fillna("")
+    return DatasetPreview(
+        columns=[str(column) for column in preview_df.columns.tolist()],
+        rows=preview_df.astype(str).values.tolist(),
+    )
+
+
+def _state_series_key(state_query: str) -> str:
+    # Series are stored per UF code, so "21", "MA" and "Maranhao" all reach the same row.
+    query = (state_query or "").strip()
+    code_match = re.match(r"^(\d{2})\b", query)
+    if code_match:
+        return code_match.group(1)
+    folded = unicodedata.normalize("NFKD", query).encode("ascii", "ignore").decode("ascii").lower()
+    for option in UF_OPTIONS:
+        if folded in (option["sigla"].lower(), option["name"].lower()):
+            return option["code"]
+    return query
+
+
+def _build_series_records(dataset: ParsedDataset, default_query: str) -> List[DatasetSeries]:
+    # Every state is stored at import, so any state's first forecast reads its series instead of parsing the CSV.
+    if dataset.layout == "tabnet":
+        matrix = load_state_matrix(dataset)
+        return [
+            _series_record(
+                _state_series_key(label),
+                build_canonical_series(matrix.row(position), label, matrix.source_frequency),
+            )
+            for position, label in enumerate(matrix.labels)
+        ]
+
+    codes = load_state_codes(dataset)
+    if len(codes) < 2:
+        return [_build_series_record(dataset, default_query)]
+    return [_build_series_record(dataset, code) for code in codes]
+
+
+def _build_series_record(dataset: ParsedDataset, state_query: str) -> DatasetSeries:
+    series, state_label, source_frequency = load_state_series(dataset, state_query)
+    return _series_record(_state_series_key(state_query), build_canonical_series(series, state_label, source_frequency))
+
+
+def _series_record(state_key: str, canonical: CanonicalSeries) -> DatasetSeries:
+    return DatasetSeries(
+        state_query=state_key,
+        state_label=canonical.state_label,
+        source_frequency=canonical.source_frequency,
+        start_period=canonical.start_period,
+        point_count=len(canonical.values),
+        values_blob=encode_values(canonical.values),
+        annual_start=canonical.annual_start,
+        annual_values_blob=encode_values(canonical.annual_values),
+        features=_build_features_record(canonical),
+    )
+
+
+def _build_features_record(canonical: CanonicalSeries) -> DatasetSeriesFeatures:
+    # Measured on the trimmed series the engine fits, so stored and on-the-fly features agree.
+    return DatasetSeriesFeatures(**asdict(compute_series_features(canonical.time_series().trim_trailing_zeros())))
+
+
+def _features_from_record(record: DatasetSeriesFeatures) -> SeriesFeatures:
+    return SeriesFeatures(
+        season_length=record.season_length,
+        seasonal_strength=record.seasonal_strength,
+        trend_strength=record.trend_strength,
+        seasonal_acf=record.seasonal_acf,
+        dominant_period=record.dominant_period,
+        period_detected=record.period_detected,
+    )
+
+
 def _dataset_to_dict(record: DatasetImport) -> dict:
     return {
         "dataset_id": record.id,
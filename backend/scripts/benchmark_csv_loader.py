@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.forecast import csv_loader  # noqa: E402
+
+
+def _reference_to_numeric(values: pd.Series) -> pd.Series:
+    cleaned = values.astype(str).str.replace('"', "", regex=False).str.strip()
+    normalized = cleaned.map(csv_loader._normalize_numeric_text)
+    return pd.to_numeric(normalized, errors="coerce").fillna(0.0).astype(float)
+
+
+def _reference_parse_month_index(values: pd.Series) -> pd.DatetimeIndex:
+    raw = values.astype(str).str.replace('"', "", regex=False).str.strip()
+    if raw.str.fullmatch(r"\d{4}[-/]\d{2}").all():
+        parsed = pd.to_datetime(raw.str.replace("/", "-", regex=False) + "-01", format="%Y-%m-%d", errors="raise")
+        return pd.DatetimeIndex(parsed).to_period("M").to_timestamp(how="start")
+
+    normalized = raw.str.replace(
+        r"^(\d{4})/([A-Za-z]{3,})$",
+        lambda match: f"{match.group(1)}/{csv_loader.MONTH_ALIAS_MAP.get(match.group(2)[:3].upper(), match.group(2)[:3].title())}",
+        regex=True,
+    )
+    parsed = pd.to_datetime(normalized, format="%Y/%b", errors="raise")
+    return pd.DatetimeIndex(parsed).to_period("M").to_timestamp(how="start")
+
+
+def _format_brazilian(values: np.ndarray, rng: np.random.Generator) -> List[str]:
+    cells: List[str] = []
+    for value, style in zip(values, rng.integers(0, 4, size=len(values))):
+        if style == 0:
+            cells.append(f"{value:,}".replace(",", "."))
+        elif style == 1:
+            cells.append(f"{value / 100:,.2f}".replace(",", "_").replace(".", ",").replace("_", "."))
+        elif style == 2:
+            cells.append(str(value))
+        else:
+            cells.append("-")
+    return cells
+
+
+def _build_cases(rows: int, seed: int) -> Dict[str, pd.Series]:
+    rng = np.random.default_rng(seed)
+    tabnet_months = max(rows // 27, 1)
+    return {
+        f"tabnet 27 UFs x {tabnet_months} meses": pd.Series(
+            _format_brazilian(rng.integers(0, 250_000, size=27 * tabnet_months), rng)
+        ),
+        f"tidy municipios {rows} linhas": pd.Series(
+            [str(value) for value in rng.integers(0, 400, size=rows)]
+        ),
+        f"alta cardinalidade {rows} linhas": pd.Series(
+            _format_brazilian(rng.integers(0, 50_000_000, size=rows), rng)
+        ),
+    }
+
+
+def _build_month_cases(rows: int) -> Dict[str, pd.Series]:
+    aliases = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
+    years = range(1975, 2025)
+    named = [f"{year}/{alias}" for year in years for alias in aliases]
+    numeric = [f"{year}-{month:02d}" for year in years for month in range(1, 13)]
+    return {
+        f"serie mensal {len(named)} meses": pd.Series(named),
+        f"tidy mensal {rows} linhas": pd.Series((named * (rows // len(named) + 1))[:rows]),
+        f"tidy YYYY-MM {rows} linhas": pd.Series((numeric * (rows // len(numeric) + 1))[:rows]),
+    }
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the CSV loader parsing hot paths.")
+    parser.add_argument("--rows", type=int, default=500_000, help="Cells per synthetic column")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'caso':<40} {'referencia (s)':>15} {'otimizado (s)':>15} {'ganho':>8}  identico")
+    for label, values in _build_cases(args.rows, args.seed).items():
+        reference_time, reference = _best_time(lambda: _reference_to_numeric(values), args.repeat)
+        optimized_time, optimized = _best_time(lambda: csv_loader._to_numeric(values), args.repeat)
+        identical = np.array_equal(reference.to_numpy().view(np.int64), optimized.to_numpy().view(np.int64))
+        _print_row(label, reference_time, optimized_time, identical)
+
+    for label, values in _build_month_cases(args.rows).items():
+        reference_time, reference = _best_time(lambda: _reference_parse_month_index(values), args.repeat)
+        optimized_time, optimized = _best_time(lambda: csv_loader._parse_month_index(values), args.repeat)
+        _print_row(label, reference_time, optimized_time, bool(reference.equals(optimized)))
+
+
+def _print_row(label: str, reference_time: float, optimized_time: float, identical: bool) -> None:
+    speedup = reference_time / optimized_time if optimized_time else float("inf")
+    print(f"{label:<40} {reference_time:>15.4f} {optimized_time:>15.4f} {speedup:>7.1f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
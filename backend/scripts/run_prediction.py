@@ -9,15 +9,13 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.services.prediction_engine import generate_forecast  # noqa: E402
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run forecast from a CSV dataset.")
     parser.add_argument("--csv", required=True, help="CSV file path")
     parser.add_argument("--state", default="21", help="UF code, sigla or name")
     parser.add_argument("--mode", default="auto", choices=["auto", "annual", "monthly"])
-    parser.add_argument("--model", default="arima", choices=["arima", "theta"])
+    parser.add_argument("--model", default="arima", choices=["arima", "theta", "drift", "seasonal_naive", "ets", "auto"])
     parser.add_argument("--forecast-years", type=int, default=3)
     parser.add_argument("--forecast-periods", type=int, default=12)
     parser.add_argument("--confidence", type=float, default=0.95)
@@ -26,6 +24,9 @@ def main() -> None:
     parser.add_argument("--pretty", action="store_true")
     args = parser.parse_args()
 
+    # Imported after argument parsing so `--help` does not pay for pandas and the forecasting engine.
+    from app.services.prediction_engine import generate_forecast
+
     seasonal_value = None
     if args.seasonal == "true":
         seasonal_value = True
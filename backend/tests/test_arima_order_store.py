@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.services import prediction_engine
+from app.services.forecast import arima_forecaster, arima_order_store, model_cache
+from app.services.forecast.arima_order_store import ArimaOrder, InMemoryArimaOrderStore
+from app.services.forecast.model_cache import FittedModelCache
+from app.services.forecast.time_series import TimeSeries
+
+VALUES = np.log1p([120.0, 135.0, 128.0, 150.0, 161.0, 158.0, 172.0, 180.0, 176.0, 190.0, 201.0, 197.0, 214.0])
+LINEAGE = "SIM-DO|MA|I10|year|21 Maranhao"
+
+
+class ArimaOrderReuseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = InMemoryArimaOrderStore()
+        for patcher in (
+            mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024)),
+            mock.patch.object(arima_order_store, "_order_store", self.store),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _forecast(self, length: int, lineage: str | None = LINEAGE) -> tuple[np.ndarray, np.ndarray]:
+        return arima_forecaster.forecast_arima_log(TimeSeries(2008, "annual", VALUES[:length]), 3, 0.95, False, 1, lineage=lineage)
+
+    def test_refresh_refits_the_stored_order_without_searching(self) -> None:
+        with mock.patch.object(arima_forecaster, "auto_arima", wraps=arima_forecaster.auto_arima) as auto_arima:
+            searched = self._forecast(12)
+            model_cache._model_cache.clear()
+            refitted = self._forecast(12)
+            self._forecast(13)
+        self.assertEqual(auto_arima.call_count, 1)
+        np.testing.assert_array_equal(refitted[0], searched[0])
+        np.testing.assert_array_equal(refitted[1], searched[1])
+        self.assertEqual(self.store.get(f"{LINEAGE}|annual|m=1|seasonal=0").fits_since_search, 2)  # type: ignore[union-attr]
+
+    def test_search_runs_again_after_the_configured_number_of_refits(self) -> None:
+        self.store.put(f"{LINEAGE}|annual|m=1|seasonal=0", ArimaOrder((0, 1, 1), (0, 0, 0, 0), True, fits_since_search=2))
+        with mock.patch.object(arima_forecaster, "ARIMA_ORDER_RESEARCH_EVERY", 2), mock.patch.object(
+            arima_forecaster, "auto_arima", wraps=arima_forecaster.auto_arima
+        ) as auto_arima:
+            self._forecast(12)
+        self.assertEqual(auto_arima.call_count, 1)
+        self.assertEqual(self.store.get(f"{LINEAGE}|annual|m=1|seasonal=0").fits_since_search, 0)  # type: ignore[union-attr]
+
+    def test_warm_mode_starts_the_stepwise_search_from_the_stored_order(self) -> None:
+        self.store.put(f"{LINEAGE}|annual|m=1|seasonal=0", ArimaOrder((2, 1, 1), (0, 0, 0, 0), True))
+        with mock.patch.object(arima_forecaster, "ARIMA_ORDER_REUSE", "warm"), mock.patch.object(
+            arima_forecaster, "auto_arima", wraps=arima_forecaster.auto_arima
+        ) as auto_arima:
+            self._forecast(12)
+        self.assertEqual((auto_arima.call_args.kwargs["start_p"], auto_arima.call_args.kwargs["start_q"]), (2, 1))
+        self.assertEqual(self.store.get(f"{LINEAGE}|annual|m=1|seasonal=0").fits_since_search, 1)  # type: ignore[union-attr]
+
+    def test_fits_without_lineage_leave_the_store_untouched(self) -> None:
+        self._forecast(12, lineage=None)
+        self.assertEqual(self.store._orders, {})
+
+
+    def test_annual_arima_folds_start_before_a_reused_order_is_refitted(self) -> None:
+        series = TimeSeries(2008, "annual", np.expm1(VALUES[:12]))
+        stored = ArimaOrder((0, 1, 1), (0, 0, 0, 0), True, fits_since_search=1)
+        self.store.put(f"{LINEAGE}|annual|m=1|seasonal=0", stored)
+        reused = arima_forecaster.reused_arima_order(series.map(np.log1p), False, 1, LINEAGE)
+        self.assertEqual(reused, ArimaOrder((0, 1, 1), (0, 0, 0, 0), True))
+        self.assertIsNone(arima_forecaster.reused_arima_order(series.map(np.log1p), False, 1, None))
+
+        calls = []
+        start_folds = prediction_engine._start_fold_forecasts
+        model_forecast = prediction_engine._annual_model_forecast
+
+        def record_folds(*args):
+            calls.append(("folds", args[3]))
+            return start_folds(*args)
+
+        def record_fit(**kwargs):
+            calls.append(("fit", None))
+            return model_forecast(**kwargs)
+
+        with mock.patch.object(prediction_engine, "_start_fold_forecasts", side_effect=record_folds), mock.patch.object(
+            prediction_engine, "_annual_model_forecast", side_effect=record_fit
+        ):
+            prediction_engine.forecast_series(series, "21 Maranhao", "annual", model="arima", forecast_years=3, lineage=LINEAGE)
+
+        self.assertEqual(calls, [("folds", reused), ("fit", None)])
+
+if __name__ == "__main__":
+    unittest.main()
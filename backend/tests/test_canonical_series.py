@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.services.forecast.canonical_series import build_canonical_series, decode_values, encode_values
+from app.services.forecast.csv_loader import aggregate_to_annual, load_state_series
+from app.services.prediction_engine import forecast_series, generate_forecast
+from app.services.session_storage import _build_series_record
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "samples"
+EXPORTS_DIR = Path(__file__).resolve().parents[1] / "data" / "exports"
+TABNET_SAMPLE = SAMPLES_DIR / "sepse_obitos.csv"
+TIDY_SAMPLE = next(EXPORTS_DIR.glob("*_i10_*/*_dados_modelagem.csv"))
+
+
+def _monthly_tidy_content() -> bytes:
+    lines = ["sistema;uf_sigla;uf_codigo;uf_nome;granularidade;filtro_cid;periodo;valor"]
+    for offset in range(48):
+        year, month = 2019 + offset // 12, offset % 12 + 1
+        value = 40 + (offset % 12) * 3 + offset // 6
+        lines.append(f"SIM-DO;MA;21;Maranh\u00e3o;mensal;I10;{year}-{month:02d};{value}")
+    return "\n".join(lines).encode("utf-8")
+
+
+MONTHLY_CONTENT = _monthly_tidy_content()
+
+
+class CanonicalSeriesTests(unittest.TestCase):
+    def test_round_trip_restores_series_and_annual_rollup(self) -> None:
+        for csv_path, state in ((TABNET_SAMPLE, "21"), (TIDY_SAMPLE, "MA"), (MONTHLY_CONTENT, "MA")):
+            with self.subTest(source=getattr(csv_path, "name", "monthly")):
+                series, label, frequency = load_state_series(csv_path, state)
+                record = _build_series_record(csv_path, state)
+
+                self.assertEqual(record.state_label, label)
+                self.assertEqual(record.source_frequency, frequency)
+                self.assertEqual(record.point_count, len(series))
+                np.testing.assert_array_equal(decode_values(record.values_blob), series.to_numpy(dtype=float))
+
+                canonical = build_canonical_series(series, label, frequency)
+                restored = canonical.time_series().to_pandas()
+                np.testing.assert_array_equal(restored.to_numpy(), series.to_numpy(dtype=float))
+                self.assertTrue(pd.Index(restored.index).equals(pd.Index(series.index)))
+
+                expected_annual = aggregate_to_annual(series) if frequency == "monthly" else series
+                np.testing.assert_array_equal(canonical.annual_time_series().to_pandas().to_numpy(), expected_annual.to_numpy(dtype=float))
+                self.assertEqual(list(canonical.annual_time_series().to_pandas().index), [int(year) for year in expected_annual.index])
+
+    def test_forecast_from_canonical_series_matches_csv_forecast(self) -> None:
+        cases = ((TABNET_SAMPLE, "21", "annual"), (TIDY_SAMPLE, "MA", "auto"), (MONTHLY_CONTENT, "MA", "monthly"), (MONTHLY_CONTENT, "MA", "annual"))
+        for csv_path, state, mode in cases:
+            with self.subTest(source=getattr(csv_path, "name", "monthly"), mode=mode):
+                series, label, frequency = load_state_series(csv_path, state)
+                canonical = build_canonical_series(series, label, frequency)
+                expected = generate_forecast(dataset_path=csv_path, state=state, mode=mode, model="theta", forecast_years=2, forecast_periods=6)
+                actual = forecast_series(
+                    series=canonical.time_series().to_pandas(),
+                    annual_series=canonical.annual_time_series().to_pandas(),
+                    state_label=canonical.state_label,
+                    source_frequency=canonical.source_frequency,
+                    mode=mode,
+                    model="theta",
+                    forecast_years=2,
+                    forecast_periods=6,
+                )
+                self.assertEqual(actual, expected)
+
+    def test_gapped_series_is_rejected(self) -> None:
+        series = pd.Series([1.0, 2.0], index=pd.DatetimeIndex(["2020-01-01", "2020-03-01"]))
+        with self.assertRaisesRegex(ValueError, "contiguous"):
+            build_canonical_series(series, "MA", "monthly")
+
+    def test_encoded_values_are_little_endian_float64(self) -> None:
+        values = np.array([0.0, -0.0, 1.5, 1e300])
+        payload = encode_values(values)
+        self.assertEqual(len(payload), values.size * 8)
+        self.assertEqual(decode_values(payload).view(np.int64).tolist(), values.view(np.int64).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
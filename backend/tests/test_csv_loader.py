@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import io
+import random
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from app.services.forecast import csv_loader
+from app.services.forecast.csv_loader import (
+    detect_csv_metadata,
+    detect_period_bounds,
+    detect_source_frequency,
+    load_state_matrix,
+    load_state_series,
+    parse_dataset,
+    preview_dataframe,
+    sniff_csv_metadata,
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "samples"
+EXPORTS_DIR = Path(__file__).resolve().parents[1] / "data" / "exports"
+TABNET_SAMPLE = SAMPLES_DIR / "sepse_obitos.csv"
+TIDY_SAMPLE = next(EXPORTS_DIR.glob("*_i10_*/*_dados_modelagem.csv"))
+
+
+class ParsedDatasetTests(unittest.TestCase):
+    def test_parsed_dataset_matches_path_based_entry_points(self) -> None:
+        for csv_path, state in ((TABNET_SAMPLE, "21"), (TIDY_SAMPLE, "MA")):
+            with self.subTest(csv_path=csv_path.name):
+                dataset = parse_dataset(csv_path)
+                series, label, frequency = load_state_series(dataset, state)
+                expected_series, expected_label, expected_frequency = load_state_series(csv_path, state)
+
+                self.assertEqual(label, expected_label)
+                self.assertEqual(frequency, expected_frequency)
+                self.assertTrue(series.equals(expected_series))
+                self.assertEqual(detect_source_frequency(dataset), detect_source_frequency(csv_path))
+                self.assertEqual(detect_period_bounds(dataset), detect_period_bounds(csv_path))
+                self.assertTrue(preview_dataframe(dataset, limit=5).equals(preview_dataframe(csv_path, limit=5)))
+
+    def test_shared_dataset_reads_the_file_once(self) -> None:
+        with mock.patch.object(csv_loader, "_read_lines", wraps=csv_loader._read_lines) as read_lines:
+            dataset = parse_dataset(TABNET_SAMPLE)
+            load_state_series(dataset, "21")
+            load_state_series(dataset, "35")
+            detect_period_bounds(dataset)
+            detect_source_frequency(dataset)
+        self.assertEqual(read_lines.call_count, 1)
+
+    def test_tabnet_sample_metadata(self) -> None:
+        dataset = parse_dataset(TABNET_SAMPLE)
+        self.assertEqual(dataset.layout, "tabnet")
+        self.assertEqual(dataset.source_frequency, "annual")
+        self.assertEqual(dataset.period_bounds["year_start"], 2012)
+        self.assertEqual(dataset.period_bounds["year_end"], 2022)
+        self.assertEqual(len(dataset.frame), 27)
+
+
+class InMemorySourceTests(unittest.TestCase):
+    def test_bytes_and_buffers_match_file_paths(self) -> None:
+        for csv_path, state in ((TABNET_SAMPLE, "21"), (TIDY_SAMPLE, "MA")):
+            content = csv_path.read_bytes()
+            expected_series, expected_label, _ = load_state_series(csv_path, state)
+            for source in (content, io.BytesIO(content)):
+                with self.subTest(csv_path=csv_path.name, source=type(source).__name__):
+                    series, label, _ = load_state_series(source, state)
+                    self.assertEqual(label, expected_label)
+                    self.assertTrue(series.equals(expected_series))
+
+            self.assertEqual(detect_csv_metadata(content), detect_csv_metadata(csv_path))
+            self.assertEqual(detect_period_bounds(content), detect_period_bounds(csv_path))
+            self.assertTrue(preview_dataframe(content).equals(preview_dataframe(csv_path)))
+
+    def test_latin1_bytes_are_decoded(self) -> None:
+        dataset = parse_dataset(TABNET_SAMPLE.read_bytes())
+        self.assertEqual(dataset.encoding, "ISO-8859-1")
+        _, label, _ = load_state_series(dataset, "21")
+        self.assertEqual(label, "21 Maranh\u00e3o")
+
+    def test_separator_bytes_inside_fields_do_not_split_rows(self) -> None:
+        # 0x85 is a cp1252 ellipsis; read as ISO-8859-1 it becomes U+0085, which str.splitlines() treats as a break.
+        lines = ["sistema;uf_sigla;uf_codigo;uf_nome;granularidade;filtro_cid;periodo;valor"]
+        lines += [f"SIM-DO;MA;21;Maranh\xe3o\u2026;anual;I10\x0c;{year};{10 + year % 7}" for year in (2019, 2020, 2021)]
+        content = "\r\n".join(lines).encode("cp1252")
+
+        self.assertEqual(pd.read_csv(io.BytesIO(content), sep=";", encoding="cp1252").shape, (3, 8))
+        series, _, frequency = load_state_series(content, "MA")
+        self.assertEqual(frequency, "annual")
+        self.assertEqual(series.tolist(), [13.0, 14.0, 15.0])
+
+    def test_empty_content_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "empty"):
+            parse_dataset(b"")
+
+
+class StateMatrixTests(unittest.TestCase):
+    def test_matrix_rows_match_per_state_series(self) -> None:
+        for csv_path in (TABNET_SAMPLE, SAMPLES_DIR / "sepse_respiradores_artificiais.csv"):
+            dataset = parse_dataset(csv_path)
+            matrix = load_state_matrix(dataset)
+            self.assertEqual(matrix.values.shape, (27, len(matrix.periods)))
+            for position, label in enumerate(matrix.labels):
+                with self.subTest(csv_path=csv_path.name, state=label):
+                    expected, expected_label, frequency = load_state_series(dataset, label[:2])
+                    series, state_label, _ = matrix.state_series(label[:2])
+                    self.assertEqual((state_label, frequency), (expected_label, matrix.source_frequency))
+                    self.assertTrue(series.equals(expected))
+                    self.assertTrue(matrix.row(position).equals(expected))
+
+    def test_monthly_matrix_fills_missing_months(self) -> None:
+        content = (
+            "Unidade da Federa\u00e7\u00e3o;2020/Jan;2020/Mar;2020/Fev\n"
+            "21 Maranh\u00e3o;1;3;2\n"
+            "35 S\u00e3o Paulo;10;\"1.500\";-\n"
+            "Total;11;1.503;2\n"
+        ).encode("utf-8")
+        matrix = load_state_matrix(content)
+        self.assertEqual(matrix.labels, ("21 Maranh\u00e3o", "35 S\u00e3o Paulo"))
+        self.assertEqual([stamp.strftime("%Y-%m") for stamp in matrix.periods], ["2020-01", "2020-02", "2020-03"])
+        np.testing.assert_array_equal(matrix.values, [[1.0, 2.0, 3.0], [10.0, 0.0, 1500.0]])
+        self.assertEqual(matrix.to_frame().loc["35 S\u00e3o Paulo"].tolist(), [10.0, 0.0, 1500.0])
+
+    def test_tidy_files_are_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "TABNET"):
+            load_state_matrix(TIDY_SAMPLE)
+
+
+class _CountingBuffer(io.BytesIO):
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.bytes_read = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class SniffMetadataTests(unittest.TestCase):
+    def test_sniffed_metadata_matches_full_parse(self) -> None:
+        for csv_path in (TABNET_SAMPLE, SAMPLES_DIR / "sepse_respiradores_artificiais.csv", TIDY_SAMPLE):
+            with self.subTest(csv_path=csv_path.name):
+                expected = parse_dataset(csv_path).metadata
+                self.assertEqual(sniff_csv_metadata(csv_path), expected)
+                self.assertEqual(sniff_csv_metadata(csv_path.read_bytes(), prefix_bytes=64), expected)
+
+    def test_sniffer_reads_a_bounded_prefix(self) -> None:
+        lines = ["sistema;uf_sigla;granularidade;periodo;valor"]
+        lines.extend(f"SIM-DO;MA;mensal;{2000 + index // 12}-{index % 12 + 1:02d};{index}" for index in range(50_000))
+        buffer = _CountingBuffer("\n".join(lines).encode("utf-8"))
+
+        metadata = sniff_csv_metadata(buffer, prefix_bytes=4096)
+
+        self.assertEqual((metadata.layout, metadata.source_frequency), ("tidy", "monthly"))
+        self.assertLess(buffer.bytes_read, 4096 * 4 + 1)
+        self.assertEqual(buffer.tell(), 0)
+        self.assertEqual(len(parse_dataset(buffer).frame), 50_000)
+
+    def test_prefix_cut_inside_a_multibyte_character(self) -> None:
+        content = "sistema;uf_nome;periodo;valor\n" + "SIM;Maranh\u00e3o;2020;1\n" * 400
+        prefix_bytes = content.encode("utf-8").index("\u00e3".encode("utf-8")) + 1
+        metadata = sniff_csv_metadata(content.encode("utf-8"), prefix_bytes=prefix_bytes)
+        self.assertEqual((metadata.encoding, metadata.source_frequency), ("utf-8-sig", "annual"))
+
+
+class NumericParsingTests(unittest.TestCase):
+    EDGE_CASES = [
+        "", ".", ",", "-", "+5", "-0", "-0,0", "1.234", "1,5", "1.234,56", "1,234.56", "12,345",
+        "1.2.3", "1,2,3", "1.23,4", ",5", ".5", "5,", "5.", "1.5,", "5,,5", "nan", "inf", "1e3",
+        " 3 ", '"7,5"', '" -1.234,5 "', "- 5", "5-", "1 2", "\u0663,\u0663", "9" * 16, "9" * 30,
+    ]
+
+    def _reference(self, values: pd.Series) -> pd.Series:
+        cleaned = values.astype(str).str.replace('"', "", regex=False).str.strip()
+        normalized = cleaned.map(csv_loader._normalize_numeric_text)
+        return pd.to_numeric(normalized, errors="coerce").fillna(0.0).astype(float)
+
+    def _assert_bit_identical(self, values: pd.Series) -> None:
+        expected = self._reference(values).to_numpy()
+        actual = csv_loader._to_numeric(values).to_numpy()
+        self.assertEqual(expected.dtype, actual.dtype)
+        mismatches = np.flatnonzero(expected.view(np.int64) != actual.view(np.int64))
+        self.assertEqual(
+            [(values.iloc[index], expected[index], actual[index]) for index in mismatches[:5]],
+            [],
+        )
+
+    def test_edge_cases_match_scalar_rules(self) -> None:
+        self._assert_bit_identical(pd.Series(self.EDGE_CASES + [None]))
+
+    def test_random_cells_match_scalar_rules(self) -> None:
+        generator = random.Random(11)
+        for alphabet in ("0123456789.,", '0123456789.,-+ "', "0123456789.,-e a\t"):
+            with self.subTest(alphabet=alphabet):
+                cells = [
+                    "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 12)))
+                    for _ in range(5000)
+                ]
+                self._assert_bit_identical(pd.Series(cells))
+
+    def test_integer_only_columns_do_not_keep_negative_zero(self) -> None:
+        self._assert_bit_identical(pd.Series(["-0", "5", "7"]))
+        self._assert_bit_identical(pd.Series(["-0", "5", "1,5"]))
+
+
+class MonthLabelParsingTests(unittest.TestCase):
+    def test_portuguese_english_and_numeric_labels(self) -> None:
+        named = csv_loader._parse_month_index(pd.Series(["2020/Jan", '"2020/Fev"', " 2020/mar ", "2020/DEZEMBRO", "2021/Sept"]))
+        self.assertEqual(
+            [stamp.strftime("%Y-%m") for stamp in named],
+            ["2020-01", "2020-02", "2020-03", "2020-12", "2021-09"],
+        )
+        numeric = csv_loader._parse_month_index(pd.Series(["2020-11", "2020/12", "2021-01"]))
+        self.assertEqual([stamp.strftime("%Y-%m") for stamp in numeric], ["2020-11", "2020-12", "2021-01"])
+        self.assertEqual(numeric.dtype, pd.date_range("2020-01-01", periods=1, freq="MS").dtype)
+
+    def test_missing_named_labels_become_nat(self) -> None:
+        parsed = csv_loader._parse_month_index(pd.Series(["2020/Jan", None], dtype=object))
+        self.assertTrue(pd.isna(parsed[1]))
+
+    def test_invalid_or_mixed_labels_raise(self) -> None:
+        for labels in (["2020/Xyz"], ["2020-13"], ["2020/Jan", "2020-02"], ["2020-01", None], ["2020/Feb2"]):
+            with self.subTest(labels=labels):
+                with self.assertRaises(ValueError):
+                    csv_loader._parse_month_index(pd.Series(labels, dtype=object))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from app.services import prediction_engine
+from app.services.forecast.fast_models import (
+    forecast_damped_ets_log,
+    forecast_drift_log,
+    forecast_seasonal_naive_log,
+)
+from app.services.forecast.time_series import TimeSeries
+
+MONTHS = np.arange(48)
+MONTHLY = TimeSeries(2019 * 12, "monthly", 200 + 2.0 * MONTHS + 40 * np.sin(2 * np.pi * MONTHS / 12))
+ANNUAL = TimeSeries(2010, "annual", np.asarray([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0]))
+
+
+class FastModelTests(unittest.TestCase):
+    def test_drift_extends_a_straight_line_exactly(self) -> None:
+        forecast, interval = forecast_drift_log(TimeSeries(2010, "annual", np.arange(1.0, 9.0)), 3, 0.95, 1)
+        np.testing.assert_allclose(forecast, [9.0, 10.0, 11.0])
+        np.testing.assert_allclose(interval, np.column_stack([forecast, forecast]))
+
+    def test_seasonal_naive_repeats_the_last_season(self) -> None:
+        forecast, interval = forecast_seasonal_naive_log(MONTHLY, 18, 0.95, 12)
+        np.testing.assert_array_equal(forecast[:12], MONTHLY.values[-12:])
+        np.testing.assert_array_equal(forecast[12:], MONTHLY.values[-12:-6])
+        widths = interval[:, 1] - interval[:, 0]
+        self.assertAlmostEqual(widths[12] / widths[0], np.sqrt(2))
+
+    def test_damped_ets_flattens_the_trend(self) -> None:
+        forecast, interval = forecast_damped_ets_log(ANNUAL.map(np.log1p), 8, 0.9, 1)
+        steps = np.diff(forecast)
+        self.assertTrue(np.all(np.abs(steps[1:]) <= np.abs(steps[:-1]) + 1e-12))
+        self.assertTrue(np.all(interval[:, 0] <= forecast) and np.all(forecast <= interval[:, 1]))
+        self.assertTrue(np.all(np.diff(interval[:, 1] - interval[:, 0]) >= 0))
+
+
+class FastModelRegistryTests(unittest.TestCase):
+    def test_fast_models_are_selectable_options(self) -> None:
+        options = {item["value"] for item in prediction_engine.get_available_model_options()}
+        self.assertTrue({"arima", "theta", "drift", "seasonal_naive", "ets"} <= options)
+        with self.assertRaises(ValueError):
+            prediction_engine.forecast_series(ANNUAL, "x", "annual", model="prophet")
+
+    def test_fast_models_forecast_both_frequencies(self) -> None:
+        for model in ("drift", "seasonal_naive", "ets"):
+            with self.subTest(model=model):
+                annual = prediction_engine.forecast_series(ANNUAL, "x", "annual", mode="annual", model=model, forecast_years=3)
+                monthly = prediction_engine.forecast_series(MONTHLY, "x", "monthly", mode="monthly", model=model, forecast_periods=12)
+                self.assertEqual(len(annual["forecast"]), 3)
+                self.assertEqual(len(monthly["forecast"]), 12)
+                self.assertEqual(monthly["seasonal"], model == "seasonal_naive")
+                for point in monthly["forecast"]:
+                    self.assertLessEqual(point["lower"], point["value"])
+                    self.assertLessEqual(point["value"], point["upper"])
+
+
+if __name__ == "__main__":
+    unittest.main()
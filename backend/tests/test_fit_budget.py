@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import time
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+from app.config import parse_fit_budgets
+from app.services import prediction_engine
+from app.services.forecast import arima_forecaster, arima_order_store, fit_budget, model_cache, native_arima, process_pool
+from app.services.forecast.arima_order_store import ArimaOrder, InMemoryArimaOrderStore
+from app.services.forecast.fit_budget import FitBudgetExceeded, budget_fit_args, check_fit_budget, fit_budget_seconds
+from app.services.forecast.model_cache import FittedModelCache, cached_fit
+from app.services.forecast.time_series import TimeSeries
+
+MONTHS = np.arange(96)
+NOISE = np.random.default_rng(0).normal(0, 5, len(MONTHS))
+MONTHLY = TimeSeries(2015 * 12, "monthly", 200 + 50 * np.sin(2 * np.pi * MONTHS / 12) + np.cumsum(NOISE))
+ANNUAL = TimeSeries(2010, "annual", np.asarray([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0]))
+
+
+class FitBudgetTests(unittest.TestCase):
+    def test_budgets_resolve_from_model_frequency_to_default(self) -> None:
+        budgets = {"arima.monthly": 20.0, "theta": 5.0}
+        with mock.patch.object(fit_budget, "FORECAST_FIT_BUDGETS", budgets), mock.patch.object(
+            fit_budget, "FORECAST_FIT_BUDGET_SECONDS", 30.0
+        ):
+            self.assertEqual(fit_budget_seconds("arima", "monthly"), 20.0)
+            self.assertEqual(fit_budget_seconds("arima", "annual"), 30.0)
+            self.assertEqual(fit_budget_seconds("theta", "monthly"), 5.0)
+
+    def test_budget_overrides_are_parsed_or_rejected(self) -> None:
+        self.assertEqual(parse_fit_budgets(" arima.monthly=20, Theta=0.5 ,"), {"arima.monthly": 20.0, "theta": 0.5})
+        for raw in ("arima.monthly=20,theta", "=5", "theta=fast"):
+            with self.subTest(raw=raw), self.assertRaisesRegex(ValueError, "FORECAST_FIT_BUDGETS"):
+                parse_fit_budgets(raw)
+
+    def test_checks_only_fire_inside_an_expired_budget(self) -> None:
+        check_fit_budget()
+        self.assertEqual(budget_fit_args(), {})
+        with fit_budget.fit_budget(0):
+            self.assertEqual(budget_fit_args(), {})
+            check_fit_budget()
+        with fit_budget.fit_budget(60) as budget:
+            self.assertFalse(budget.expired)
+            self.assertIn("callback", budget_fit_args())
+            check_fit_budget()
+        with fit_budget.fit_budget(0.001):
+            time.sleep(0.01)
+            with self.assertRaises(FitBudgetExceeded):
+                check_fit_budget()
+
+    def test_fits_past_their_budget_are_not_cached(self) -> None:
+        values = np.arange(5.0)
+        with mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=1024 * 1024)):
+            with fit_budget.fit_budget(0.001):
+                cached_fit("slow", values, {}, lambda: time.sleep(0.01) or "partial")
+            self.assertEqual(cached_fit("slow", values, {}, lambda: "full"), "full")
+
+
+    def test_failed_refits_search_only_within_the_budget(self) -> None:
+        order = ArimaOrder(order=(1, 1, 0), seasonal_order=(0, 0, 0, 0), with_intercept=True)
+        values = np.arange(12.0)
+        with mock.patch.object(arima_forecaster, "_refit_order", side_effect=RuntimeError("singular")), mock.patch.object(
+            arima_forecaster, "_search_arima", return_value="searched"
+        ) as search:
+            with fit_budget.fit_budget_until(time.monotonic() - 1), self.assertRaises(FitBudgetExceeded):
+                arima_forecaster._fit_fixed_order(values, order, False, 1, 3)
+            search.assert_not_called()
+            self.assertEqual(arima_forecaster._fit_fixed_order(values, order, False, 1, 3), "searched")
+
+    def test_failed_stored_order_refits_search_only_within_the_budget(self) -> None:
+        store = InMemoryArimaOrderStore()
+        store.put("lineage|annual|m=1|seasonal=0", ArimaOrder(order=(1, 1, 0), seasonal_order=(0, 0, 0, 0), with_intercept=True))
+        series_log = TimeSeries(2010, "annual", np.log1p(np.arange(100.0, 112.0)))
+        with mock.patch.object(arima_order_store, "_order_store", store), mock.patch.object(
+            arima_forecaster, "_refit_order", side_effect=FitBudgetExceeded("The model fit exceeded its time budget.")
+        ), mock.patch.object(arima_forecaster, "_search_arima", return_value="searched") as search:
+            with fit_budget.fit_budget_until(time.monotonic() - 1), self.assertRaises(FitBudgetExceeded):
+                arima_forecaster._fit_arima(series_log, False, 1, 3, "lineage")
+            search.assert_not_called()
+
+    def test_native_fits_stop_at_the_budget(self) -> None:
+        values = np.log1p(np.arange(100.0, 112.0))
+        with fit_budget.fit_budget_until(time.monotonic() - 1), self.assertRaises(FitBudgetExceeded):
+            native_arima.search_native_arima(values, 2)
+        self.assertEqual(native_arima.fit_native_arima(values, (1, 1, 0), True).order, (1, 1, 0))
+
+    def test_fold_fits_carry_their_deadline(self) -> None:
+        train = TimeSeries(2010, "annual", np.arange(100.0, 110.0))
+        with self.assertRaises(FitBudgetExceeded):
+            prediction_engine._compute_fold_forecast(train, "drift", 0.95, None, 1, time.monotonic() - 1)
+        self.assertGreater(prediction_engine._compute_fold_forecast(train, "drift", 0.95, None, 1, time.monotonic() + 60), 100)
+
+class BudgetedForecastTests(unittest.TestCase):
+    def setUp(self) -> None:
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+        self.store = InMemoryArimaOrderStore()
+        for patcher in (
+            mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024)),
+            mock.patch.object(arima_order_store, "_order_store", self.store),
+            mock.patch.object(process_pool, "FORECAST_WORKERS", 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_seasonal_search_stops_at_the_budget(self) -> None:
+        started = time.perf_counter()
+        with mock.patch.object(prediction_engine, "fit_budget_seconds", return_value=0.05):
+            result = prediction_engine.forecast_series(MONTHLY, "21 Maranhao", "monthly", forecast_periods=12, lineage="lineage")
+
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertTrue(result["budget_exceeded"])
+        self.assertEqual(result["forecast_points"], 12)
+        self.assertFalse(model_cache._model_cache._entries)
+        self.assertIsNone(self.store.get("lineage|monthly|m=12|seasonal=1"))
+
+    def test_late_fits_are_kept_and_skip_the_backtest(self) -> None:
+        def late_fit(series_log, periods, confidence, season_length, lineage, order):
+            time.sleep(0.01)
+            forecast = np.log1p([450.0, 465.0, 480.0])
+            return forecast, np.column_stack([forecast - 0.1, forecast + 0.1])
+
+        spec = prediction_engine.ForecastModelSpec("Theta", "ThetaForecaster", late_fit)
+        with mock.patch.dict(prediction_engine.MODEL_REGISTRY, {"theta": spec}), mock.patch.object(
+            prediction_engine, "fit_budget_seconds", return_value=0.001
+        ), mock.patch.object(prediction_engine, "_start_fold_forecasts") as folds:
+            result = prediction_engine.forecast_series(ANNUAL, "21 Maranhao", "annual", model="theta", forecast_years=3)
+
+        folds.assert_called_once()
+        self.assertTrue(result["budget_exceeded"])
+        self.assertEqual(result["model"], "ThetaForecaster")
+        np.testing.assert_allclose([point["value"] for point in result["forecast"]], [450.0, 465.0, 480.0])
+
+    def test_unfinished_fits_fall_back_to_the_baseline(self) -> None:
+        def expired_fit(**kwargs):
+            time.sleep(0.01)
+            raise FitBudgetExceeded("The model fit exceeded its time budget.")
+
+        with mock.patch.object(prediction_engine, "_annual_model_forecast", side_effect=expired_fit), mock.patch.object(
+            prediction_engine, "fit_budget_seconds", return_value=0.001
+        ), mock.patch.object(prediction_engine, "select_arima_order") as select_order:
+            result = prediction_engine.forecast_series(ANNUAL, "21 Maranhao", "annual", forecast_years=3)
+
+        select_order.assert_not_called()
+        self.assertTrue(result["budget_exceeded"])
+        self.assertEqual(result["model"], "ARIMA (auto_arima) (modo robusto)")
+        expected, _ = prediction_engine._build_fallback_forecast(ANNUAL, 3)
+        np.testing.assert_allclose([point["value"] for point in result["forecast"]], expected)
+
+    def test_fits_within_budget_are_unchanged(self) -> None:
+        result = prediction_engine.forecast_series(ANNUAL, "21 Maranhao", "annual", model="drift", forecast_years=3)
+        self.assertFalse(result["budget_exceeded"])
+        self.assertEqual(result["model"], "Passeio aleatorio com drift")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from app.models import ForecastCacheEntry, utcnow
+from app.services import prediction_engine
+from app.services.forecast.canonical_series import build_canonical_series
+from app.services.forecast.csv_loader import load_state_series
+from app.services.forecast.time_series import TimeSeries
+from app.services.forecast_cache import build_forecast_cache_key, get_cached_forecast, store_cached_forecast
+from app.services.prediction_engine import normalize_forecast_parameters
+
+TABNET_SAMPLE = Path(__file__).resolve().parents[1] / "data" / "samples" / "sepse_obitos.csv"
+NON_SEASONAL = TimeSeries(2015 * 12, "monthly", 200 + np.cumsum(np.random.default_rng(0).normal(0, 5, 60)))
+
+
+def _key(source_frequency: str = "annual", **overrides) -> str:
+    return build_forecast_cache_key("fingerprint", "21 Maranhao", normalize_forecast_parameters(source_frequency, **overrides))
+
+
+class ForecastCacheKeyTests(unittest.TestCase):
+    def test_equivalent_requests_share_a_key(self) -> None:
+        self.assertEqual(_key(mode="auto"), _key(mode="annual"))
+        self.assertEqual(_key(model="ARIMA "), _key(model="arima"))
+        self.assertEqual(_key(forecast_periods=6, seasonal=False), _key(forecast_periods=24, seasonal=True))
+        self.assertEqual(_key("monthly", forecast_years=9), _key("monthly", forecast_years=1))
+
+    def test_result_changing_parameters_change_the_key(self) -> None:
+        baseline = _key()
+        for overrides in ({"model": "theta"}, {"forecast_years": 5}, {"confidence": 0.9}):
+            with self.subTest(overrides=overrides):
+                self.assertNotEqual(_key(**overrides), baseline)
+        self.assertNotEqual(_key("monthly", seasonal=False), _key("monthly", seasonal=True))
+        self.assertNotEqual(_key("monthly", mode="annual"), _key("monthly", mode="monthly"))
+
+    def test_unset_seasonality_does_not_share_the_seasonal_key(self) -> None:
+        # Without a yearly cycle, an unset flag fits m=1 while an explicit True keeps the m=12 search.
+        lengths = {
+            seasonal: prediction_engine._monthly_season_lengths(NON_SEASONAL, seasonal, None)["arima"]
+            for seasonal in (None, True)
+        }
+        self.assertEqual(lengths, {None: 1, True: 12})
+        self.assertNotEqual(_key("monthly", seasonal=None), _key("monthly", seasonal=True))
+        self.assertEqual(_key(seasonal=None), _key(seasonal=True))
+
+    def test_fingerprint_depends_only_on_series_content(self) -> None:
+        first = build_canonical_series(*load_state_series(TABNET_SAMPLE, "21"))
+        again = build_canonical_series(*load_state_series(TABNET_SAMPLE.read_bytes(), "21"))
+        other = build_canonical_series(*load_state_series(TABNET_SAMPLE, "35"))
+        self.assertEqual(first.fingerprint, again.fingerprint)
+        self.assertNotEqual(first.fingerprint, other.fingerprint)
+
+
+class ForecastCacheStorageTests(unittest.TestCase):
+    def test_expired_entries_are_misses(self) -> None:
+        db = mock.MagicMock()
+        db.get.return_value = ForecastCacheEntry(cache_key="k", result_payload={"model": "x"}, hit_count=0, expires_at=utcnow() - timedelta(seconds=1))
+        self.assertIsNone(get_cached_forecast(db, "k"))
+        db.commit.assert_not_called()
+
+    def test_hits_are_counted(self) -> None:
+        db = mock.MagicMock()
+        entry = ForecastCacheEntry(cache_key="k", result_payload={"model": "x"}, hit_count=2, expires_at=utcnow() + timedelta(hours=1))
+        db.get.return_value = entry
+        self.assertEqual(get_cached_forecast(db, "k"), {"model": "x"})
+        self.assertEqual(entry.hit_count, 3)
+
+    def test_store_upserts_and_evicts(self) -> None:
+        db = mock.MagicMock()
+        store_cached_forecast(db, "k", {"model": "x"})
+        statements = [str(call.args[0].compile(dialect=postgresql.dialect())) for call in db.execute.call_args_list]
+        self.assertIn("ON CONFLICT (cache_key) DO UPDATE", statements[0])
+        self.assertTrue(all(statement.startswith("DELETE FROM forecast_cache") for statement in statements[1:]))
+        self.assertIn("OFFSET", statements[-1])
+        db.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
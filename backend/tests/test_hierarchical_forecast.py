@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from app.api import api_routes
+from app.models import AppSession, DatasetImport
+from app.schemas import HierarchyForecastRequest
+from app.services.forecast.csv_loader import StateMatrix, load_state_matrix, load_state_series
+from app.services import hierarchical_forecast
+from app.services.forecast import process_pool
+from app.services.hierarchical_forecast import NATIONAL_LABEL, generate_hierarchical_forecast, reconcile_forecasts
+from app.services.prediction_engine import BASELINE_LABEL, forecast_series
+
+TABNET_SAMPLE = Path(__file__).resolve().parents[1] / "data" / "samples" / "sepse_obitos.csv"
+
+
+def _values(node: dict, key: str = "value") -> np.ndarray:
+    return np.asarray([point[key] for point in node["forecast"]])
+
+
+class _RecordingExecutor:
+    # Runs each submission as a pool worker would, recording what reached the pool.
+    def __init__(self) -> None:
+        self.submitted: list[str] = []
+
+    def submit(self, function, *args):
+        self.submitted.append(function.__name__)
+        with mock.patch.object(process_pool, "_in_worker", True):
+            return process_pool.run_inline(function, *args)
+
+class ReconciliationTests(unittest.TestCase):
+    def test_mint_moves_incoherent_forecasts_towards_the_precise_nodes(self) -> None:
+        base = np.asarray([[100.0], [40.0], [50.0]])
+        precise_total = reconcile_forecasts(base, np.asarray([[1e-6], [1.0], [1.0]]), "mint")
+        precise_states = reconcile_forecasts(base, np.asarray([[1e6], [1.0], [1.0]]), "mint")
+        equal = reconcile_forecasts(base, np.ones_like(base), "mint")
+
+        np.testing.assert_allclose(precise_total[:, 0], [100.0, 45.0, 55.0], atol=1e-3)
+        np.testing.assert_allclose(precise_states[:, 0], [90.0, 40.0, 50.0], atol=1e-3)
+        # With equal variances MinT is the OLS projection: the 10-unit gap is split over all three nodes.
+        np.testing.assert_allclose(equal[:, 0], [100 - 10 / 3, 40 + 10 / 3, 50 + 10 / 3])
+        np.testing.assert_allclose(reconcile_forecasts(base, np.ones_like(base), "bottom_up")[:, 0], [90.0, 40.0, 50.0])
+
+    def test_negative_states_are_clipped_before_summing(self) -> None:
+        base = np.asarray([[10.0], [30.0], [-5.0]])
+        np.testing.assert_allclose(reconcile_forecasts(base, np.ones_like(base), "bottom_up")[:, 0], [30.0, 30.0, 0.0])
+
+
+class HierarchicalForecastTests(unittest.TestCase):
+    def test_forecasts_are_coherent_for_every_method(self) -> None:
+        matrix = load_state_matrix(TABNET_SAMPLE)
+        for method in ("bottom_up", "mint"):
+            with self.subTest(method=method):
+                result = generate_hierarchical_forecast(matrix, model="drift", forecast_years=3, reconciliation=method)
+
+                national, *states = result["nodes"]
+                self.assertEqual((national["state_label"], national["level"]), (NATIONAL_LABEL, "national"))
+                self.assertEqual([node["state_label"] for node in states], list(matrix.labels))
+                self.assertEqual(result["periods"], [2023, 2024, 2025])
+                np.testing.assert_allclose(_values(national), np.sum([_values(node) for node in states], axis=0))
+                for node in result["nodes"]:
+                    self.assertIsNone(node["error"])
+                    self.assertTrue((_values(node, "lower") <= _values(node)).all())
+                    self.assertTrue((_values(node) <= _values(node, "upper")).all())
+                self.assertEqual(national["historical_data"][-1], {"year": 2022, "value": float(matrix.values[:, -1].sum())})
+
+    def test_bottom_up_keeps_the_state_forecasts(self) -> None:
+        result = generate_hierarchical_forecast(TABNET_SAMPLE, model="drift", forecast_years=2, reconciliation="bottom_up")
+
+        state = result["nodes"][1]
+        series, label, frequency = load_state_series(TABNET_SAMPLE, state["state_label"])
+        expected = forecast_series(series, label, frequency, model="drift", forecast_years=2)
+        np.testing.assert_allclose(_values(state), [point["value"] for point in expected["forecast"]])
+        np.testing.assert_allclose(_values(state), _values(state, "base_value"))
+
+    def test_states_with_unreported_periods_still_share_the_horizon(self) -> None:
+        periods = pd.Index(range(2010, 2020))
+        values = np.vstack([np.linspace(100, 190, 10), np.linspace(50, 95, 10), np.zeros(10)])
+        values[1, -2:] = 0.0
+        matrix = StateMatrix(("11 Rondonia", "12 Acre", "13 Amazonas"), periods, values, "annual")
+
+        result = generate_hierarchical_forecast(matrix, model="drift", forecast_years=2, reconciliation="bottom_up")
+
+        national, first, second, empty = result["nodes"]
+        self.assertEqual(result["periods"], [2020, 2021])
+        self.assertIn("apenas zeros", empty["error"])
+        np.testing.assert_allclose(_values(empty), [0.0, 0.0])
+        # Acre stopped reporting in 2018, so its 2020-2021 values are steps 3-4 of its own forecast.
+        expected = forecast_series(matrix.row(1), "12 Acre", "annual", model="drift", forecast_years=4)
+        np.testing.assert_allclose(_values(second), [point["value"] for point in expected["forecast"][2:]])
+        np.testing.assert_allclose(_values(national), _values(first) + _values(second))
+
+    def test_a_failed_state_fit_does_not_pull_the_totals_to_zero(self) -> None:
+        periods = pd.Index(range(2010, 2020))
+        values = np.vstack([np.linspace(100, 190, 10), np.linspace(50, 95, 10), np.linspace(30, 57, 10)])
+        matrix = StateMatrix(("11 Rondonia", "12 Acre", "13 Amazonas"), periods, values, "annual")
+        fit_node = hierarchical_forecast._fit_node
+
+        def failing_acre(series, *args):
+            if series.values[0] == 50:
+                raise RuntimeError("Falha ao ajustar o modelo")
+            return fit_node(series, *args)
+
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 0), mock.patch.object(
+            hierarchical_forecast, "_fit_node", side_effect=failing_acre
+        ):
+            result = generate_hierarchical_forecast(matrix, model="drift", forecast_years=2, reconciliation="mint")
+
+        national, first, failed, third = result["nodes"]
+        self.assertEqual((failed["model"], failed["error"]), (BASELINE_LABEL, "Falha ao ajustar o modelo"))
+        np.testing.assert_allclose(_values(national), _values(national, "base_value"), rtol=1e-4)
+        np.testing.assert_allclose(_values(first), _values(first, "base_value"), rtol=1e-4)
+        # The failed state absorbs the gap between the fitted national total and its fitted siblings.
+        np.testing.assert_allclose(_values(failed), _values(national) - _values(first) - _values(third))
+        self.assertTrue((_values(failed) > 0.9 * _values(failed, "base_value")).all())
+
+    def test_nodes_are_the_only_pool_submissions(self) -> None:
+        periods = pd.Index(range(2010, 2020))
+        values = np.vstack([np.linspace(100, 190, 10), np.linspace(50, 95, 10) + np.tile([0.0, 4.0], 5)])
+        matrix = StateMatrix(("11 Rondonia", "12 Acre"), periods, values, "annual")
+        executor = _RecordingExecutor()
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 2), mock.patch.object(process_pool, "_executor", executor):
+            result = generate_hierarchical_forecast(matrix, model="theta", forecast_years=2)
+
+        # Theta fits backtest their own folds; inside a node worker those run inline instead of re-entering the pool.
+        self.assertEqual(executor.submitted, ["_fit_node"] * 3)
+        self.assertEqual([node["error"] for node in result["nodes"]], [None] * 3)
+
+    def test_requires_a_known_method_and_several_states(self) -> None:
+        matrix = load_state_matrix(TABNET_SAMPLE)
+        with self.assertRaisesRegex(ValueError, "reconciliation"):
+            generate_hierarchical_forecast(matrix, model="drift", reconciliation="top_down")
+        single = StateMatrix(matrix.labels[:1], matrix.periods, matrix.values[:1], matrix.source_frequency)
+        with self.assertRaisesRegex(ValueError, "duas UFs"):
+            generate_hierarchical_forecast(single, model="drift")
+
+
+class PredictHierarchyRouteTests(unittest.TestCase):
+    def test_route_forecasts_the_tabnet_content(self) -> None:
+        record = DatasetImport(id="dataset-1", frequency="annual", tabnet_content=TABNET_SAMPLE.read_bytes())
+        payload = HierarchyForecastRequest(dataset_id="dataset-1", disease_slug="sepse", model="drift", forecast_years=2)
+        with mock.patch.object(api_routes, "touch_session_disease"), mock.patch.object(
+            api_routes, "get_dataset_record", return_value=record
+        ):
+            response = api_routes.predict_hierarchy(payload, db=mock.MagicMock(), session_record=AppSession(id="session-1"))
+
+        self.assertEqual((response.dataset_id, response.reconciliation, response.periods), ("dataset-1", "mint", [2023, 2024]))
+        self.assertEqual(len(response.nodes), 28)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("pmdarima", "statsmodels", "sklearn", "scipy", "sktime")
+
+
+def _loaded_after(statement: str) -> list[str]:
+    # A fresh interpreter, so modules imported by other tests do not count.
+    script = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_app_import_does_not_load_forecasting_backends(self) -> None:
+        for statement in ("import app.main", "import app.services.prediction_engine"):
+            with self.subTest(statement=statement):
+                self.assertEqual(_loaded_after(statement), [])
+
+    def test_preload_imports_the_arima_backend(self) -> None:
+        loaded = _loaded_after("from app.services.prediction_engine import preload_forecast_backends; preload_forecast_backends()")
+        self.assertIn("pmdarima", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
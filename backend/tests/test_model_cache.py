@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from app.services.forecast import arima_forecaster, model_cache
+from app.services.forecast.model_cache import FittedModelCache, cached_fit
+from app.services.forecast.theta_forecaster import forecast_theta_log
+from app.services.forecast.time_series import TimeSeries
+
+SERIES_LOG = TimeSeries(2005, "annual", np.log1p([120.0, 135.0, 128.0, 150.0, 161.0, 158.0, 172.0, 180.0, 176.0, 190.0]))
+
+
+class FittedModelCacheTests(unittest.TestCase):
+    def test_lru_evicts_by_pickled_size(self) -> None:
+        cache = FittedModelCache(max_bytes=2500)
+        for key in ("a", "b", "c"):
+            cache.put(key, np.zeros(100))
+        self.assertIsNone(cache.get("a"))
+        cache.get("b")
+        cache.put("d", np.zeros(100))
+        self.assertIsNone(cache.get("c"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertLessEqual(cache.size_bytes, 2500)
+        self.assertEqual(len(cache), 2)
+
+    def test_oversized_and_unpicklable_models_are_skipped(self) -> None:
+        cache = FittedModelCache(max_bytes=100)
+        cache.put("large", np.zeros(1000))
+        cache.put("lambda", lambda: None)
+        self.assertEqual((len(cache), cache.size_bytes), (0, 0))
+
+    def test_persistent_tier_survives_a_new_process_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            FittedModelCache(max_bytes=10_000, directory=Path(directory)).put("key", {"order": (1, 1, 0)})
+            restored = FittedModelCache(max_bytes=10_000, directory=Path(directory))
+            self.assertEqual(restored.get("key"), {"order": (1, 1, 0)})
+            self.assertEqual(len(restored), 1)
+
+
+    def test_disk_tier_evicts_the_least_recently_used_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FittedModelCache(max_bytes=10_000, directory=Path(directory), max_disk_bytes=2500)
+            for key, touched in (("a", 1000), ("b", 2000)):
+                cache.put(key, np.zeros(100))
+                os.utime(cache._path(key), (touched, touched))
+            self.assertIsNotNone(FittedModelCache(max_bytes=10_000, directory=Path(directory)).get("a"))
+            cache.put("c", np.zeros(100))
+
+            restored = FittedModelCache(max_bytes=10_000, directory=Path(directory))
+            self.assertIsNone(restored.get("b"))
+            self.assertIsNotNone(restored.get("a"))
+            self.assertLessEqual(sum(path.stat().st_size for path in Path(directory).glob("*.pkl")), 2500)
+
+    def test_disk_tier_ignores_other_engine_versions_and_corrupt_files(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            FittedModelCache(max_bytes=10_000, directory=Path(directory), version="4").put("key", {"order": (1, 1, 0)})
+            cache = FittedModelCache(max_bytes=10_000, directory=Path(directory), version="5")
+            self.assertIsNone(cache.get("key"))
+
+            cache._path("key").write_bytes(b"not a model")
+            self.assertIsNone(cache.get("key"))
+            self.assertFalse(cache._path("key").exists())
+
+    def test_disk_failures_keep_the_memory_tier(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            blocker = Path(directory) / "file"
+            blocker.write_bytes(b"")
+            cache = FittedModelCache(max_bytes=10_000, directory=blocker / "models")
+            with self.assertLogs(model_cache.logger, "WARNING"):
+                cache.put("key", {"order": (1, 1, 0)})
+            self.assertEqual(cache.get("key"), {"order": (1, 1, 0)})
+            self.assertEqual(sorted(path.name for path in Path(directory).iterdir()), ["file"])
+
+class CachedForecastTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_arima_is_fitted_once_across_horizons_and_confidence(self) -> None:
+        with mock.patch.object(arima_forecaster, "auto_arima", wraps=arima_forecaster.auto_arima) as auto_arima:
+            first = arima_forecaster.forecast_arima_log(SERIES_LOG, 3, 0.95, False, 1)
+            longer = arima_forecaster.forecast_arima_log(SERIES_LOG, 5, 0.80, False, 1)
+        self.assertEqual(auto_arima.call_count, 1)
+        np.testing.assert_array_equal(longer[0][:3], first[0])
+
+        model_cache._model_cache.clear()
+        fresh = arima_forecaster.forecast_arima_log(SERIES_LOG, 5, 0.80, False, 1)
+        np.testing.assert_array_equal(fresh[0], longer[0])
+        np.testing.assert_array_equal(fresh[1], longer[1])
+
+    def test_theta_reuses_its_fit(self) -> None:
+        expected = forecast_theta_log(SERIES_LOG, 4, 0.9, 1)
+        with mock.patch("app.services.forecast.theta_forecaster.fit_theta") as fit:
+            cached = forecast_theta_log(SERIES_LOG, 4, 0.9, 1)
+        fit.assert_not_called()
+        np.testing.assert_array_equal(cached[0], expected[0])
+        np.testing.assert_array_equal(cached[1], expected[1])
+
+    def test_settings_are_part_of_the_key(self) -> None:
+        fits = []
+        for settings in ({"m": 1}, {"m": 12}, {"m": 1}):
+            cached_fit("arima", SERIES_LOG.values, settings, lambda: fits.append(settings) or len(fits))
+        self.assertEqual(len(fits), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
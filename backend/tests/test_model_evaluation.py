@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.services.forecast import process_pool
+from app.services.forecast.time_series import TimeSeries
+from app.services.model_evaluation import evaluate_models
+from app.services.prediction_engine import forecast_series
+
+ANNUAL = TimeSeries(2010, "annual", np.asarray([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0, 429.0, 455.0]))
+MONTHS = np.arange(48)
+MONTHLY = TimeSeries(2019 * 12, "monthly", 200 + 2.0 * MONTHS + 40 * np.sin(2 * np.pi * MONTHS / 12))
+
+
+def _rolling_errors(series: TimeSeries, model: str, origins: tuple[int, ...], horizon: int) -> np.ndarray:
+    errors = []
+    for origin in origins:
+        result = forecast_series(series[:origin], "", series.frequency, model=model, forecast_years=horizon, forecast_periods=horizon)
+        forecast = np.asarray([point["value"] for point in result["forecast"]])
+        actual = series.values[origin : origin + horizon]
+        errors.append(np.abs(forecast[: len(actual)] - actual))
+    return np.concatenate(errors)
+
+
+def _without_timings(evaluation: dict) -> dict:
+    return {
+        **evaluation,
+        "models": [{key: value for key, value in item.items() if not key.endswith("fit_seconds")} for item in evaluation["models"]],
+    }
+
+
+class _RecordingExecutor:
+    # Runs each submission as a pool worker would, recording what reached the pool.
+    def __init__(self) -> None:
+        self.submitted: list[str] = []
+
+    def submit(self, function, *args):
+        self.submitted.append(function.__name__)
+        with mock.patch.object(process_pool, "_in_worker", True):
+            return process_pool.run_inline(function, *args)
+
+class ModelEvaluationTests(unittest.TestCase):
+    def test_scores_match_refitting_each_cutoff_serially(self) -> None:
+        evaluation = evaluate_models(ANNUAL, "x", "annual", ["drift", "theta"], cutoffs=[2017, "2019"], horizon=2)
+
+        self.assertEqual(evaluation["cutoffs"], [2017, 2019])
+        for scores, model in zip(evaluation["models"], ("drift", "theta")):
+            with self.subTest(model=model):
+                errors = _rolling_errors(ANNUAL, model, (8, 10), 2)
+                actual = np.concatenate([ANNUAL.values[8:10], ANNUAL.values[10:12]])
+                self.assertEqual(scores["evaluated_points"], 4)
+                self.assertEqual(scores["failed_fits"], 0)
+                self.assertAlmostEqual(scores["mae"], float(errors.mean()))
+                self.assertAlmostEqual(scores["mape"], float((errors / actual).mean() * 100))
+                self.assertGreater(scores["total_fit_seconds"], 0)
+
+    def test_default_cutoffs_are_the_latest_full_horizon_origins(self) -> None:
+        evaluation = evaluate_models(MONTHLY, "x", "monthly", ["seasonal_naive", "SEASONAL_NAIVE"], horizon=3)
+
+        self.assertEqual(evaluation["output_frequency"], "monthly")
+        self.assertEqual(evaluation["cutoffs"], ["2022-07", "2022-08", "2022-09"])
+        self.assertEqual([item["model"] for item in evaluation["models"]], ["seasonal_naive"])
+        self.assertAlmostEqual(evaluation["models"][0]["mae"], float(_rolling_errors(MONTHLY, "seasonal_naive", (43, 44, 45), 3).mean()))
+
+    def test_cutoffs_must_leave_training_and_test_data(self) -> None:
+        for cutoffs in ([2011], [2021], [1999]):
+            with self.subTest(cutoffs=cutoffs), self.assertRaises(ValueError):
+                evaluate_models(ANNUAL, "x", "annual", ["drift"], cutoffs=cutoffs)
+        with self.assertRaises(ValueError):
+            evaluate_models(ANNUAL, "x", "annual", ["prophet"])
+
+    def test_process_pool_matches_serial_evaluation(self) -> None:
+        arguments = dict(models=["theta", "ets"], cutoffs=[2018, 2019, 2020], horizon=1)
+        serial = evaluate_models(ANNUAL, "x", "annual", **arguments)
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 2):
+            self.addCleanup(process_pool.shutdown_forecast_executor)
+            pooled = evaluate_models(ANNUAL, "x", "annual", **arguments)
+            process_pool.shutdown_forecast_executor()
+        self.assertEqual(_without_timings(pooled), _without_timings(serial))
+
+
+    def test_cutoffs_are_the_only_pool_submissions(self) -> None:
+        executor = _RecordingExecutor()
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 2), mock.patch.object(process_pool, "_executor", executor):
+            evaluation = evaluate_models(ANNUAL, "x", "annual", ["theta"], cutoffs=[2018, 2019, 2020], horizon=1)
+
+        # The theta fits backtest their own folds; inside a cutoff worker those run inline instead of re-entering the pool.
+        self.assertEqual(executor.submitted, ["_fit_at_cutoff"] * 3)
+        self.assertEqual(evaluation["models"][0]["failed_fits"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
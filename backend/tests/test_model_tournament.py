@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import time
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+from app.services import prediction_engine
+from app.services.forecast import arima_order_store, model_cache, process_pool
+from app.services.forecast.arima_order_store import ArimaOrder, InMemoryArimaOrderStore
+from app.services.forecast.fit_budget import FitBudgetExceeded
+from app.services.forecast.model_cache import FittedModelCache
+from app.services.forecast.time_series import TimeSeries
+
+ANNUAL = TimeSeries(2010, "annual", np.asarray([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0, 429.0, 455.0]))
+# Exponential growth is a straight line in log space, which the drift model forecasts exactly.
+EXPONENTIAL = TimeSeries(2010, "annual", np.expm1(np.log(200.0) + 0.05 * np.arange(12)))
+
+
+class ModelTournamentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+        for patcher in (
+            mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024)),
+            mock.patch.object(arima_order_store, "_order_store", InMemoryArimaOrderStore()),
+            # Candidate specs are patched in this process, which pool workers would not see.
+            mock.patch.object(process_pool, "FORECAST_WORKERS", 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        prediction_engine._fold_forecasts.clear()
+
+    def _forecast(self, series: TimeSeries, model: str) -> dict:
+        return prediction_engine.forecast_series(series, "x", series.frequency, model=model, forecast_years=3, forecast_periods=6)
+
+    def test_auto_forecasts_with_the_lowest_backtest_error(self) -> None:
+        result = self._forecast(ANNUAL, "auto")
+
+        candidates = {item["model"]: item for item in result["tournament"]}
+        self.assertEqual(list(candidates), list(prediction_engine.MODEL_REGISTRY))
+        winner = result["selected_model"]
+        self.assertEqual(candidates[winner]["status"], "winner")
+        for name, candidate in candidates.items():
+            if candidate["status"] == "scored":
+                self.assertGreaterEqual(candidate["mae"], candidates[winner]["mae"])
+
+        expected = self._forecast(ANNUAL, winner)
+        self.assertEqual(result["forecast"], expected["forecast"])
+        self.assertEqual(result["model"], expected["model"])
+
+    def test_slow_candidates_stop_once_they_cannot_win(self) -> None:
+        theta_folds = []
+        theta = prediction_engine.MODEL_REGISTRY["theta"]
+        counting = prediction_engine.ForecastModelSpec(
+            theta.option_label,
+            theta.label,
+            lambda series_log, *args: theta_folds.append(len(series_log)) or theta.forecast_log(series_log, *args),
+        )
+        with mock.patch.dict(prediction_engine.MODEL_REGISTRY, {"theta": counting}):
+            result = self._forecast(EXPONENTIAL, "auto")
+
+        candidates = {item["model"]: item for item in result["tournament"]}
+        self.assertEqual(result["selected_model"], "drift")
+        for name in ("arima", "theta"):
+            self.assertEqual((candidates[name]["status"], candidates[name]["folds"]), ("eliminated", 1))
+        self.assertEqual(theta_folds, [10])
+        self.assertEqual(candidates["ets"]["folds"], 2)
+
+    def test_arima_is_withdrawn_when_order_selection_exceeds_its_budget(self) -> None:
+        def slow_selection(*args, **kwargs):
+            time.sleep(0.01)
+            raise FitBudgetExceeded("budget")
+
+        with mock.patch.object(prediction_engine, "select_arima_order", side_effect=slow_selection), mock.patch.object(
+            prediction_engine, "fit_budget_seconds", side_effect=lambda model, frequency: 0.001 if model == "arima" else 0
+        ):
+            result = self._forecast(ANNUAL, "auto")
+
+        candidates = {item["model"]: item for item in result["tournament"]}
+        self.assertEqual((candidates["arima"]["status"], candidates["arima"]["folds"]), ("over_budget", 0))
+        self.assertNotEqual(result["selected_model"], "arima")
+
+    def test_candidate_folds_stop_at_the_candidate_budget(self) -> None:
+        # Fold fits run without the caller's context, so the budget reaches them as an explicit deadline.
+        with mock.patch.object(
+            prediction_engine, "fit_budget_seconds", side_effect=lambda model, frequency: 1e-9 if model == "theta" else 0
+        ):
+            result = self._forecast(ANNUAL, "auto")
+
+        candidates = {item["model"]: item for item in result["tournament"]}
+        self.assertEqual((candidates["theta"]["status"], candidates["theta"]["folds"]), ("over_budget", 0))
+        self.assertNotEqual(result["selected_model"], "theta")
+
+    def _failing_registry(self, fit=None) -> dict:
+        def failing_fit(series_log, *args):
+            raise RuntimeError("Falha ao ajustar o modelo")
+
+        return {
+            name: replace(spec, forecast_log=(fit if name == "theta" and fit else failing_fit))
+            for name, spec in prediction_engine.MODEL_REGISTRY.items()
+        }
+
+    def test_the_baseline_wins_when_every_candidate_fails(self) -> None:
+        with mock.patch.dict(prediction_engine.MODEL_REGISTRY, self._failing_registry()), mock.patch.object(
+            prediction_engine, "select_arima_order", side_effect=RuntimeError("Falha ao ajustar o modelo")
+        ):
+            result = self._forecast(ANNUAL, "auto")
+
+        self.assertEqual((result["selected_model"], result["model"]), (prediction_engine.BASELINE_MODEL, prediction_engine.BASELINE_LABEL))
+        self.assertEqual({item["status"] for item in result["tournament"]}, {"failed"})
+        expected, _ = prediction_engine._build_fallback_forecast(ANNUAL, 3)
+        np.testing.assert_allclose([point["value"] for point in result["forecast"]], expected)
+
+    def test_the_lowest_partial_error_wins_when_no_candidate_is_scored(self) -> None:
+        theta = prediction_engine.MODEL_REGISTRY["theta"].forecast_log
+
+        def first_fold_only(series_log, *args):
+            if len(series_log) > 10:
+                raise RuntimeError("Falha ao ajustar o modelo")
+            return theta(series_log, *args)
+
+        with mock.patch.dict(prediction_engine.MODEL_REGISTRY, self._failing_registry(first_fold_only)), mock.patch.object(
+            prediction_engine, "select_arima_order", side_effect=RuntimeError("Falha ao ajustar o modelo")
+        ):
+            winner, tournament = prediction_engine._run_tournament(
+                ANNUAL, 0.95, 2, dict.fromkeys(prediction_engine.MODEL_REGISTRY, 1), None
+            )
+
+        candidates = {item["model"]: item for item in tournament["tournament"]}
+        self.assertEqual((winner, tournament["selected_model"]), ("theta", "theta"))
+        self.assertEqual((candidates["theta"]["status"], candidates["theta"]["folds"]), ("winner", 1))
+
+    def test_monthly_auto_and_model_options(self) -> None:
+        months = np.arange(48)
+        monthly = TimeSeries(2019 * 12, "monthly", 200 + 2.0 * months + 40 * np.sin(2 * np.pi * months / 12))
+        # A seasonal ARIMA search takes seconds; ARIMA's slot is filled by ETS with a fixed order instead.
+        order = ArimaOrder(order=(1, 1, 0), seasonal_order=(0, 0, 0, 0), with_intercept=True)
+        with mock.patch.dict(prediction_engine.MODEL_REGISTRY, {"arima": prediction_engine.MODEL_REGISTRY["ets"]}), mock.patch.object(
+            prediction_engine, "select_arima_order", return_value=order
+        ):
+            result = self._forecast(monthly, "auto")
+
+        self.assertEqual([item["folds"] > 0 for item in result["tournament"]], [True] * len(prediction_engine.MODEL_REGISTRY))
+        self.assertEqual(result["forecast_points"], 6)
+        self.assertIn(result["selected_model"], prediction_engine.MODEL_REGISTRY)
+        self.assertIn("auto", [option["value"] for option in prediction_engine.get_available_model_options()])
+        self.assertNotIn("tournament", self._forecast(ANNUAL, "drift"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+from pmdarima import ARIMA
+from pmdarima.arima import ndiffs
+
+from app.services.forecast import arima_forecaster, model_cache
+from app.services.forecast.model_cache import FittedModelCache
+from app.services.forecast.native_arima import NativeArima, fit_native_arima, search_native_arima, select_differences
+from app.services.forecast.time_series import TimeSeries
+
+ANNUAL = np.log1p([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0])
+
+
+def _sample_series() -> list[np.ndarray]:
+    rng = np.random.default_rng(3)
+    series = [ANNUAL]
+    for length in (12, 16, 20):
+        series.append(5 + np.cumsum(rng.normal(0.03, 0.1, length)))
+        series.append(5 + np.convolve(rng.normal(0, 0.1, length + 1), [1.0, 0.5], "valid"))
+    return series
+
+
+class NativeArimaAgreementTests(unittest.TestCase):
+    def setUp(self) -> None:
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+
+    def test_differencing_order_matches_pmdarima(self) -> None:
+        for values in _sample_series():
+            self.assertEqual(select_differences(values), ndiffs(values, alpha=0.05, test="kpss", max_d=2))
+
+    def test_fixed_order_fits_match_pmdarima_within_tolerance(self) -> None:
+        for values in _sample_series():
+            for p, q in ((1, 0), (0, 1), (1, 1)):
+                order = (p, select_differences(values), q)
+                with self.subTest(length=len(values), order=order):
+                    reference = ARIMA(order=order, with_intercept=True, suppress_warnings=True).fit(values)
+                    expected, expected_interval = reference.predict(n_periods=3, return_conf_int=True, alpha=0.05)
+                    forecast, interval = fit_native_arima(values, order, True).predict(3, alpha=0.05)
+                    np.testing.assert_allclose(forecast, expected, atol=0.05)
+                    np.testing.assert_allclose(interval, expected_interval, atol=0.1)
+
+    def test_search_picks_the_lowest_aicc_candidate(self) -> None:
+        best = search_native_arima(ANNUAL, 3)
+        for p in range(4):
+            for q in range(4):
+                try:
+                    candidate = fit_native_arima(ANNUAL, (p, best.order[1], q), best.with_intercept)
+                except ValueError:
+                    continue
+                self.assertGreaterEqual(candidate.aicc, best.aicc - 1e-6)
+
+    def test_forecast_contract_matches_pmdarima_models(self) -> None:
+        forecast, interval = search_native_arima(ANNUAL, 3).predict(n_periods=4, return_conf_int=True, alpha=0.2)
+        self.assertEqual(forecast.shape, (4,))
+        self.assertEqual(interval.shape, (4, 2))
+        self.assertTrue(np.all(interval[:, 0] < forecast) and np.all(forecast < interval[:, 1]))
+        self.assertTrue(np.all(np.diff(interval[:, 1] - interval[:, 0]) >= 0))
+
+
+class NativeArimaEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        for patcher in (
+            mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024)),
+            mock.patch.object(arima_forecaster, "ARIMA_ENGINE", "native"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_non_seasonal_fits_skip_auto_arima(self) -> None:
+        series = TimeSeries(2010, "annual", ANNUAL)
+        with mock.patch.object(arima_forecaster, "auto_arima") as auto_arima:
+            forecast, interval = arima_forecaster.forecast_arima_log(series, 3, 0.95, False, 1)
+            order = arima_forecaster.select_arima_order(series, False, 1)
+            refitted, _ = arima_forecaster.forecast_arima_log(series, 3, 0.95, False, 1, order=order)
+        auto_arima.assert_not_called()
+        self.assertIsInstance(model_cache._model_cache.get(next(iter(model_cache._model_cache._entries))), NativeArima)
+        self.assertEqual(interval.shape, (3, 2))
+        np.testing.assert_allclose(refitted, forecast)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import csv
 import math
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from statistics import mean
 
+from unittest import mock
+
+import numpy as np
+
+from app.services import prediction_engine
+from app.services.forecast import arima_forecaster, model_cache, process_pool
+from app.services.forecast.model_cache import FittedModelCache
+from app.services.forecast.time_series import TimeSeries
 from app.services.prediction_engine import generate_forecast
 
 
@@ -222,5 +231,62 @@ class PredictionEngineValidationTests(unittest.TestCase):
             return [dict(row) for row in reader]
 
 
+class AnnualBacktestReuseTests(unittest.TestCase):
+    SERIES = TimeSeries(2010, "annual", np.asarray([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0]))
+
+    def setUp(self) -> None:
+        for patcher in (
+            mock.patch.object(model_cache, "_model_cache", FittedModelCache(max_bytes=64 * 1024 * 1024)),
+            mock.patch.object(prediction_engine, "_fold_forecasts", prediction_engine.OrderedDict()),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_folds_reuse_the_full_series_order(self) -> None:
+        with mock.patch.object(arima_forecaster, "auto_arima", wraps=arima_forecaster.auto_arima) as auto_arima:
+            prediction_engine._forecast_annual(self.SERIES, "x", "annual", "arima", years=3, confidence=0.95)
+        self.assertEqual(auto_arima.call_count, 1)
+        self.assertEqual(len(prediction_engine._fold_forecasts), 2)
+
+    def test_fold_forecasts_are_memoized_across_confidence_levels(self) -> None:
+        verdict = prediction_engine._annual_backtest_prefers_baseline(self.SERIES, "theta", 0.95)
+        with mock.patch.object(prediction_engine, "_annual_model_forecast") as model_forecast:
+            self.assertEqual(prediction_engine._annual_backtest_prefers_baseline(self.SERIES, "theta", 0.8), verdict)
+        model_forecast.assert_not_called()
+
+    def test_memoized_folds_match_fresh_fits(self) -> None:
+        order = arima_forecaster.select_arima_order(self.SERIES.map(np.log1p), False, 1)
+        prediction_engine._start_fold_forecasts(self.SERIES, "arima", 0.95, order)
+        cached = prediction_engine._start_fold_forecasts(self.SERIES, "arima", 0.95, order)
+        for step, fold_forecast in zip((2, 1), cached):
+            fresh, _ = prediction_engine._annual_model_forecast(self.SERIES[:-step], "arima", years=1, confidence=0.5, order=order)
+            self.assertEqual(fold_forecast.result(), float(fresh[0]))
+
+    def test_process_pool_matches_serial_forecasts(self) -> None:
+        serial = {
+            model: prediction_engine._forecast_annual(self.SERIES, "x", "annual", model, years=3, confidence=0.95)
+            for model in ("arima", "theta")
+        }
+        prediction_engine._fold_forecasts.clear()
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 2):
+            self.addCleanup(process_pool.shutdown_forecast_executor)
+            for model, expected in serial.items():
+                self.assertEqual(
+                    prediction_engine._forecast_annual(self.SERIES, "x", "annual", model, years=3, confidence=0.95),
+                    expected,
+                )
+            process_pool.shutdown_forecast_executor()
+        self.assertEqual(len(prediction_engine._fold_forecasts), 4)
+
+    def test_pool_workers_fit_inline_instead_of_nesting_pools(self) -> None:
+        # Spawned workers read FORECAST_WORKERS from the inherited environment, so they would start their own pools.
+        with mock.patch.object(process_pool, "FORECAST_WORKERS", 2), mock.patch.dict(os.environ, {"FORECAST_WORKERS": "2"}):
+            self.addCleanup(process_pool.shutdown_forecast_executor)
+            executor = process_pool.get_forecast_executor()
+            self.assertIsNotNone(executor)
+            self.assertIsNone(executor.submit(process_pool.get_forecast_executor).result())
+            process_pool.shutdown_forecast_executor()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from fastapi import Response
+
+from app.api import api_routes
+from app.config import SESSION_COOKIE_NAME
+from app.models import AppSession, DatasetImport
+from app.schemas import ForecastRequest
+from app.services.forecast.canonical_series import build_canonical_series
+from app.services.forecast.csv_loader import load_state_series
+from app.services.prediction_engine import BASELINE_LABEL, _build_fallback_forecast, forecast_baseline, forecast_series
+
+TABNET_SAMPLE = Path(__file__).resolve().parents[1] / "data" / "samples" / "sepse_obitos.csv"
+
+
+def _saved(db, session_record, dataset_record, disease_slug, request_payload, prediction_payload) -> dict:
+    return {"forecast_id": "forecast-1", "dataset_id": dataset_record.id, "saved_at": "2026-01-01T00:00:00", "result": prediction_payload}
+
+
+class BaselineForecastTests(unittest.TestCase):
+    def test_baseline_has_the_fitted_payload_shape(self) -> None:
+        series = build_canonical_series(*load_state_series(TABNET_SAMPLE, "21"))
+        arguments = dict(series=series.time_series(), state_label=series.state_label, source_frequency=series.source_frequency)
+        baseline = forecast_baseline(forecast_years=4, **arguments)
+        fitted = forecast_series(model="drift", forecast_years=4, **arguments)
+
+        self.assertEqual(list(baseline), list(fitted))
+        self.assertEqual(baseline["model"], BASELINE_LABEL)
+        self.assertEqual([point["year"] for point in baseline["forecast"]], [point["year"] for point in fitted["forecast"]])
+        self.assertEqual(baseline["historical_data"], fitted["historical_data"])
+
+        expected, _ = _build_fallback_forecast(series.time_series().trim_trailing_zeros(), 4)
+        np.testing.assert_allclose([point["value"] for point in baseline["forecast"]], expected)
+
+    def test_baseline_validates_like_the_fitted_forecast(self) -> None:
+        series = build_canonical_series(*load_state_series(TABNET_SAMPLE, "21")).time_series()
+        with self.assertRaisesRegex(ValueError, "Monthly forecast requires"):
+            forecast_baseline(series=series, state_label="21", source_frequency="annual", mode="monthly")
+        with self.assertRaisesRegex(ValueError, "Serie anual"):
+            forecast_baseline(series=series[-3:], state_label="21", source_frequency="annual")
+
+
+class PredictStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session_record = AppSession(id="session-1")
+        self.payload = ForecastRequest(dataset_id="dataset-1", disease_slug="sepse", model="drift", forecast_years=3)
+        series = build_canonical_series(*load_state_series(TABNET_SAMPLE, "21"))
+        self.prepared = api_routes._PreparedForecast(
+            dataset_record=DatasetImport(id="dataset-1", system="SIM-DO", uf="MA", icd_prefix="A41", granularity="year"),
+            request_payload=self.payload.model_dump(),
+            dataset_series=series,
+            cache_key="cache-key",
+        )
+        self.baseline = forecast_baseline(
+            series=series.time_series(), state_label=series.state_label, source_frequency=series.source_frequency, forecast_years=3
+        )
+        for patcher in (
+            mock.patch.object(api_routes, "SessionLocal"),
+            mock.patch.object(api_routes, "store_cached_forecast"),
+            mock.patch.object(api_routes, "save_forecast_record", side_effect=_saved),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _events(self, baseline, prediction_result) -> list[dict]:
+        lines = api_routes._stream_forecast_events(self.session_record, self.payload, self.prepared, baseline, prediction_result)
+        return [json.loads(line) for line in lines]
+
+    def test_baseline_is_followed_by_the_persisted_fit(self) -> None:
+        events = self._events(self.baseline, None)
+
+        self.assertEqual([event["event"] for event in events], ["baseline", "final"])
+        self.assertEqual(events[0]["model"], BASELINE_LABEL)
+        self.assertEqual(events[1]["model"], "Passeio aleatorio com drift")
+        self.assertEqual(events[1]["forecast_id"], "forecast-1")
+        self.assertEqual(len(events[1]["forecast"]), len(events[0]["forecast"]))
+        stored = api_routes.store_cached_forecast.call_args.args
+        self.assertEqual(stored[1], "cache-key")
+        self.assertEqual(api_routes.save_forecast_record.call_args.kwargs["prediction_payload"], stored[2])
+
+    def test_cache_hits_stream_only_the_final_result(self) -> None:
+        cached = dict(self.baseline, model="ARIMA (auto_arima)")
+        with mock.patch.object(api_routes, "forecast_series") as fit:
+            events = self._events(None, cached)
+
+        fit.assert_not_called()
+        api_routes.store_cached_forecast.assert_not_called()
+        self.assertEqual([event["event"] for event in events], ["final"])
+        self.assertEqual(events[0]["model"], "ARIMA (auto_arima)")
+
+    def test_fit_failures_end_the_stream_with_an_error_event(self) -> None:
+        with mock.patch.object(api_routes, "forecast_series", side_effect=RuntimeError("Falha ao ajustar")):
+            events = self._events(self.baseline, None)
+
+        self.assertEqual([event["event"] for event in events], ["baseline", "error"])
+        self.assertEqual(events[1], {"event": "error", "status_code": 400, "detail": "Falha ao ajustar"})
+        api_routes.save_forecast_record.assert_not_called()
+
+
+    def test_the_refreshed_session_cookie_reaches_the_stream(self) -> None:
+        response = Response()
+        response.set_cookie(key=SESSION_COOKIE_NAME, value="session-1", httponly=True)
+        with mock.patch.object(api_routes, "_prepare_forecast", return_value=self.prepared), mock.patch.object(
+            api_routes, "get_cached_forecast", return_value=None
+        ):
+            streaming_response = api_routes.predict_stream(
+                self.payload, response, db=mock.MagicMock(), session_record=self.session_record
+            )
+
+        self.assertEqual(streaming_response.media_type, "application/x-ndjson")
+        self.assertEqual(streaming_response.headers.getlist("set-cookie"), response.headers.getlist("set-cookie"))
+        self.assertIn(f"{SESSION_COOKIE_NAME}=session-1", streaming_response.headers["set-cookie"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import replace
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from app.models import DatasetImport
+from app.services import prediction_engine
+from app.services.forecast.series_features import compute_series_features
+from app.services.forecast.time_series import TimeSeries
+from app.services.session_storage import _build_series_record, load_dataset_series
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "samples"
+MONTHS = np.arange(96)
+NOISE = np.random.default_rng(0).normal(0, 5, len(MONTHS))
+SEASONAL = TimeSeries(2015 * 12, "monthly", 200 + 50 * np.sin(2 * np.pi * MONTHS / 12) + np.cumsum(NOISE))
+RANDOM_WALK = TimeSeries(2015 * 12, "monthly", 200 + np.cumsum(NOISE))
+WHITE_NOISE = TimeSeries(2015 * 12, "monthly", 200 + 2 * NOISE)
+
+
+class SeriesFeatureTests(unittest.TestCase):
+    def test_seasonal_series_pass_the_period_test(self) -> None:
+        features = compute_series_features(SEASONAL)
+
+        self.assertTrue(features.seasonal)
+        self.assertEqual((features.season_length, features.dominant_period), (12, 12.0))
+        self.assertGreater(features.seasonal_strength, 0.9)
+        self.assertGreater(features.seasonal_acf, 0.5)
+
+    def test_series_without_a_yearly_cycle_are_not_seasonal(self) -> None:
+        for name, series in (
+            ("random walk", RANDOM_WALK),
+            ("white noise", WHITE_NOISE),
+            ("linear", TimeSeries(2015 * 12, "monthly", 100 + 3.0 * MONTHS)),
+            ("short", SEASONAL[:20]),
+        ):
+            with self.subTest(series=name):
+                self.assertFalse(compute_series_features(series).seasonal)
+        self.assertGreater(compute_series_features(RANDOM_WALK).trend_strength, 0.5)
+        self.assertLess(compute_series_features(WHITE_NOISE).trend_strength, 0.2)
+
+    def test_annual_series_only_measure_trend(self) -> None:
+        features = compute_series_features(TimeSeries(2010, "annual", 100 + 5.0 * np.arange(12)))
+        self.assertEqual((features.season_length, features.seasonal_strength, features.period_detected), (1, 0.0, False))
+        self.assertAlmostEqual(features.trend_strength, 1.0, places=3)
+
+
+class SeasonalPruningTests(unittest.TestCase):
+    def test_weak_evidence_drops_the_seasonal_arima_and_theta_search(self) -> None:
+        lengths = prediction_engine._monthly_season_lengths(RANDOM_WALK, None, None)
+        self.assertEqual(lengths, {"arima": 1, "theta": 1, "drift": 1, "seasonal_naive": 12, "ets": 1})
+        self.assertEqual(prediction_engine._monthly_season_lengths(RANDOM_WALK, True, None)["arima"], 12)
+        self.assertEqual(prediction_engine._monthly_season_lengths(SEASONAL, None, None)["arima"], 12)
+        self.assertEqual(set(prediction_engine._monthly_season_lengths(SEASONAL, False, None).values()), {1})
+
+    def test_stored_features_are_used_instead_of_recomputing(self) -> None:
+        stored = replace(compute_series_features(SEASONAL), period_detected=False)
+        with mock.patch.object(prediction_engine, "compute_series_features") as compute:
+            result = prediction_engine.forecast_series(
+                SEASONAL, "x", "monthly", model="theta", forecast_periods=6, features=stored
+            )
+        compute.assert_not_called()
+        self.assertEqual((result["seasonal"], result["season_length"]), (False, 1))
+
+        seasonal = prediction_engine.forecast_series(SEASONAL, "x", "monthly", model="theta", forecast_periods=6)
+        self.assertEqual((seasonal["seasonal"], seasonal["season_length"]), (True, 12))
+
+
+class StoredFeatureTests(unittest.TestCase):
+    def test_series_records_carry_their_features(self) -> None:
+        record = _build_series_record(SAMPLES_DIR / "sepse_respiradores_artificiais.csv", "21")
+        series = TimeSeries.from_period(record.start_period, "monthly", np.frombuffer(record.values_blob))
+
+        expected = compute_series_features(series.trim_trailing_zeros())
+        self.assertEqual(record.features.seasonal_strength, expected.seasonal_strength)
+        self.assertEqual(record.features.period_detected, expected.period_detected)
+
+    def test_series_stored_without_features_are_backfilled_once(self) -> None:
+        series_record = _build_series_record(SAMPLES_DIR / "sepse_respiradores_artificiais.csv", "21")
+        expected = series_record.features
+        series_record.id, series_record.features = "series-1", None
+        db = mock.MagicMock()
+        db.scalars.return_value.first.return_value = series_record
+
+        canonical = load_dataset_series(db, DatasetImport(id="dataset-1"), "21")
+
+        statement = db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        self.assertIn("ON CONFLICT (series_id) DO NOTHING", str(statement))
+        self.assertEqual((statement.params["series_id"], statement.params["trend_strength"]), ("series-1", expected.trend_strength))
+        db.commit.assert_called_once()
+        self.assertEqual(canonical.features.trend_strength, expected.trend_strength)
+        self.assertFalse(canonical.features.seasonal)
+
+
+if __name__ == "__main__":
+    unittest.main()
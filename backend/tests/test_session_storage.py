@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from app.models import DatasetImport, DatasetPreview
+from app.services.forecast.canonical_series import decode_values
+from app.services.forecast.csv_loader import load_state_series, parse_dataset, preview_dataframe
+from app.services.session_storage import (
+    PREVIEW_SNAPSHOT_ROWS,
+    _build_preview_record,
+    _build_series_record,
+    _build_series_records,
+    _state_series_key,
+    load_dataset_series,
+    preview_dataset_record,
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "samples"
+EXPORTS_DIR = Path(__file__).resolve().parents[1] / "data" / "exports"
+TABNET_SAMPLE = SAMPLES_DIR / "sepse_obitos.csv"
+TIDY_SAMPLE = next(EXPORTS_DIR.glob("*_i10_*/*_dados_modelagem.csv"))
+
+
+def _legacy_preview(content: bytes, limit: int) -> dict:
+    preview_df = preview_dataframe(content, limit=limit).fillna("")
+    return {
+        "columns": [str(column) for column in preview_df.columns.tolist()],
+        "rows": preview_df.astype(str).values.tolist(),
+    }
+
+
+def _session_returning(preview_record: DatasetPreview | None) -> mock.MagicMock:
+    db = mock.MagicMock()
+    db.scalars.return_value.first.return_value = preview_record
+    return db
+
+
+class DatasetPreviewSnapshotTests(unittest.TestCase):
+    def test_snapshot_matches_parsed_preview_for_every_limit(self) -> None:
+        for csv_path in (TABNET_SAMPLE, TIDY_SAMPLE):
+            content = csv_path.read_bytes()
+            snapshot = _build_preview_record(parse_dataset(content).frame)
+            record = DatasetImport(id="dataset-1", tidy_content=content, preferred_kind="tidy")
+            db = _session_returning(snapshot)
+            for limit in (1, 20, PREVIEW_SNAPSHOT_ROWS):
+                with self.subTest(csv_path=csv_path.name, limit=limit):
+                    expected = {"dataset_id": "dataset-1", **_legacy_preview(content, limit)}
+                    with mock.patch("app.services.session_storage.preview_dataframe") as parse_preview:
+                        self.assertEqual(preview_dataset_record(db, record, limit=limit), expected)
+                    parse_preview.assert_not_called()
+
+    def test_missing_snapshot_is_built_once_and_stored(self) -> None:
+        content = TABNET_SAMPLE.read_bytes()
+        record = DatasetImport(id="dataset-2", tidy_content=content, preferred_kind="tidy")
+        db = _session_returning(None)
+
+        preview = preview_dataset_record(db, record, limit=5)
+
+        self.assertEqual(preview, {"dataset_id": "dataset-2", **_legacy_preview(content, 5)})
+        statement = db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        self.assertIn("ON CONFLICT (dataset_id) DO NOTHING", str(statement))
+        self.assertEqual(statement.params["dataset_id"], "dataset-2")
+        self.assertEqual(len(statement.params["rows"]), 27)
+        db.add.assert_not_called()
+        db.commit.assert_called_once()
+
+    def test_snapshot_stored_by_a_concurrent_request_is_read_back(self) -> None:
+        content = TABNET_SAMPLE.read_bytes()
+        winner = DatasetPreview(dataset_id="dataset-2", columns=["a"], rows=[["1"], ["2"]])
+        db = mock.MagicMock()
+        db.scalars.return_value.first.side_effect = [None, winner]
+
+        preview = preview_dataset_record(db, DatasetImport(id="dataset-2", tidy_content=content, preferred_kind="tidy"))
+
+        self.assertEqual(preview, {"dataset_id": "dataset-2", "columns": ["a"], "rows": [["1"], ["2"]]})
+
+
+class DatasetSeriesStorageTests(unittest.TestCase):
+    def test_import_stores_every_state_from_one_parse(self) -> None:
+        dataset = parse_dataset(TABNET_SAMPLE)
+        records = _build_series_records(dataset, "21")
+
+        self.assertEqual(len(records), 27)
+        self.assertEqual(len({record.state_query for record in records}), 27)
+        for record in (records[0], records[-1]):
+            with self.subTest(state=record.state_label):
+                series, label, _ = load_state_series(dataset, record.state_query)
+                self.assertEqual(record.state_label, label)
+                np.testing.assert_array_equal(decode_values(record.values_blob), series.to_numpy(dtype=float))
+
+        single = _build_series_records(parse_dataset(TIDY_SAMPLE), "MA")
+        self.assertEqual([record.state_query for record in single], ["21"])
+
+    def test_state_queries_share_one_key_per_uf(self) -> None:
+        for query in ("21", "21 Maranh\u00e3o", "MA", "ma", "Maranh\u00e3o"):
+            with self.subTest(query=query):
+                self.assertEqual(_state_series_key(query), "21")
+        self.assertEqual(_state_series_key(" Regiao Norte "), "Regiao Norte")
+
+    def test_missing_series_is_inserted_without_racing_other_requests(self) -> None:
+        stored = _build_series_record(TABNET_SAMPLE, "21")
+        db = mock.MagicMock()
+        db.scalars.return_value.first.side_effect = [None, stored]
+        record = DatasetImport(id="dataset-3", tabnet_content=TABNET_SAMPLE.read_bytes(), preferred_kind="tabnet")
+
+        canonical = load_dataset_series(db, record, "MA")
+
+        statement = db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect())
+        self.assertIn("ON CONFLICT (dataset_id, state_query) DO NOTHING", str(statement))
+        self.assertEqual((statement.params["dataset_id"], statement.params["state_query"]), ("dataset-3", "21"))
+        db.add.assert_not_called()
+        self.assertEqual(canonical.state_label, stored.state_label)
+
+
+if __name__ == "__main__":
+    unittest.main()
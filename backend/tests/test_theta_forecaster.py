@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import unittest
+import warnings
+
+import numpy as np
+from statsmodels.tsa.forecasting.theta import ThetaModel
+
+from app.services.forecast.theta_forecaster import fit_theta, predict_theta
+
+
+def _sample_series() -> list[tuple[np.ndarray, int]]:
+    rng = np.random.default_rng(5)
+    cases = [(np.log1p([310.0, 330.0, 325.0, 360.0, 372.0, 390.0, 401.0, 398.0, 420.0, 436.0]), 1)]
+    cases.extend((5 + np.cumsum(rng.normal(0.02, 0.1, length)), 1) for length in (12, 20, 40))
+    for length in (60, 120):
+        months = np.arange(length)
+        cases.append((4 + 0.01 * months + 0.3 * np.sin(2 * np.pi * months / 12) + rng.normal(0, 0.05, length), 12))
+        cases.append((4 + 0.01 * months + rng.normal(0, 0.05, length), 12))
+    return cases
+
+
+class ThetaForecasterTests(unittest.TestCase):
+    def test_matches_the_statsmodels_standard_theta(self) -> None:
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+        for values, season_length in _sample_series():
+            with self.subTest(length=len(values), season_length=season_length):
+                if season_length == 1:
+                    reference = ThetaModel(values, period=1, deseasonalize=False).fit()
+                else:
+                    reference = ThetaModel(values, period=season_length).fit()
+                fit = fit_theta(values, season_length)
+                forecast, _ = predict_theta(fit, 12, 0.95)
+                self.assertEqual(len(fit.seasonal) > 0, reference._seasonal.shape[0] > 0)
+                self.assertAlmostEqual(fit.alpha, float(reference.params.iloc[1]), delta=2e-3)
+                np.testing.assert_allclose(forecast, np.asarray(reference.forecast(12)), atol=1e-3)
+
+    def test_intervals_widen_with_the_horizon_and_level(self) -> None:
+        values, season_length = _sample_series()[4]
+        fit = fit_theta(values, season_length)
+        forecast, narrow = predict_theta(fit, 6, 0.8)
+        _, wide = predict_theta(fit, 6, 0.95)
+        self.assertTrue(np.all(narrow[:, 0] < forecast) and np.all(forecast < narrow[:, 1]))
+        self.assertTrue(np.all(wide[:, 0] < narrow[:, 0]) and np.all(wide[:, 1] > narrow[:, 1]))
+        self.assertTrue(np.all(np.diff(narrow[:, 1] - narrow[:, 0]) > 0))
+
+    def test_single_observation_forecasts_a_flat_line(self) -> None:
+        forecast, interval = predict_theta(fit_theta(np.asarray([3.0]), 1), 3, 0.95)
+        np.testing.assert_array_equal(forecast, np.full(3, 3.0))
+        np.testing.assert_array_equal(interval, np.full((3, 2), 3.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.services.forecast.csv_loader import aggregate_to_annual
+from app.services.forecast.time_series import TimeSeries
+
+
+def _reference_trim(series: pd.Series) -> pd.Series:
+    trimmed = series.copy()
+    while len(trimmed) > 4 and float(trimmed.iloc[-1]) == 0.0 and float(trimmed.iloc[:-1].max()) > 0.0:
+        trimmed = trimmed.iloc[:-1]
+    return trimmed
+
+
+class TimeSeriesTests(unittest.TestCase):
+    def test_trim_trailing_zeros_matches_iterative_rule(self) -> None:
+        generator = random.Random(3)
+        choices = [0.0, 0.0, 0.0, 1.0, 5.0, -2.0, float("nan")]
+        for _ in range(2000):
+            values = [generator.choice(choices) for _ in range(generator.randint(1, 12))]
+            with self.subTest(values=values):
+                expected = _reference_trim(pd.Series(values, index=pd.RangeIndex(2000, 2000 + len(values))))
+                trimmed = TimeSeries(2000, "annual", np.asarray(values)).trim_trailing_zeros()
+                self.assertEqual((trimmed.start, len(trimmed)), (2000, len(expected)))
+
+    def test_pandas_round_trip_and_labels(self) -> None:
+        monthly = pd.Series([1.0, 2.0, 3.0], index=pd.date_range("2020-11-01", periods=3, freq="MS"))
+        series = TimeSeries.from_pandas(monthly.iloc[::-1])
+        self.assertEqual((series.frequency, series.start), ("monthly", 2020 * 12 + 10))
+        self.assertEqual(series.period_labels(), ["2020-11", "2020-12", "2021-01"])
+        self.assertEqual(series.future_labels(2), ["2021-02", "2021-03"])
+        self.assertTrue(series.to_pandas().equals(monthly))
+        self.assertEqual(str(series.to_pandas(period_index=True).index[0]), "2020-11")
+
+        annual = TimeSeries.from_pandas(pd.Series([4.0, 5.0], index=[2021, 2020]))
+        self.assertEqual(annual.period_labels(), [2020, 2021])
+        np.testing.assert_array_equal(annual.values, [5.0, 4.0])
+        self.assertEqual(TimeSeries.from_period("2019-03", "monthly", np.ones(2)).period_labels(), ["2019-03", "2019-04"])
+
+    def test_slices_share_memory_and_shift_start(self) -> None:
+        series = TimeSeries(2010, "annual", np.arange(6, dtype=float))
+        window = series[:-2]
+        self.assertEqual((window.start, len(window)), (2010, 4))
+        self.assertTrue(np.shares_memory(window.values, series.values))
+        self.assertEqual(series[2:].start, 2012)
+
+    def test_to_annual_matches_aggregate_to_annual(self) -> None:
+        values = np.arange(1.0, 31.0)
+        monthly = pd.Series(values, index=pd.date_range("2019-04-01", periods=len(values), freq="MS"))
+        annual = TimeSeries.from_pandas(monthly).to_annual()
+        expected = aggregate_to_annual(monthly)
+        self.assertEqual(annual.period_labels(), expected.index.tolist())
+        np.testing.assert_array_equal(annual.values, expected.to_numpy())
+
+    def test_gaps_and_unknown_frequencies_are_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "gaps"):
+            TimeSeries.from_pandas(pd.Series([1.0, 2.0], index=[2020, 2022]))
+        with self.assertRaises(ValueError):
+            TimeSeries(2020, "weekly", np.ones(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
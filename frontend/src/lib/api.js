@@ -1,6 +1,6 @@
 const API_BASE_URL = (import.meta.env.VITE_API_BASE_URL ?? "").replace(/\/$/, "")
 
-async function request(path, options = {}) {
+function buildRequest(path, options = {}) {
   const { body, headers, params, ...rest } = options
   const url = new URL(`${API_BASE_URL}${path}`, window.location.origin)
 
@@ -28,8 +28,10 @@ async function request(path, options = {}) {
     }
   }
 
-  const response = await fetch(url.toString(), config)
+  return [url.toString(), config]
+}
 
+async function ensureOk(response) {
   if (!response.ok) {
     let detail = "Nao foi possivel concluir a requisicao."
 
@@ -42,10 +44,44 @@ async function request(path, options = {}) {
 
     throw new Error(detail)
   }
+}
 
+async function request(path, options = {}) {
+  const response = await fetch(...buildRequest(path, options))
+  await ensureOk(response)
   return response.json()
 }
 
+// Reads a newline-delimited JSON response, handing each event to onEvent as it arrives and resolving with the last one.
+async function streamRequest(path, options = {}, onEvent) {
+  const response = await fetch(...buildRequest(path, options))
+  await ensureOk(response)
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffered = ""
+  let lastEvent = null
+
+  for (;;) {
+    const { done, value } = await reader.read()
+    buffered += decoder.decode(value, { stream: !done })
+    const lines = buffered.split("\n")
+    buffered = done ? "" : lines.pop()
+
+    for (const line of lines) {
+      if (!line.trim()) continue
+      const event = JSON.parse(line)
+      if (event.event === "error") {
+        throw new Error(event.detail ?? "Nao foi possivel concluir a requisicao.")
+      }
+      onEvent?.(event)
+      lastEvent = event
+    }
+
+    if (done) return lastEvent
+  }
+}
+
 export const api = {
   getSession() {
     return request("/api/session")
@@ -109,4 +145,15 @@ export const api = {
       body: payload,
     })
   },
+  // Streams a recent-trend "baseline" event first (skipped on cache hits) and then the saved "final" forecast.
+  predictStream(payload, onEvent) {
+    return streamRequest(
+      "/api/predict/stream",
+      {
+        method: "POST",
+        body: payload,
+      },
+      onEvent,
+    )
+  },
 }
@@ -202,7 +202,23 @@ function DiseaseDetail() {
   }
 
   async function runPrediction(formValues, datasetId, message) {
-    const response = await api.predict(buildPredictionPayload(formValues, datasetId, disease.slug))
+    // The recent-trend baseline is charted while the requested model is fitted, then replaced by the saved forecast.
+    let showingBaseline = false
+    let response
+    try {
+      response = await api.predictStream(buildPredictionPayload(formValues, datasetId, disease.slug), (event) => {
+        if (event.event !== "baseline") return
+        const { event: _event, ...baseline } = event
+        showingBaseline = true
+        setSelectedForecastId("")
+        setPredictionDetail({ dataset_id: datasetId, result: baseline })
+      })
+      if (response?.event !== "final") throw new Error("A previsao foi interrompida antes do resultado final.")
+    } catch (requestError) {
+      // A baseline left on screen would read as the result of the failed fit, so it is cleared with the error.
+      if (showingBaseline) setPredictionDetail(null)
+      throw requestError
+    }
     const workspace = await refreshWorkspace(disease.slug)
     const detail = await api.getResultDetail(response.forecast_id)
     const datasetInfo = workspace.datasetItems.find((item) => item.dataset_id === detail.dataset_id) ?? null